@@ -32,11 +32,26 @@ Python 3.11 표준 라이브러리만 사용합니다.
 import os
 import sys
 import re
+import atexit
+import cProfile
+import functools
+import hashlib
+import mmap
+import struct
+import time
+import tracemalloc
 from pathlib import Path
 from datetime import date, datetime
 from typing import Dict, Tuple, List
 from collections import defaultdict
-import ast
+from bisect import bisect_left, insort
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
 
 
 # ---------------------------------------------------------------
@@ -46,6 +61,11 @@ MOVIE_FILE = "movie-info.txt"
 STUDENT_FILE = "student-info.txt"
 BOOKING_FILE = "booking-info.txt"
 SCHEDULE_FILE = "schedule-info.txt"
+JOURNAL_FILE = "transaction-log.txt"  # 저널 저장 모드의 트랜잭션 로그
+SNAPSHOT_FILE = "kucinema-snapshot.bin"  # 스냅샷 모드의 이진 스냅샷
+ARCHIVE_DIR = "archive"                  # 데이터 정리로 옮긴 레코드의 월별 보관 파일 디렉터리
+META_FILE = "kucinema-meta.txt"          # 최종 작업 날짜와 그때의 데이터 파일 서명
+LOCK_FILE = "kucinema.lock"              # 공유 모드에서 데이터 파일 쓰기를 직렬화하는 잠금 파일
 
 # 정규식 패턴 (문법 형식)
 RE_DATE = re.compile(r"^\d{4}-\d{2}-\d{2}$")          # YYYY-MM-DD
@@ -85,6 +105,24 @@ RE_SCREENING_NUMBER = re.compile(r"^[1-9][0-9]{3}(0[1-9]|1[0-2])(0[1-9]|[12][0-9
 RE_MOVIE_START_TIME = re.compile(r"^([01][0-9]|2[0-3]):[0-5][0-9]$")
 # 좌석 유무,예약 벡터 (0과 1로 이루어진 길이 25의 벡터)
 RE_SEAT_VECTOR_FULL = re.compile(r"^\[[01](,[01]){24}\]$")
+# 좌석 이름 (예: A1, 행 A~E, 열 1~5)
+RE_SEAT_NAME = re.compile(r"^[A-E][1-5]$")
+
+
+def env_int(name: str, default: int) -> int:
+    """
+    정수 환경 변수를 읽는다. 값이 정수가 아니면 경고를 출력하고 기본값을 쓴다.
+    (모듈을 불러올 때 읽으므로 warn 대신 직접 출력, 스크립트/서버 출력과 섞이지 않도록 표준 오류로)
+    """
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        print(f"..! 경고: 환경 변수 {name}의 값({value!r})이 정수가 아닙니다. 기본값 {default}을(를) 사용합니다.",
+              file=sys.stderr)
+        return default
 
 
 # 전역 상태 (필수 컨텍스트)
@@ -92,6 +130,63 @@ CURRENT_DATE_STR: str | None = None  # 내부 현재 날짜(문자열, YYYY-MM-D
 LATEST_DATE_STR : str | None = None  # 최종 작업 날짜
 LOGGED_IN_SID: str | None = None     # 로그인된 학번(2자리)
 
+# 무결성 검사 모드 (환경 변수 KUCINEMA_VERIFY_MODE)
+#   "incremental" : 데이터 변경 후에는 변경된 레코드와 관련된 규칙만 검사 (기본값)
+#   "full"        : 매번 네 데이터 파일 전체를 검사
+VERIFY_MODE = os.environ.get("KUCINEMA_VERIFY_MODE", "incremental")
+# 증분 검사를 이 횟수만큼 수행할 때마다 한 번은 전체 검사 (0 이하이면 주기적 전체 검사 안 함)
+FULL_VERIFY_INTERVAL = env_int("KUCINEMA_FULL_VERIFY_INTERVAL", 20)
+INCREMENTAL_VERIFY_COUNT = 0         # 마지막 전체 검사 이후 수행한 증분 검사 횟수
+# 마지막 무결성 검사 이후 변경된 레코드 (record_change 참고)
+PENDING_CHANGES: Dict[str, set] = {"movie": set(), "schedule": set(), "student": set(), "booking": set()}
+# 데이터 저장소 (main에서 무결성 검사 후 load_store로 적재)
+STORE: DataStore | None = None
+
+# 저장 모드 (환경 변수 KUCINEMA_STORAGE_MODE)
+#   "direct"  : 변경할 때마다 데이터 파일에 바로 반영 (기본값)
+#   "journal" : 예매/취소는 트랜잭션 로그(JOURNAL_FILE)에만 추가하고,
+#               COMPACT_INTERVAL건마다(그리고 종료 시) 데이터 파일에 한꺼번에 반영
+STORAGE_MODE = os.environ.get("KUCINEMA_STORAGE_MODE", "direct")
+COMPACT_INTERVAL = env_int("KUCINEMA_COMPACT_INTERVAL", 50)
+
+# 스냅샷 모드 (환경 변수 KUCINEMA_SNAPSHOT)
+#   "off" : 매 실행마다 네 데이터 파일 전체를 검사하고 파싱 (기본값)
+#   "on"  : 검사를 통과한 데이터를 이진 스냅샷(SNAPSHOT_FILE)으로 저장해 두고, 다음 실행 때
+#           데이터 파일이 그대로이면 전체 검사와 파싱 없이 스냅샷을 적재
+SNAPSHOT_MODE = os.environ.get("KUCINEMA_SNAPSHOT", "off")
+# 마지막 무결성 검사를 통과한 뒤 검사하지 않은 변경이 없는지 (종료 시 스냅샷 저장 조건)
+VERIFIED_CLEAN = False
+
+# 공유 모드 (환경 변수 KUCINEMA_SHARED)
+#   "off" : 한 데이터 디렉터리를 이 프로세스 하나만 사용 (기본값)
+#   "on"  : 여러 단말기(프로세스)가 같은 데이터 디렉터리를 함께 사용.
+#           데이터를 고칠 때만 잠금 파일(LOCK_FILE)에 배타적 권고 잠금을 걸고, 다른 프로세스가
+#           그 사이 파일을 바꿨으면 다시 적재한 뒤 좌석 등을 다시 확인하고 쓴다. (저널 저장 모드는 사용하지 않음)
+SHARED_MODE = os.environ.get("KUCINEMA_SHARED", "off")
+
+# 계측 모드 (환경 변수 KUCINEMA_INSTRUMENT)
+#   "off" : 계측하지 않음 (기본값)
+#   "on"  : 메뉴 디스패치, 무결성 검사, 파일 도우미 함수를 감싸 동작별 호출 수, 지연 시간 분위수,
+#           연 파일, 읽고 쓴 바이트 수, 파싱한 레코드 수를 모으고 종료할 때 INSTRUMENT_REPORT에 보고서를 쓴다.
+INSTRUMENT_MODE = os.environ.get("KUCINEMA_INSTRUMENT", "off")
+INSTRUMENT_REPORT = os.environ.get("KUCINEMA_INSTRUMENT_REPORT", "kucinema-instrument.txt")
+
+# 프로파일링 모드 (환경 변수 KUCINEMA_PROFILE)
+#   "off" : 프로파일링하지 않음 (기본값)
+#   "on"  : 메뉴를 실행할 때마다(dispatch_menu/dispatch_admin_menu) cProfile로 기록해
+#           PROFILE_DIR에 한 번에 한 파일(<프로세스 번호>-<순번>-<메뉴>.prof)로 저장한다.
+#           pstats, snakeviz 등 표준 도구로 열 수 있다.
+PROFILE_MODE = os.environ.get("KUCINEMA_PROFILE", "off")
+PROFILE_DIR = os.environ.get("KUCINEMA_PROFILE_DIR", "profiles")
+
+# 메모리 프로파일링 모드 (환경 변수 KUCINEMA_MEMORY_PROFILE)
+#   "off" : 측정하지 않음 (기본값)
+#   "on"  : tracemalloc으로 단계(파일 검사, 각 파일 검사/파싱, 각 check_* 규칙, 무결성 검사, 적재, 메뉴)마다
+#           최대 추가 할당량(peak)과 단계가 끝난 뒤 남은 할당량(retained)을 재고,
+#           종료할 때 MEMORY_REPORT에 보고서를 쓴다. (tracemalloc 때문에 실행이 몇 배 느려진다)
+MEMORY_PROFILE_MODE = os.environ.get("KUCINEMA_MEMORY_PROFILE", "off")
+MEMORY_REPORT = os.environ.get("KUCINEMA_MEMORY_REPORT", "kucinema-memory.txt")
+
  
 class Movie:
     movie_id: str
@@ -104,8 +199,10 @@ class Schedule:
     movie_id: str
     movie_date: str
     movie_start_time: str
-    seats_vector: List[int]
+    seats_vector: int  # 좌석 유무 비트마스크 (비트 i = i번째 좌석, A1이 비트 0)
     time_stamp: str
+    start_minutes: int  # 시작 시각 (0시부터의 분, movie_start_time에서 계산)
+    end_minutes: int    # 종료 시각 (start_minutes + 러닝 타임, set_schedule_end_times에서 계산)
 
 class Student:
     student_id: str #학번
@@ -115,8 +212,90 @@ class Student:
 class Booking:
     student_id: str #학번
     schedule_id: str #상영 고유 번호
-    seats: List[int] #좌석 예약 벡터
+    seats: int #좌석 예약 비트마스크 (비트 i = i번째 좌석)
     timestamp: str #타임 스탬프
+# ---------------------------------------------------------------
+# 좌석 비트마스크
+#   데이터 파일의 좌석 벡터 [b0,b1,...,b24]를 정수 하나(비트 i = bi)로 다룬다.
+#   A1~A5가 비트 0~4, B1~B5가 비트 5~9, ... E5가 비트 24
+#
+#   좌석 벡터 문자열은 RE_SEAT_VECTOR_FULL 형식("[0,1,...]", 공백 없음, 길이 51)만
+#   허용하므로 숫자는 항상 홀수 위치(1, 3, ..., 49)에 있다. 이를 이용해
+#   ast.literal_eval 없이 문자열 슬라이스와 int(..., 2) 한 번으로 변환한다.
+# ---------------------------------------------------------------
+SEAT_COUNT = 25
+MAX_PEOPLE = 4  # 한 번에 예매할 수 있는 최대 인원 (6.4.3)
+SEAT_VECTOR_LEN = 2 * SEAT_COUNT + 1  # "[" + "0,"*24 + "0" + "]"
+
+def seats_from_list(vector: List[int]) -> int:
+    """길이 25의 0/1 리스트를 좌석 비트마스크로 변환한다."""
+    mask = 0
+    for i, v in enumerate(vector):
+        if v:
+            mask |= 1 << i
+    return mask
+
+
+def seats_to_list(mask: int) -> List[int]:
+    """좌석 비트마스크를 길이 25의 0/1 리스트로 변환한다."""
+    return [(mask >> i) & 1 for i in range(SEAT_COUNT)]
+
+
+def seats_from_str(vector_str: str) -> int:
+    """
+    데이터 파일 형식의 좌석 벡터 문자열("[0,1,...]")을 좌석 비트마스크로 변환한다.
+
+    매개변수:
+        vector_str: RE_SEAT_VECTOR_FULL 형식의 좌석 벡터 문자열
+    반환값:
+        int: 좌석 비트마스크
+    예외:
+        ValueError: 형식이 맞지 않는 경우
+    """
+    if len(vector_str) != SEAT_VECTOR_LEN or not RE_SEAT_VECTOR_FULL.match(vector_str):
+        raise ValueError(f"잘못된 좌석 벡터: {vector_str!r}")
+    # 49, 47, ..., 1 위치의 숫자 = b24 ... b0 (최상위 비트부터)
+    return int(vector_str[SEAT_VECTOR_LEN - 2:0:-2], 2)
+
+
+def seats_to_str(mask: int) -> str:
+    """좌석 비트마스크를 데이터 파일 형식 문자열("[0,1,...]")로 변환한다."""
+    # format(..., "025b")는 b24 ... b0 순서이므로 뒤집어서 b0부터 쓴다.
+    return "[" + ",".join(format(mask, "025b")[::-1]) + "]"
+
+
+# ---------------------------------------------------------------
+# 상영 시각 (분 단위)
+#   상영의 시작/종료 시각은 적재할 때 한 번만 분 단위 정수로 계산해 두고
+#   (Schedule.start_minutes / end_minutes) 시간표 출력과 시간 규칙 검사가 함께 쓴다.
+# ---------------------------------------------------------------
+def time_to_minutes(hhmm: str) -> int:
+    """"HH:MM"을 0시부터의 분으로 변환한다."""
+    return int(hhmm[0:2]) * 60 + int(hhmm[3:5])
+
+
+def minutes_to_time(minutes: int) -> str:
+    """0시부터의 분을 "HH:MM"으로 변환한다. (24시를 넘으면 다음 날 시각으로 표시)"""
+    return f"{(minutes // 60) % 24:02d}:{minutes % 60:02d}"
+
+
+def schedule_time_range(schedule: Schedule) -> str:
+    """상영 시간표에 출력할 "시작-종료" 문자열 (예: "10:00-12:10")"""
+    return f"{schedule.movie_start_time}-{minutes_to_time(schedule.end_minutes)}"
+
+
+def set_schedule_end_times(schedules, running_times: Dict[str, int]) -> None:
+    """
+    각 상영의 종료 시각(end_minutes)을 영화 러닝 타임으로 계산해 둔다.
+
+    매개변수:
+        schedules: 상영 객체들
+        running_times: 영화 고유 번호 → 러닝 타임(분) (없는 영화는 러닝 타임 0)
+    """
+    for schedule in schedules:
+        schedule.end_minutes = schedule.start_minutes + running_times.get(schedule.movie_id, 0)
+
+
 # ---------------------------------------------------------------
 # 유틸리티 출력
 # ---------------------------------------------------------------
@@ -182,9 +361,10 @@ def check_file(data_path: Path) -> None:
             sys.exit(1)
 
     # 3. 입출력(읽기/쓰기) 권한 확인
-    # 3-1. 읽기 권한 확인
+    # 3-1. 읽기 권한 확인 (내용은 무결성 검사에서 한 번만 읽는다. read_data_text 참고)
     try:
-        _ = target_path.read_text(encoding="utf-8")
+        with target_path.open("rb"):
+            pass
     except Exception:
         error(f"{file_name} 데이터 파일\n{target_path} 에 대한 입출력 권한이 없습니다! 프로그램을 종료합니다.")
         sys.exit(1)
@@ -197,283 +377,220 @@ def check_file(data_path: Path) -> None:
         error(f"{file_name} 데이터 파일\n{target_path} 에 대한 입출력 권한이 없습니다! 프로그램을 종료합니다.")
         sys.exit(1)
 
-############################################################
-##################### 영화 데이터 파일 #########################
-############################################################
-
-def validate_movie_syntax(movie_path: Path) -> Tuple[bool, List[str]]:
+def read_data_text(data_path: Path, file_label: str) -> str:
     """
-    영화 데이터 파일의 형식을 검증한다.
+    데이터 파일 전체를 UTF-8 문자열로 읽는다.
+    UTF-8로 읽을 수 없으면 check_file과 같은 메시지를 출력하고 프로그램을 종료한다.
 
     매개변수:
-        movie_path: Path - 영화 데이터 파일 경로
-
-    반환값:
-        (is_ok, error_lines)
-        - is_ok: 형식 오류가 하나도 없으면 True, 하나 이상 있으면 False
-        - error_lines: 형식 오류가 발생한 '원본 문자열' 리스트
+        data_path: Path  - 데이터 파일 경로
+        file_label: str  - 데이터 파일 종류 ("영화", "상영", "학생", "예매")
     """
+    try:
+        return data_path.read_text(encoding="utf-8")
+    except UnicodeDecodeError:
+        target_path = Path(os.getcwd()) / data_path.name
+        error(f"{file_label} 데이터 파일\n{target_path} 에 대한 입출력 권한이 없습니다! 프로그램을 종료합니다.")
+        sys.exit(1)
 
-    error_lines: List[str] = []
-
-    lines = movie_path.read_text(encoding="utf-8").splitlines()
-    
-    for line in lines:
-        original = line
-
-        # 1. 구분자('/') 개수 확인 (정확히 4개 → 5필드)
-        if original.count("/") != 4:
-            error_lines.append(original)
-            continue
-
-        # 2. 앞뒤 공백 금지 (전체 레코드 기준)
-        if original != original.strip():
-            error_lines.append(original)
-            continue
-
-        # 3. 필드 분리
-        movie_id_str, movie_name_str, running_time_str, valid_flag_str, timestamp_str = original.split("/")
-
-        # 각 필드별로도 앞뒤 공백이 없어야 함
-        if any(f != f.strip() for f in [movie_id_str, movie_name_str, running_time_str, valid_flag_str, timestamp_str]):
-            error_lines.append(original)
-            continue
-
-        # 4. 정규표현식에 따른 문법 형식 확인
-        if not RE_MOVIE_NUMBER.fullmatch(movie_id_str):
-            error_lines.append(original)
-            continue
-
-        if not RE_MOVIE_TITLE.fullmatch(movie_name_str):
-            error_lines.append(original)
-            continue
-
-        if not RE_RUNNING_TIME.fullmatch(running_time_str):
-            error_lines.append(original)
-            continue
-
-        if not RE_DATE.fullmatch(timestamp_str):
-            error_lines.append(original)
-            continue
-
-        if not RE_VALID_RECORD.fullmatch(valid_flag_str):
-            error_lines.append(original)
-            continue
-
-        # 5. 의미 규칙 확인
-        # 5-1. 러닝 타임: 1~240 사이의 정수
-        try:
-            running_time_val = int(running_time_str)
-        except ValueError:
-            error_lines.append(original)
-            continue
-
-        if not (1 <= running_time_val <= 240):
-            error_lines.append(original)
-            continue
-
-        # 5-2. 타임 스탬프(날짜) 의미 검증
-        yyyy = int(timestamp_str[0:4])
-        mm = int(timestamp_str[5:7])
-        dd = int(timestamp_str[8:10])
-
-        # 그레고리력 시행(1582-10-15) 이후만 허용 → 정확하게 1582-10-15부터 허용
-        if (yyyy < 1582) or (yyyy == 1582 and (mm < 10 or (mm == 10 and dd < 15))):
-            error_lines.append(original)
-            continue
-
-        try:
-            date(yyyy, mm, dd)
-        except ValueError:
-            # 존재하지 않는 날짜
-            error_lines.append(original)
-            continue
-
-    is_ok = len(error_lines) == 0
-    return is_ok, error_lines
 
+############################################################
+##################### 영화 데이터 파일 #########################
+############################################################
 
-def parse_movie_data(movie_path: Path) -> List[Movie]:
+def is_valid_movie_line(original: str) -> bool:
     """
-    (형식 검증이 완료된) 영화 데이터 파일을 읽어 Movie 객체 리스트로 변환한다.
+    영화 데이터 파일의 레코드 한 줄이 형식/의미 규칙을 만족하는지 검사한다.
 
     매개변수:
-        movie_path: Path - 영화 데이터 파일 경로
+        original: str - 영화 데이터 파일의 레코드 한 줄 (개행 제외)
 
     반환값:
-        List[Movie] - 레코드 유효 여부가 'T'인 영화 객체 리스트
+        True  - 올바른 레코드
+        False - 형식 오류가 있는 레코드
     """
+    # 1. 구분자('/') 개수 확인 (정확히 4개 → 5필드)
+    if original.count("/") != 4:
+        return False
 
-    movies: List[Movie] = []
-    lines = movie_path.read_text(encoding="utf-8").splitlines()
-
-    for line in lines:
-        if line.strip() == "":
-            # 형식 검증을 통과했다면 등장하지 않겠지만, 방어적으로 무시
-            continue
-
-        parts = line.split("/")
-        if len(parts) != 5:
-            # 형식 검증이 끝난 상태라면 등장하지 않지만, 방어적으로 무시
-            continue
+    # 2. 앞뒤 공백 금지 (전체 레코드 기준)
+    if original != original.strip():
+        return False
 
-        movie_id_str, movie_name_str, running_time_str, valid_flag_str, timestamp_str = parts
+    # 3. 필드 분리
+    movie_id_str, movie_name_str, running_time_str, valid_flag_str, timestamp_str = original.split("/")
 
-        # 레코드 유효 여부가 'T'인 레코드만 사용
-        if valid_flag_str != "T":
-            continue
+    # 각 필드별로도 앞뒤 공백이 없어야 함
+    if any(f != f.strip() for f in [movie_id_str, movie_name_str, running_time_str, valid_flag_str, timestamp_str]):
+        return False
 
-        m = Movie()
-        m.movie_id = movie_id_str
-        m.movie_name = movie_name_str
-        m.running_time = int(running_time_str)
-        m.time_stamp = timestamp_str
-        movies.append(m)
+    # 4. 정규표현식에 따른 문법 형식 확인
+    if not RE_MOVIE_NUMBER.fullmatch(movie_id_str):
+        return False
 
-    return movies
+    if not RE_MOVIE_TITLE.fullmatch(movie_name_str):
+        return False
 
+    if not RE_RUNNING_TIME.fullmatch(running_time_str):
+        return False
 
-def validate_movie_id_duplication(movie_path: Path) -> Tuple[bool, List[str]]:
-    """
-    영화 데이터 파일 내에서 중복된 영화 고유 번호가 존재하는지 검사한다.
+    if not RE_DATE.fullmatch(timestamp_str):
+        return False
 
-    매개변수:
-        movie_path: Path - 영화 데이터 파일 경로
+    if not RE_VALID_RECORD.fullmatch(valid_flag_str):
+        return False
 
-    반환값:
-        (is_ok, error_lines)
-        - is_ok: 규칙 검증 오류(중복 ID)가 하나도 없으면 True, 하나 이상 있으면 False
-        - error_lines: 중복된 영화 고유 번호를 가진 '원본 문자열' 리스트
-    """
+    # 5. 의미 규칙 확인
+    # 5-1. 러닝 타임: 1~240 사이의 정수
+    try:
+        running_time_val = int(running_time_str)
+    except ValueError:
+        return False
 
-    lines = movie_path.read_text(encoding="utf-8").splitlines()
+    if not (1 <= running_time_val <= 240):
+        return False
 
-    # 레코드 유효 여부가 'T'인 레코드만 대상으로 고유번호 등장 횟수 카운트
-    id_counts: Dict[str, int] = {}
-    records: List[Tuple[str, str]] = []  # (movie_id, original_line)
+    # 5-2. 타임 스탬프(날짜) 의미 검증
+    yyyy = int(timestamp_str[0:4])
+    mm = int(timestamp_str[5:7])
+    dd = int(timestamp_str[8:10])
 
-    for line in lines:
-        if line.strip() == "":
-            continue
+    # 그레고리력 시행(1582-10-15) 이후만 허용 → 정확하게 1582-10-15부터 허용
+    if (yyyy < 1582) or (yyyy == 1582 and (mm < 10 or (mm == 10 and dd < 15))):
+        return False
 
-        parts = line.split("/")
-        if len(parts) != 5:
-            # 형식 검증을 통과했다면 등장하지 않겠지만, 방어적으로 무시
-            continue
+    try:
+        date(yyyy, mm, dd)
+    except ValueError:
+        # 존재하지 않는 날짜
+        return False
 
-        movie_id_str, _, _, valid_flag_str, _ = parts
+    return True
 
-        if valid_flag_str != "T":
-            # 유효 여부가 'T'가 아닌 레코드는 규칙 검증 대상에서 제외
-            continue
 
-        records.append((movie_id_str, line))
-        id_counts[movie_id_str] = id_counts.get(movie_id_str, 0) + 1
+def movie_from_line(line: str) -> Movie | None:
+    """
+    (형식 검증이 완료된) 영화 레코드 한 줄을 Movie 객체로 변환한다.
 
-    # 등장 횟수가 2 이상인 ID들을 찾는다.
-    duplicated_ids = {mid for mid, cnt in id_counts.items() if cnt >= 2}
+    반환값:
+        Movie - 레코드 유효 여부가 'T'인 경우
+        None  - 유효 여부가 'T'가 아니거나 형식이 맞지 않는 경우
+    """
+    if line.strip() == "":
+        # 형식 검증을 통과했다면 등장하지 않겠지만, 방어적으로 무시
+        return None
 
-    if not duplicated_ids:
-        return True, []
+    parts = line.split("/")
+    if len(parts) != 5:
+        # 형식 검증이 끝난 상태라면 등장하지 않지만, 방어적으로 무시
+        return None
 
-    # 중복 ID를 가진 레코드(원본 문자열)만 오류 리스트에 담는다.
-    error_lines: List[str] = [
-        original for mid, original in records if mid in duplicated_ids
-    ]
+    movie_id_str, movie_name_str, running_time_str, valid_flag_str, timestamp_str = parts
 
-    return False, error_lines
+    # 레코드 유효 여부가 'T'인 레코드만 사용
+    if valid_flag_str != "T":
+        return None
 
+    m = Movie()
+    m.movie_id = movie_id_str
+    m.movie_name = movie_name_str
+    m.running_time = int(running_time_str)
+    m.time_stamp = timestamp_str
+    return m
 
 
-def validate_movie_name_duplication(movie_path: Path) -> Tuple[bool, List[str]]:
+def scan_movie_file(movie_path: Path) -> Tuple[str, List[Movie]]:
     """
-    영화 데이터 파일 내에서 중복된 영화 제목이 존재하는지 검사한다.
+    영화 데이터 파일을 한 번만 읽어 형식 검사, 영화 고유 번호/제목 중복 검사, Movie 객체 생성을 함께 수행한다.
+    오류가 있으면 형식 → 고유 번호 중복 → 제목 중복 순서로 확인하여
+    해당 레코드('원본 문자열')를 출력하고 프로그램을 종료한다.
 
     매개변수:
         movie_path: Path - 영화 데이터 파일 경로
 
     반환값:
-        (is_ok, error_lines)
-        - is_ok: 규칙 검증 오류(중복 제목)가 하나도 없으면 True, 하나 이상 있으면 False
-        - error_lines: 중복된 영화 제목을 가진 '원본 문자열' 리스트
+        (text, movies)
+        - text: 파일 내용 (저장소 적재에 재사용)
+        - movies: 레코드 유효 여부가 'T'인 영화 객체 리스트
     """
-    lines = movie_path.read_text(encoding="utf-8").splitlines()
+    text = read_data_text(movie_path, "영화")
 
-    # 레코드 유효 여부가 'T'인 레코드만 대상으로 제목 등장 횟수 카운트
-    name_counts: Dict[str, int] = {}
-    records: List[Tuple[str, str]] = []  # (movie_name, original_line)
-
-    for line in lines:
-        if line.strip() == "":
-            continue
+    error_lines: List[str] = []
+    records: List[Tuple[Movie, str]] = []  # (유효(T) 영화, original_line)
+    id_counts: Dict[str, int] = defaultdict(int)
+    name_counts: Dict[str, int] = defaultdict(int)
 
-        parts = line.split("/")
-        if len(parts) != 5:
-            # 형식 검증을 통과했다면 등장하지 않겠지만, 방어적으로 무시
+    for line in text.splitlines():
+        if not is_valid_movie_line(line):
+            error_lines.append(line)
             continue
 
-        _, movie_name_str, _, valid_flag_str, _ = parts
-
-        if valid_flag_str != "T":
+        m = movie_from_line(line)
+        if m is None:
             # 유효 여부가 'T'가 아닌 레코드는 규칙 검증 대상에서 제외
             continue
 
-        records.append((movie_name_str, line))
-        name_counts[movie_name_str] = name_counts.get(movie_name_str, 0) + 1
+        records.append((m, line))
+        id_counts[m.movie_id] += 1
+        name_counts[m.movie_name] += 1
 
-    # 등장 횟수가 2 이상인 제목들을 찾는다.
-    duplicated_names = {name for name, cnt in name_counts.items() if cnt >= 2}
+    if error_lines:
+        exit_with_error_lines("영화", MOVIE_FILE, error_lines)
 
-    if not duplicated_names:
-        return True, []
+    # 중복 ID를 가진 레코드(원본 문자열)
+    error_lines = [original for m, original in records if id_counts[m.movie_id] >= 2]
+    if error_lines:
+        exit_with_error_lines("영화", MOVIE_FILE, error_lines)
 
-    # 중복 제목을 가진 레코드(원본 문자열)만 오류 리스트에 담는다.
-    error_lines: List[str] = [
-        original for name, original in records if name in duplicated_names
-    ]
+    # 중복 제목을 가진 레코드(원본 문자열)
+    error_lines = [original for m, original in records if name_counts[m.movie_name] >= 2]
+    if error_lines:
+        exit_with_error_lines("영화", MOVIE_FILE, error_lines)
 
-    return False, error_lines
+    return text, [m for m, _ in records]
 
 ############################################################
 ##################### 상영 데이터 파일 #########################
 ############################################################
 
-def validate_schedule_syntax(schedule_path: Path) -> Tuple[bool, List[str]]:
+def is_valid_schedule_line(original: str) -> bool:
     """
-    상영 데이터 파일의 형식을 검증한다.
+    상영 데이터 파일의 레코드 한 줄이 형식/의미 규칙을 만족하는지 검사한다.
 
     매개변수:
-        schedule_path: Path - 상영 데이터 파일 경로
+        original: str - 상영 데이터 파일의 레코드 한 줄 (개행 제외)
 
     반환값:
-        (is_ok, error_lines)
-        - is_ok: 형식 오류가 하나도 없으면 True, 하나 이상 있으면 False
-        - error_lines: 형식 오류가 발생한 '원본 문자열' 리스트
+        True  - 올바른 레코드
+        False - 형식 오류가 있는 레코드
     """
+    # 1. 구분자('/') 개수 확인 (정확히 6개 → 7필드)
+    if original.count("/") != 6:
+        return False
 
-    error_lines: List[str] = []
-    lines = schedule_path.read_text(encoding="utf-8").splitlines()
-
-    for line in lines:
-        original = line
-
-        # 1. 구분자('/') 개수 확인 (정확히 6개 → 7필드)
-        if original.count("/") != 6:
-            error_lines.append(original)
-            continue
-
-        # 2. 앞뒤 공백 금지 (전체 레코드 기준)
-        if original != original.strip():
-            error_lines.append(original)
-            continue
+    # 2. 앞뒤 공백 금지 (전체 레코드 기준)
+    if original != original.strip():
+        return False
 
-        # 3. 필드 분리
-        parts = original.split("/")
-        if len(parts) != 7:
-            error_lines.append(original)
-            continue
+    # 3. 필드 분리
+    parts = original.split("/")
+    if len(parts) != 7:
+        return False
 
-        (
+    (
+        screening_id_str,
+        movie_id_str,
+        movie_date_str,
+        movie_start_time_str,
+        seats_vec_str,
+        valid_flag_str,
+        timestamp_str,
+    ) = parts
+
+    # 각 필드별로도 앞뒤 공백이 없어야 함
+    if any(
+        f != f.strip()
+        for f in [
             screening_id_str,
             movie_id_str,
             movie_date_str,
@@ -481,241 +598,193 @@ def validate_schedule_syntax(schedule_path: Path) -> Tuple[bool, List[str]]:
             seats_vec_str,
             valid_flag_str,
             timestamp_str,
-        ) = parts
-
-        # 각 필드별로도 앞뒤 공백이 없어야 함
-        if any(
-            f != f.strip()
-            for f in [
-                screening_id_str,
-                movie_id_str,
-                movie_date_str,
-                movie_start_time_str,
-                seats_vec_str,
-                valid_flag_str,
-                timestamp_str,
-            ]
-        ):
-            error_lines.append(original)
-            continue
+        ]
+    ):
+        return False
 
-        # 4. 정규표현식에 따른 문법 형식 확인
-        if not RE_SCREENING_NUMBER.fullmatch(screening_id_str):
-            error_lines.append(original)
-            continue
+    # 4. 정규표현식에 따른 문법 형식 확인
+    if not RE_SCREENING_NUMBER.fullmatch(screening_id_str):
+        return False
 
-        if not RE_MOVIE_NUMBER.fullmatch(movie_id_str):
-            error_lines.append(original)
-            continue
+    if not RE_MOVIE_NUMBER.fullmatch(movie_id_str):
+        return False
 
-        if not RE_DATE.fullmatch(movie_date_str):
-            error_lines.append(original)
-            continue
+    if not RE_DATE.fullmatch(movie_date_str):
+        return False
 
-        if not RE_MOVIE_START_TIME.fullmatch(movie_start_time_str):
-            error_lines.append(original)
-            continue
+    if not RE_MOVIE_START_TIME.fullmatch(movie_start_time_str):
+        return False
 
-        if not RE_SEAT_VECTOR_FULL.fullmatch(seats_vec_str):
-            error_lines.append(original)
-            continue
+    if not RE_SEAT_VECTOR_FULL.fullmatch(seats_vec_str):
+        return False
 
-        if not RE_VALID_RECORD.fullmatch(valid_flag_str):
-            error_lines.append(original)
-            continue
+    if not RE_VALID_RECORD.fullmatch(valid_flag_str):
+        return False
 
-        if not RE_DATE.fullmatch(timestamp_str):
-            error_lines.append(original)
-            continue
+    if not RE_DATE.fullmatch(timestamp_str):
+        return False
 
-        # 5. 의미 규칙 확인
-        # 5-1. 상영 고유 번호 YYYYMMDDHHmm 의미 검증
-        try:
-            year = int(screening_id_str[0:4])
-            month = int(screening_id_str[4:6])
-            day = int(screening_id_str[6:8])
-            hour = int(screening_id_str[8:10])
-            minute = int(screening_id_str[10:12])
-        except ValueError:
-            error_lines.append(original)
-            continue
+    # 5. 의미 규칙 확인
+    # 5-1. 상영 고유 번호 YYYYMMDDHHmm 의미 검증
+    try:
+        year = int(screening_id_str[0:4])
+        month = int(screening_id_str[4:6])
+        day = int(screening_id_str[6:8])
+        hour = int(screening_id_str[8:10])
+        minute = int(screening_id_str[10:12])
+    except ValueError:
+        return False
 
-        # 그레고리력 시행(1582-10-15) 이후만 허용
-        if (year < 1582) or (year == 1582 and (month < 10 or (month == 10 and day < 15))):
-            error_lines.append(original)
-            continue
+    # 그레고리력 시행(1582-10-15) 이후만 허용
+    if (year < 1582) or (year == 1582 and (month < 10 or (month == 10 and day < 15))):
+        return False
 
-        # 존재하는 날짜·시간인지 확인 (날짜 + 시각)
-        try:
-            datetime(year, month, day, hour, minute)
-        except ValueError:
-            error_lines.append(original)
-            continue
+    # 존재하는 날짜·시간인지 확인 (날짜 + 시각)
+    try:
+        datetime(year, month, day, hour, minute)
+    except ValueError:
+        return False
 
-        # 5-2. 영화 상영 날짜 의미 검증 + 상영 고유 번호와의 일관성
-        yyyy = int(movie_date_str[0:4])
-        mm = int(movie_date_str[5:7])
-        dd = int(movie_date_str[8:10])
+    # 5-2. 영화 상영 날짜 의미 검증 + 상영 고유 번호와의 일관성
+    yyyy = int(movie_date_str[0:4])
+    mm = int(movie_date_str[5:7])
+    dd = int(movie_date_str[8:10])
 
-        if (yyyy < 1582) or (yyyy == 1582 and (mm < 10 or (mm == 10 and dd < 15))):
-            error_lines.append(original)
-            continue
+    if (yyyy < 1582) or (yyyy == 1582 and (mm < 10 or (mm == 10 and dd < 15))):
+        return False
 
-        try:
-            date(yyyy, mm, dd)
-        except ValueError:
-            error_lines.append(original)
-            continue
+    try:
+        date(yyyy, mm, dd)
+    except ValueError:
+        return False
 
-        # 상영 고유 번호의 연·월·일과 동일해야 함
-        if not (yyyy == year and mm == month and dd == day):
-            error_lines.append(original)
-            continue
+    # 상영 고유 번호의 연·월·일과 동일해야 함
+    if not (yyyy == year and mm == month and dd == day):
+        return False
 
-        # 5-3. 영화 시작 시간 의미 검증 + 상영 고유 번호와의 일관성
-        try:
-            sh = int(movie_start_time_str[0:2])
-            sm = int(movie_start_time_str[3:5])
-        except ValueError:
-            error_lines.append(original)
-            continue
+    # 5-3. 영화 시작 시간 의미 검증 + 상영 고유 번호와의 일관성
+    try:
+        sh = int(movie_start_time_str[0:2])
+        sm = int(movie_start_time_str[3:5])
+    except ValueError:
+        return False
 
-        if not (0 <= sh <= 23 and 0 <= sm <= 59):
-            error_lines.append(original)
-            continue
+    if not (0 <= sh <= 23 and 0 <= sm <= 59):
+        return False
 
-        # 상영 고유 번호의 시각과 동일해야 함
-        if not (sh == hour and sm == minute):
-            error_lines.append(original)
-            continue
+    # 상영 고유 번호의 시각과 동일해야 함
+    if not (sh == hour and sm == minute):
+        return False
 
-        # 5-4. 타임 스탬프 의미 검증
-        ty = int(timestamp_str[0:4])
-        tm = int(timestamp_str[5:7])
-        td = int(timestamp_str[8:10])
+    # 5-4. 타임 스탬프 의미 검증
+    ty = int(timestamp_str[0:4])
+    tm = int(timestamp_str[5:7])
+    td = int(timestamp_str[8:10])
 
-        if (ty < 1582) or (ty == 1582 and (tm < 10 or (tm == 10 and td < 15))):
-            error_lines.append(original)
-            continue
+    if (ty < 1582) or (ty == 1582 and (tm < 10 or (tm == 10 and td < 15))):
+        return False
 
-        try:
-            date(ty, tm, td)
-        except ValueError:
-            error_lines.append(original)
-            continue
+    try:
+        date(ty, tm, td)
+    except ValueError:
+        return False
 
-    is_ok = len(error_lines) == 0
-    return is_ok, error_lines
+    return True
 
 
-def parse_schedule_data(schedule_path: Path) -> List[Schedule]:
+def schedule_from_line(line: str) -> Schedule | None:
     """
-    (형식 검증이 완료된) 상영 데이터 파일을 읽어 Schedule 객체 리스트로 변환한다.
-
-    매개변수:
-        schedule_path: Path - 상영 데이터 파일 경로
+    (형식 검증이 완료된) 상영 레코드 한 줄을 Schedule 객체로 변환한다.
 
     반환값:
-        List[Schedule] - 레코드 유효 여부가 'T'인 상영 객체 리스트
+        Schedule - 레코드 유효 여부가 'T'인 경우
+        None     - 유효 여부가 'T'가 아니거나 형식이 맞지 않는 경우
     """
+    if line.strip() == "":
+        # 형식 검증을 통과했다면 등장하지 않겠지만, 방어적으로 무시
+        return None
 
-    schedules: List[Schedule] = []
-    lines = schedule_path.read_text(encoding="utf-8").splitlines()
-
-    for line in lines:
-        if line.strip() == "":
-            # 형식 검증을 통과했다면 등장하지 않겠지만, 방어적으로 무시
-            continue
-
-        parts = line.split("/")
-        if len(parts) != 7:
-            # 형식 검증이 끝난 상태라면 등장하지 않지만, 방어적으로 무시
-            continue
-
-        (
-            schedule_id_str,
-            movie_id_str,
-            movie_date_str,
-            movie_start_time_str,
-            seats_vec_str,
-            valid_flag_str,
-            timestamp_str,
-        ) = parts
-
-        # 레코드 유효 여부가 'T'인 레코드만 사용
-        if valid_flag_str != "T":
-            continue
-
-        # 좌석 벡터 문자열을 List[int]로 변환
-        body = seats_vec_str.strip()[1:-1]  # 양쪽 대괄호 제거
-        items = body.split(",")
-        if len(items) != 25:
-            # 형식 검증이 끝난 상태라면 등장하지 않지만, 방어적으로 무시
-            continue
-
-        try:
-            seats_vector = [int(x) for x in items]
-        except ValueError:
-            continue
-
-        if any(n not in (0, 1) for n in seats_vector):
-            continue
+    parts = line.split("/")
+    if len(parts) != 7:
+        # 형식 검증이 끝난 상태라면 등장하지 않지만, 방어적으로 무시
+        return None
 
-        s = Schedule()
-        s.schedule_id = schedule_id_str
-        s.movie_id = movie_id_str
-        s.movie_date = movie_date_str
-        s.movie_start_time = movie_start_time_str
-        s.seats_vector = seats_vector
-        s.time_stamp = timestamp_str
+    (
+        schedule_id_str,
+        movie_id_str,
+        movie_date_str,
+        movie_start_time_str,
+        seats_vec_str,
+        valid_flag_str,
+        timestamp_str,
+    ) = parts
+
+    # 레코드 유효 여부가 'T'인 레코드만 사용
+    if valid_flag_str != "T":
+        return None
 
-        schedules.append(s)
+    # 좌석 벡터 문자열을 비트마스크로 변환
+    try:
+        seats_vector = seats_from_str(seats_vec_str.strip())
+    except ValueError:
+        # 형식 검증이 끝난 상태라면 등장하지 않지만, 방어적으로 무시
+        return None
 
-    return schedules
+    s = Schedule()
+    s.schedule_id = schedule_id_str
+    s.movie_id = movie_id_str
+    s.movie_date = movie_date_str
+    s.movie_start_time = movie_start_time_str
+    s.seats_vector = seats_vector
+    s.time_stamp = timestamp_str
+    s.start_minutes = time_to_minutes(movie_start_time_str)
+    s.end_minutes = s.start_minutes  # 러닝 타임은 set_schedule_end_times에서 반영
+    return s
 
 
-def validate_schedule_id_duplication(schedule_path: Path) -> bool:
+def scan_schedule_file(schedule_path: Path) -> Tuple[str, List[Schedule]]:
     """
-    상영 데이터 파일 내에서 중복된 상영 고유 번호가 존재하는지 검사한다.
+    상영 데이터 파일을 한 번만 읽어 형식 검사, 상영 고유 번호 중복 검사, Schedule 객체 생성을 함께 수행한다.
+    형식 오류가 있으면 해당 레코드를, 유효(T) 레코드의 상영 고유 번호가 중복되면
+    의미 규칙 위반 메시지를 출력하고 프로그램을 종료한다.
 
     매개변수:
         schedule_path: Path - 상영 데이터 파일 경로
 
     반환값:
-        (is_ok)
-        - is_ok: 규칙 검증 오류(중복 상영 ID)가 하나도 없으면 True, 하나 이상 있으면 False
+        (text, schedules)
+        - text: 파일 내용 (저장소 적재에 재사용)
+        - schedules: 레코드 유효 여부가 'T'인 상영 객체 리스트 (파일 순서)
     """
+    text = read_data_text(schedule_path, "상영")
 
-    lines = schedule_path.read_text(encoding="utf-8").splitlines()
-
-    id_counts: Dict[str, int] = {}
-    records: List[Tuple[str, str]] = []  # (schedule_id, original_line)
-
-    for line in lines:
-        if line.strip() == "":
-            continue
+    error_lines: List[str] = []
+    schedules: List[Schedule] = []
+    seen_ids: set = set()
+    duplicated = False
 
-        parts = line.split("/")
-        if len(parts) != 7:
-            # 형식 검증을 통과했다면 등장하지 않겠지만, 방어적으로 무시
+    for line in text.splitlines():
+        if not is_valid_schedule_line(line):
+            error_lines.append(line)
             continue
 
-        schedule_id_str, _, _, _, _, valid_flag_str, _ = parts
-
-        if valid_flag_str != "T":
+        s = schedule_from_line(line)
+        if s is None:
             # 유효 여부가 'T'가 아닌 레코드는 규칙 검증 대상에서 제외
             continue
 
-        records.append((schedule_id_str, line))
-        id_counts[schedule_id_str] = id_counts.get(schedule_id_str, 0) + 1
+        if s.schedule_id in seen_ids:
+            duplicated = True
+        seen_ids.add(s.schedule_id)
+        schedules.append(s)
 
-    # 등장 횟수가 2 이상인 상영 ID들을 찾는다.
-    duplicated_ids = {sid for sid, cnt in id_counts.items() if cnt >= 2}
+    if error_lines:
+        exit_with_error_lines("상영", SCHEDULE_FILE, error_lines)
 
-    if not duplicated_ids:
-        return True
+    if duplicated:
+        exit_with_schedule_rule_error()
 
-    return False
+    return text, schedules
 
 def check_sorted_schedule_id(schedules: List[Schedule]) -> bool:
     """
@@ -809,8 +878,8 @@ def check_schedule_time_conflict(schedules: List[Schedule], movies: List[Movie])
         True  - 동일한 날짜 내에서 모든 상영 시간이 서로 겹치지 않는 경우
         False - 동일한 날짜 내에서 상영 시간이 겹치는 일정이 하나라도 존재하는 경우
     """
-    # 1. 영화 고유 번호 -> 러닝 타임(분) 매핑
-    movie_time_dict: Dict[str, int] = {m.movie_id: m.running_time for m in movies}
+    # 1. 유효 영화 고유 번호 (종료 시각은 set_schedule_end_times로 계산되어 있음)
+    movie_ids = {m.movie_id for m in movies}
 
     # 2. 날짜별 상영 목록 그룹화
     schedules_by_date: Dict[str, List[Schedule]] = {}
@@ -824,29 +893,15 @@ def check_schedule_time_conflict(schedules: List[Schedule], movies: List[Movie])
             continue
 
         # 영화 시작 시간 기준 오름차순 정렬
-        sch_list_sorted = sorted(sch_list, key=lambda s: s.movie_start_time)
+        sch_list_sorted = sorted(sch_list, key=lambda s: s.start_minutes)
 
-        # 각 상영에 대해 (시작 시각 분, 종료 시각 분) 계산
+        # 각 상영의 (시작 시각 분, 종료 시각 분)
         intervals: List[tuple[int, int]] = []
         for sch in sch_list_sorted:
-            # 시작 시각 "HH:MM" → 분 단위
-            try:
-                sh = int(sch.movie_start_time[0:2])
-                sm = int(sch.movie_start_time[3:5])
-            except ValueError:
-                # 형식 검증이 끝난 상태라면 발생하지 않겠지만, 방어적으로 False 처리
-                return False
-
-            start_min = sh * 60 + sm
-
-            # 영화 러닝 타임 조회
-            rt = movie_time_dict.get(sch.movie_id)
-            if rt is None:
+            if sch.movie_id not in movie_ids:
                 # 참조 무결성 검증에서 걸러졌어야 하지만, 방어적으로 False 처리
                 return False
-
-            end_min = start_min + rt
-            intervals.append((start_min, end_min))
+            intervals.append((sch.start_minutes, sch.end_minutes))
 
         # 인접 상영 간 시간 충돌 검사
         for i in range(len(intervals) - 1):
@@ -870,25 +925,15 @@ def check_schedule_end_time_before_midnight(schedules: List[Schedule], movies: L
         True  - 모든 영화의 종료 시간이 24:00 이전(또는 정확히 24:00)인 경우
         False - 어떤 영화의 종료 시간이 24:00 이후인 경우
     """
-    # 영화 고유 번호 -> 러닝 타임(분) 매핑
-    movie_time_dict: Dict[str, int] = {m.movie_id: m.running_time for m in movies}
+    # 유효 영화 고유 번호 (종료 시각은 set_schedule_end_times로 계산되어 있음)
+    movie_ids = {m.movie_id for m in movies}
 
     for sch in schedules:
-        # 영화 러닝 타임 조회
-        rt = movie_time_dict.get(sch.movie_id)
-        if rt is None:
+        if sch.movie_id not in movie_ids:
             # 참조 무결성 검증에서 걸러졌어야 하지만, 방어적으로 False 처리
             return False
 
-        # 시작 시각 "HH:MM" → 분 단위
-        try:
-            sh = int(sch.movie_start_time[0:2])
-            sm = int(sch.movie_start_time[3:5])
-        except ValueError:
-            return False
-
-        start_min = sh * 60 + sm
-        end_min = start_min + rt
+        end_min = sch.end_minutes
 
         # 24:00(= 1440분)을 초과하면 규칙 위반
         if end_min >= 1440:
@@ -901,320 +946,259 @@ def check_schedule_end_time_before_midnight(schedules: List[Schedule], movies: L
 ############################################################
 
 
-def validate_student_syntax(student_path: Path) -> Tuple[bool, List[str]]:
+def _split_records(text: str) -> List[str]:
+    """파일 내용을 레코드 단위로 나눈다. (파일을 한 줄씩 읽어 끝의 개행을 뗀 것과 같다)"""
+    lines = text.split("\n")
+    if lines[-1] == "":
+        lines.pop()
+    return lines
+
+
+def _is_valid_timestamp(timestamp: str) -> bool:
+    """타임스탬프의 의미 규칙 검증"""
+    try:
+        # 정수 변환 및 파싱
+        parts = timestamp.split('-')
+        yyyy = int(parts[0])
+        mm = int(parts[1])
+        dd = int(parts[2])
+        
+        # 그레고리력 범위 검사 (1582년 10월 15일 이후)
+        if (yyyy < 1582) or (yyyy == 1582 and mm < 10) or (yyyy == 1582 and mm == 10 and dd < 15):
+            return False
+        
+        # 날짜 실존 여부 검사
+        date(yyyy, mm, dd)
+        return True
+    except (ValueError, IndexError):
+        return False
+
+
+def _is_valid_schedule_id(schedule_id: str) -> bool:
+    """상영 고유 번호의 의미 규칙 검증"""
+    try:
+        # 정수 변환 및 파싱
+        yyyy = int(schedule_id[0:4])
+        mm = int(schedule_id[4:6])
+        dd = int(schedule_id[6:8])
+        hh = int(schedule_id[8:10])
+        minutes = int(schedule_id[10:12])
+        
+        # 그레고리력 범위 검사
+        if (yyyy < 1582) or (yyyy == 1582 and mm < 10) or (yyyy == 1582 and mm == 10 and dd < 15):
+            return False
+        
+        # 날짜 및 시간 실존 여부 검사
+        datetime(yyyy, mm, dd, hh, minutes)
+        return True
+    except (ValueError, IndexError):
+        return False
+
+
+def is_valid_student_line(line: str) -> bool:
     """
-    학생 데이터 파일을 열어 각 레코드를 확인하고, 형식이 올바른지 검사
-    1. 구분자(/) 개수 확인
-    2. 불필요한 앞뒤 공백 확인
-    3. 필드 분리
-    4. 문법 형식 확인 (haeun.py의 정규식 활용) - 학번, 비밀번호, 타임스탬프
-    5. 의미 규칙 확인 - 타임스탬프 (그레고리력)
-    
-    Returns:
-        Tuple[bool, List[str]]: (형식 오류 여부, 오류 레코드 리스트)
+    학생 데이터 파일의 레코드 한 줄(개행 제외)이 형식/의미 규칙을 만족하는지 검사
     """
-    error_records = []
+    # 1. 구분자(/) 개수 확인
+    if line.count('/') != 2:
+        return False
     
-    def _validate_timestamp(timestamp: str) -> bool:
-        """타임스탬프의 의미 규칙 검증"""
-        try:
-            # 정수 변환 및 파싱
-            parts = timestamp.split('-')
-            yyyy = int(parts[0])
-            mm = int(parts[1])
-            dd = int(parts[2])
-            
-            # 그레고리력 범위 검사 (1582년 10월 15일 이후)
-            if (yyyy < 1582) or (yyyy == 1582 and mm < 10) or (yyyy == 1582 and mm == 10 and dd < 15):
-                return False
-            
-            # 날짜 실존 여부 검사
-            date(yyyy, mm, dd)
-            return True
-        except (ValueError, IndexError):
-            return False
+    # 2. 불필요한 앞뒤 공백 확인
+    if line != line.strip():
+        return False
     
-    try:
-        with open(student_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.rstrip('\n')
-                original_line = line
-                
-                # 1. 구분자(/) 개수 확인
-                if line.count('/') != 2:
-                    error_records.append(original_line)
-                    continue
-                
-                # 2. 불필요한 앞뒤 공백 확인
-                if line != line.strip():
-                    error_records.append(original_line)
-                    continue
-                
-                # 3. 필드 분리
-                parts = line.split('/')
-                if len(parts) != 3:
-                    error_records.append(original_line)
-                    continue
-                
-                student_id, password, timestamp = parts
-                
-                # 4. 문법 형식 확인 (haeun.py의 정규식 활용)
-                if not RE_STUDENT_ID.match(student_id):
-                    error_records.append(original_line)
-                    continue
-                
-                if not RE_PASSWORD.match(password):
-                    error_records.append(original_line)
-                    continue
-                
-                if not RE_DATE.match(timestamp):
-                    error_records.append(original_line)
-                    continue
-                
-                # 5. 의미 규칙 확인 - 타임스탬프 (그레고리력)
-                if not _validate_timestamp(timestamp):
-                    error_records.append(original_line)
-                    continue
+    # 3. 필드 분리
+    parts = line.split('/')
+    if len(parts) != 3:
+        return False
     
-    except FileNotFoundError:
-        result = (False, [])
-        #print(result)
-        return result
+    student_id, password, timestamp = parts
+    
+    # 4. 문법 형식 확인 (haeun.py의 정규식 활용)
+    if not RE_STUDENT_ID.match(student_id):
+        return False
+    
+    if not RE_PASSWORD.match(password):
+        return False
+    
+    if not RE_DATE.match(timestamp):
+        return False
+    
+    # 5. 의미 규칙 확인 - 타임스탬프 (그레고리력)
+    if not _is_valid_timestamp(timestamp):
+        return False
 
-    # 파일을 정상적으로 읽은 경우: error_records 기반 결과 반환
-    result = (len(error_records) == 0, error_records)
-    #print(result)
-    return result
+    return True
 
 
-def parse_student_data(student_path: Path) -> List[Student]:
+def student_from_line(line: str) -> Student | None:
     """
-    형식 검증이 완료된 파일을 읽어 Student 객체 리스트로 변환
+    형식 검증이 완료된 학생 레코드 한 줄을 Student 객체로 변환
     """
-    students = []
-    
-    try:
-        with open(student_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.rstrip('\n')
-                parts = line.split('/')
-                
-                if len(parts) == 3:
-                    student_id, password, timestamp = parts
-                    
-                    # Student 객체 생성 (haeun.py의 클래스 활용)
-                    student = Student()
-                    student.student_id = student_id
-                    student.password = password
-                    student.timestamp = timestamp
-                    students.append(student)
-    
-    except FileNotFoundError:
-        return []
-    
-    return students
+    parts = line.split('/')
+    if len(parts) != 3:
+        return None
+
+    student_id, password, timestamp = parts
 
+    # Student 객체 생성 (haeun.py의 클래스 활용)
+    student = Student()
+    student.student_id = student_id
+    student.password = password
+    student.timestamp = timestamp
+    return student
 
-def validate_student_id_duplication(student_path: Path) -> Tuple[bool, List[str]]:
+
+def scan_student_file(student_path: Path) -> Tuple[str, List[Student]]:
     """
-    학생 데이터 파일 내에서 중복된 학번이 존재하는지 검사
-    1. 파일을 한 레코드씩 읽음, 구분자(/)로 분리
-    2. 학번별 카운트
-    3. 중복된 학번 가진 레코드 추출
+    학생 데이터 파일을 한 번만 읽어 각 레코드의 형식 검사, 학번 중복 검사, Student 객체 생성을 함께 수행
+    1. 형식 오류 레코드가 있으면 해당 레코드를 출력하고 종료
+    2. 중복된 학번을 가진 레코드가 있으면 해당 레코드를 (학번이 처음 등장한 순서대로) 출력하고 종료
     
     Returns:
-        Tuple[bool, List[str]]: (중복 없음 여부, 중복 레코드 리스트)
+        Tuple[str, List[Student]]: (파일 내용, Student 객체 리스트)
     """
-    student_id_count = defaultdict(int)
-    records_by_id = defaultdict(list)
-    
     try:
-        with open(student_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.rstrip('\n')
-                parts = line.split('/')
+        text = read_data_text(student_path, "학생")
+    except FileNotFoundError:
+        exit_with_error_lines("학생", STUDENT_FILE, [])
 
-                if len(parts) == 3:
-                    student_id = parts[0]
+    error_records = []
+    students = []
+    records_by_id = defaultdict(list)
+    
+    for line in _split_records(text):
+        if not is_valid_student_line(line):
+            error_records.append(line)
+            continue
 
-                    # 학번별 카운트
-                    student_id_count[student_id] += 1
-                    records_by_id[student_id].append(line)
+        student = student_from_line(line)
+        students.append(student)
+        records_by_id[student.student_id].append(line)
 
-    except FileNotFoundError:
-        result = (True, [])
-        #print(result)
-        return result
+    if error_records:
+        exit_with_error_lines("학생", STUDENT_FILE, error_records)
 
     # 중복된 학번을 가진 레코드 추출
     duplicate_records = []
-    for sid, count in student_id_count.items():
-        if count >= 2:
-            duplicate_records.extend(records_by_id[sid])
+    for records in records_by_id.values():
+        if len(records) >= 2:
+            duplicate_records.extend(records)
+
+    if duplicate_records:
+        exit_with_error_lines("학생", STUDENT_FILE, duplicate_records)
     
-    result = (len(duplicate_records) == 0, duplicate_records)
-    #print(result)
-    return result
+    return text, students
 
 
 ############################################################
 ##################### 예매 데이터 파일 #########################
 ############################################################
 
-def validate_booking_syntax(booking_path: Path) -> Tuple[bool, List[str]]:
+def is_valid_booking_line(line: str) -> bool:
     """
-    예매 데이터 파일을 열어 각 레코드를 확인하고, 형식이 올바른지 검사
-    1. 구분자(/) 개수 확인
-    2. 불필요한 앞뒤 공백 확인
-    3. 필드 분리
-    4. 문법 형식 확인 (haeun.py의 정규식 활용) - 학번, 상영 고유 번호, 좌석 예약 벡터, 레코드 유효 여부, 타임 스탬프
-    5. 의미 규칙 확인 - 타임스탬프 (그레고리력)
-    6. 의미 규칙 확인 - 상영 고유 번호 (YYYYMMDDHHmm) + 그레고리력
-    
-    Returns:
-        Tuple[bool, List[str]]: (형식 오류 여부, 오류 레코드 리스트)
+    예매 데이터 파일의 레코드 한 줄(개행 제외)이 형식/의미 규칙을 만족하는지 검사
     """
-    error_records = []
+    # 1. 구분자(/) 개수 확인
+    if line.count('/') != 4:
+        return False
     
-    def _validate_timestamp(timestamp: str) -> bool:
-        """타임스탬프의 의미 규칙 검증"""
-        try:
-            # 정수 변환 및 파싱
-            parts = timestamp.split('-')
-            yyyy = int(parts[0])
-            mm = int(parts[1])
-            dd = int(parts[2])
-            
-            # 그레고리력 범위 검사 (1582년 10월 15일 이후)
-            if (yyyy < 1582) or (yyyy == 1582 and mm < 10) or (yyyy == 1582 and mm == 10 and dd < 15):
-                return False
-            
-            # 날짜 실존 여부 검사
-            date(yyyy, mm, dd)
-            return True
-        except (ValueError, IndexError):
-            return False
+    # 2. 불필요한 앞뒤 공백 확인
+    if line != line.strip():
+        return False
     
-    def _validate_schedule_id(schedule_id: str) -> bool:
-        """상영 고유 번호의 의미 규칙 검증"""
-        try:
-            # 정수 변환 및 파싱
-            yyyy = int(schedule_id[0:4])
-            mm = int(schedule_id[4:6])
-            dd = int(schedule_id[6:8])
-            hh = int(schedule_id[8:10])
-            minutes = int(schedule_id[10:12])
-            
-            # 그레고리력 범위 검사
-            if (yyyy < 1582) or (yyyy == 1582 and mm < 10) or (yyyy == 1582 and mm == 10 and dd < 15):
-                return False
-            
-            # 날짜 및 시간 실존 여부 검사
-            datetime(yyyy, mm, dd, hh, minutes)
-            return True
-        except (ValueError, IndexError):
-            return False
+    # 3. 필드 분리
+    parts = line.split('/')
+    if len(parts) != 5:
+        return False
     
-    try:
-        with open(booking_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.rstrip('\n')
-                original_line = line
-                
-                # 1. 구분자(/) 개수 확인
-                if line.count('/') != 4:
-                    error_records.append(original_line)
-                    continue
-                
-                # 2. 불필요한 앞뒤 공백 확인
-                if line != line.strip():
-                    error_records.append(original_line)
-                    continue
-                
-                # 3. 필드 분리
-                parts = line.split('/')
-                if len(parts) != 5:
-                    error_records.append(original_line)
-                    continue
-                
-                student_id, schedule_id, seats_vector, record_valid, timestamp = parts
-                
-                # 4. 문법 형식 확인 (haeun.py의 정규식 활용)
-                if not RE_STUDENT_ID.match(student_id):
-                    error_records.append(original_line)
-                    continue
-                
-                if not RE_SCREENING_NUMBER.match(schedule_id):
-                    error_records.append(original_line)
-                    continue
-                
-                if not RE_SEAT_VECTOR_FULL.match(seats_vector):
-                    error_records.append(original_line)
-                    continue
-                
-                if not RE_VALID_RECORD.match(record_valid):
-                    error_records.append(original_line)
-                    continue
-                
-                if not RE_DATE.match(timestamp):
-                    error_records.append(original_line)
-                    continue
-                
-                # 5. 의미 규칙 확인
-                # A. 타임스탬프 검증
-                if not _validate_timestamp(timestamp):
-                    error_records.append(original_line)
-                    continue
-                
-                # B. 상영 고유 번호 검증
-                if not _validate_schedule_id(schedule_id):
-                    error_records.append(original_line)
-                    continue
-
-    except FileNotFoundError:
-        result = (False, [])
-        #print(result)
-        return result
-
-    result = (len(error_records) == 0, error_records)
+    student_id, schedule_id, seats_vector, record_valid, timestamp = parts
     
-    #print(result)
-    return result
+    # 4. 문법 형식 확인 (haeun.py의 정규식 활용)
+    if not RE_STUDENT_ID.match(student_id):
+        return False
+    
+    if not RE_SCREENING_NUMBER.match(schedule_id):
+        return False
+    
+    if not RE_SEAT_VECTOR_FULL.match(seats_vector):
+        return False
+    
+    if not RE_VALID_RECORD.match(record_valid):
+        return False
+    
+    if not RE_DATE.match(timestamp):
+        return False
+    
+    # 5. 의미 규칙 확인
+    # A. 타임스탬프 검증
+    if not _is_valid_timestamp(timestamp):
+        return False
+    
+    # B. 상영 고유 번호 검증
+    if not _is_valid_schedule_id(schedule_id):
+        return False
+
+    return True
 
 
-def parse_booking_data(booking_path: Path) -> List[Booking]:
+def booking_from_line(line: str) -> Booking | None:
     """
-    형식 검증이 완료된 파일을 읽어 Booking 객체 리스트로 변환
-    레코드 유효 여부가 T인 레코드만 추출
+    형식 검증이 완료된 예매 레코드 한 줄을 Booking 객체로 변환
+    레코드 유효 여부가 T가 아니면 None
     """
-    bookings = []
+    parts = line.split('/')
+    if len(parts) != 5:
+        return None
+
+    student_id, schedule_id, seats_vector, record_valid, timestamp = parts
+
+    # 유효한 레코드만 처리
+    if record_valid != 'T':
+        return None
+
+    # 좌석 벡터 파싱
+    seats = seats_from_str(seats_vector)
+
+    # Booking 객체 생성 (haeun.py의 클래스 활용)
+    booking = Booking()
+    booking.student_id = student_id
+    booking.schedule_id = schedule_id
+    booking.seats = seats
+    booking.timestamp = timestamp
+    return booking
+
+
+def scan_booking_file(booking_path: Path) -> Tuple[str, List[Booking]]:
+    """
+    예매 데이터 파일을 한 번만 읽어 각 레코드의 형식 검사와 Booking 객체 생성을 함께 수행
+    형식 오류 레코드가 있으면 해당 레코드를 출력하고 종료
+    레코드 유효 여부가 T인 레코드만 객체로 만든다.
     
+    Returns:
+        Tuple[str, List[Booking]]: (파일 내용, Booking 객체 리스트)
+    """
     try:
-        with open(booking_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.rstrip('\n')
-                parts = line.split('/')
-                
-                if len(parts) == 5:
-                    student_id, schedule_id, seats_vector, record_valid, timestamp = parts
-                    
-                    # 유효한 레코드만 처리
-                    if record_valid == 'T':
-                        # 좌석 벡터 파싱
-                        seats = ast.literal_eval(seats_vector)
-                        
-                        # Booking 객체 생성 (haeun.py의 클래스 활용)
-                        booking = Booking()
-                        booking.student_id = student_id
-                        booking.schedule_id = schedule_id
-                        booking.seats = seats
-                        booking.timestamp = timestamp
-                        bookings.append(booking)
-    
+        text = read_data_text(booking_path, "예매")
     except FileNotFoundError:
-        return []
-    
-    return bookings
+        exit_with_error_lines("예매", BOOKING_FILE, [])
+
+    error_records = []
+    bookings = []
+
+    for line in _split_records(text):
+        if not is_valid_booking_line(line):
+            error_records.append(line)
+            continue
+
+        booking = booking_from_line(line)
+        if booking is not None:
+            bookings.append(booking)
+
+    if error_records:
+        exit_with_error_lines("예매", BOOKING_FILE, error_records)
+
+    return text, bookings
 
 
 def check_duplicate_seats(bookings: List[Booking]) -> bool:
@@ -1228,22 +1212,17 @@ def check_duplicate_seats(bookings: List[Booking]) -> bool:
     Returns:
         bool: True(중복 없음), False(중복 존재)
     """
-    # 상영 고유 번호별 좌석 누적 딕셔너리
-    seat_accumulator = defaultdict(lambda: [0] * 25)
+    # 상영 고유 번호별 지금까지 예매된 좌석 (비트마스크)
+    seat_accumulator: Dict[str, int] = defaultdict(int)
     
     for booking in bookings:
         schedule_id = booking.schedule_id
-        # 좌석 벡터를 누적 합산
-        for i in range(25):
-            seat_accumulator[schedule_id][i] += booking.seats[i]
-    
-    # 누적 합산 결과 검사
-    for schedule_id, accumulated_seats in seat_accumulator.items():
-        for seat_count in accumulated_seats:
-            if seat_count >= 2:
-                result = False
-                #print(result)
-                return result
+        # 이미 예매된 좌석과 겹치면 중복
+        if seat_accumulator[schedule_id] & booking.seats:
+            result = False
+            #print(result)
+            return result
+        seat_accumulator[schedule_id] |= booking.seats
 
     # 여기까지 왔으면 중복 없음
     result = True
@@ -1267,17 +1246,18 @@ def check_seat_consistency(bookings: List[Booking], schedules: List[Schedule]) -
     for schedule in schedules:
         schedule_dict[schedule.schedule_id] = schedule.seats_vector
     
-    # 예매 데이터에서 좌석 합산
-    calculated_seats = defaultdict(lambda: [0] * 25)
+    # 예매 데이터의 좌석을 상영별로 OR (겹치는 좌석이 있으면 합이 1을 넘으므로 불일치)
+    calculated_seats: Dict[str, int] = defaultdict(int)
     for booking in bookings:
         schedule_id = booking.schedule_id
-        for i in range(25):
-            calculated_seats[schedule_id][i] += booking.seats[i]
+        if calculated_seats[schedule_id] & booking.seats:
+            return False
+        calculated_seats[schedule_id] |= booking.seats
     
     # 일치 여부 확인
     for schedule_id in schedule_dict.keys():
         expected = schedule_dict[schedule_id]
-        actual = calculated_seats.get(schedule_id, [0] * 25)
+        actual = calculated_seats.get(schedule_id, 0)
 
         if expected != actual:
             result = False
@@ -1346,178 +1326,1434 @@ def check_student_id_reference(bookings: List[Booking], students: List[Student])
     return result
 
 
-def remove_zero_seat_bookings(booking_path: Path) -> None:
+def remove_zero_seat_bookings(booking_path: Path, text: str) -> str:
     """
-    좌석을 하나도 예매하지 않은(좌석 예약 벡터의 모든 숫자가 0인) 무의미한 예매 레코드의 유효 여부를 T에서 F로 수정
-    1. 모든 레코드 읽어서 좌석 벡터 파싱
-    2. 모든 좌석이 0 && 레코드 유효 여부가 "T"인 경우
-    3. 레코드 유효 여부 "F"로 수정
-    4. 타임 스탬프 - CURRENT_DATE_STR로 변경
+    (형식 검증이 완료된) 예매 데이터 파일 내용에서 모든 좌석이 0인 유효 레코드를 무효화하고,
+    바뀐 레코드가 있을 때만 파일을 다시 쓴다.
+    1. 모든 좌석이 0 && 레코드 유효 여부가 "T"인 경우
+    2. 레코드 유효 여부 "F"로 수정
+    3. 타임 스탬프 - CURRENT_DATE_STR로 변경
+
+    매개변수:
+        booking_path: Path - 예매 데이터 파일 경로
+        text: str          - scan_booking_file이 읽은 파일 내용
+
+    반환값:
+        str - 수정 후 파일 내용 (수정이 없으면 text 그대로)
     """
-    try:
-        with open(booking_path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-        
-        # 수정된 라인 저장
-        modified_lines = []
-        modified = False  # 수정 여부 추적
-        
-        for i, line in enumerate(lines):
-            line = line.rstrip('\n')
-            parts = line.split('/')
-            if len(parts) == 5:
-                student_id, schedule_id, seats_vector, record_valid, timestamp = parts
-                
-                # 좌석 벡터 파싱
-                seats = ast.literal_eval(seats_vector)
-                
-                # 모든 좌석이 0이고 레코드가 유효한 경우
-                if all(seat == 0 for seat in seats) and record_valid == 'T':
-                    # 유효 여부를 F로 변경, 타임스탬프를 현재 날짜로 변경 (CURRENT_DATE_STR 없으면 기본값)
-                    fallback_date = CURRENT_DATE_STR or "1582-10-15"
-                    modified_line = f"{student_id}/{schedule_id}/{seats_vector}/F/{fallback_date}"
-                    if i < len(lines) - 1:
-                        modified_line += '\n'
-                    modified = True  # 수정 발생
-                else:
-                    modified_line = line
-                    if i < len(lines) - 1:
-                        modified_line += '\n'
-            else:
-                modified_line = line
-                if i < len(lines) - 1:
-                    modified_line += '\n'
-            
-            modified_lines.append(modified_line)
-        
-        # 파일 쓰기
-        with open(booking_path, 'w', encoding='utf-8') as f:
-            f.writelines(modified_lines)
-        
-        # 수정이 발생했을 때만 경고 메시지 출력
-        if modified:
-            warn("예매 데이터 파일에 무의미한 예매 레코드가 존재합니다. 해당 예매 레코드를 삭제합니다.")
-    
-    except FileNotFoundError:
-        pass
+    lines = _split_records(text)
+    modified = False  # 수정 여부 추적
 
+    for i, line in enumerate(lines):
+        parts = line.split('/')
+        if len(parts) != 5:
+            continue
 
+        student_id, schedule_id, seats_vector, record_valid, timestamp = parts
 
+        # 모든 좌석이 0이고 레코드가 유효한 경우
+        if record_valid == 'T' and seats_from_str(seats_vector) == 0:
+            # 유효 여부를 F로 변경, 타임스탬프를 현재 날짜로 변경 (CURRENT_DATE_STR 없으면 기본값)
+            fallback_date = CURRENT_DATE_STR or "1582-10-15"
+            lines[i] = f"{student_id}/{schedule_id}/{seats_vector}/F/{fallback_date}"
+            modified = True
 
+    if not modified:
+        return text
 
-def verify_integrity():
-    
-    is_ok, error_lines = validate_movie_syntax(Path(MOVIE_FILE))
-    if not is_ok:
-        error(f"영화 데이터 파일\n{MOVIE_FILE}가 올바르지 않습니다! 프로그램을 종료합니다.")
-        for line in error_lines:
-            print(line)
-        sys.exit(1)
-    
-    movies = parse_movie_data(Path(MOVIE_FILE))
+    text = "\n".join(lines)
+    write_file_atomic(booking_path, text)
+    warn("예매 데이터 파일에 무의미한 예매 레코드가 존재합니다. 해당 예매 레코드를 삭제합니다.")
+    return text
 
-    is_ok, error_lines = validate_movie_id_duplication(Path(MOVIE_FILE))
-    if not is_ok:
-        error(f"영화 데이터 파일\n{MOVIE_FILE}가 올바르지 않습니다! 프로그램을 종료합니다.")
-        for line in error_lines:
-            print(line)
-        sys.exit(1)
-    
-    is_ok, error_lines = validate_movie_name_duplication(Path(MOVIE_FILE))
-    if not is_ok:
-        error(f"영화 데이터 파일\n{MOVIE_FILE}가 올바르지 않습니다! 프로그램을 종료합니다.")
-        for line in error_lines:
-            print(line)
-        sys.exit(1)
-    
-    is_ok, error_lines = validate_schedule_syntax(Path(SCHEDULE_FILE))
-    if not is_ok:
-        error(f"상영 데이터 파일\n{SCHEDULE_FILE}가 올바르지 않습니다! 프로그램을 종료합니다.")
-        for line in error_lines:
-            print(line)
-        sys.exit(1)
-    
-    schedules = parse_schedule_data(Path(SCHEDULE_FILE))
 
-    is_ok = validate_schedule_id_duplication(Path(SCHEDULE_FILE))
-    if not is_ok:
-        error(f"상영 데이터 파일\n{SCHEDULE_FILE}가 올바르지 않습니다!\n의미 규칙이 위반되었습니다. 프로그램을 종료합니다.")
-        sys.exit(1)
+############################################################
+###################### 무결성 검사 ##########################
+############################################################
 
-    is_ok = check_sorted_schedule_id(schedules) 
-    if not is_ok:
-        error(f"상영 데이터 파일\n{SCHEDULE_FILE}가 올바르지 않습니다!\n의미 규칙이 위반되었습니다. 프로그램을 종료합니다.")
-        sys.exit(1)
-    
-    is_ok = check_movie_id_reference(schedules, movies)
-    if not is_ok:
-        error(f"상영 데이터 파일\n{SCHEDULE_FILE}가 올바르지 않습니다!\n의미 규칙이 위반되었습니다. 프로그램을 종료합니다.")
-        sys.exit(1)
+def exit_with_error_lines(file_label: str, file_name: str, error_lines: List[str]) -> None:
+    """
+    형식/중복 오류가 발견된 경우 오류 메시지와 해당 레코드를 출력하고 프로그램을 종료한다.
 
-    is_ok = check_daily_schedule_limit(schedules)
-    if not is_ok:
-        error(f"상영 데이터 파일\n{SCHEDULE_FILE}가 올바르지 않습니다!\n의미 규칙이 위반되었습니다. 프로그램을 종료합니다.")
-        sys.exit(1)
+    매개변수:
+        file_label: str        - 데이터 파일 종류 ("영화", "상영", "학생", "예매")
+        file_name: str         - 데이터 파일 이름
+        error_lines: List[str] - 오류가 발생한 '원본 문자열' 리스트
+    """
+    error(f"{file_label} 데이터 파일\n{file_name}가 올바르지 않습니다! 프로그램을 종료합니다.")
+    for line in error_lines:
+        print(line)
+    sys.exit(1)
 
-    is_ok = check_schedule_time_conflict(schedules, movies)
-    if not is_ok:
-        error(f"상영 데이터 파일\n{SCHEDULE_FILE}가 올바르지 않습니다!\n의미 규칙이 위반되었습니다. 프로그램을 종료합니다.")
-        sys.exit(1)
 
-    is_ok = check_schedule_end_time_before_midnight(schedules, movies)
-    if not is_ok:
-        error(f"상영 데이터 파일\n{SCHEDULE_FILE}가 올바르지 않습니다!\n의미 규칙이 위반되었습니다. 프로그램을 종료합니다.")
-        sys.exit(1)
-    
-    is_ok, error_lines = validate_student_syntax(Path(STUDENT_FILE))
-    if not is_ok:
-        error(f"학생 데이터 파일\n{STUDENT_FILE}가 올바르지 않습니다! 프로그램을 종료합니다.")
-        for line in error_lines:
-            print(line)
-        sys.exit(1)
+def exit_with_schedule_rule_error() -> None:
+    """상영 데이터 파일의 의미 규칙 위반 메시지를 출력하고 프로그램을 종료한다."""
+    error(f"상영 데이터 파일\n{SCHEDULE_FILE}가 올바르지 않습니다!\n의미 규칙이 위반되었습니다. 프로그램을 종료합니다.")
+    sys.exit(1)
+
+
+def exit_with_booking_rule_error() -> None:
+    """예매 데이터 파일의 의미 규칙 위반 메시지를 출력하고 프로그램을 종료한다."""
+    error(f"데이터 파일\n{BOOKING_FILE}가 올바르지 않습니다!\n 의미 규칙이 위반되었습니다. 프로그램을 종료합니다.")
+    sys.exit(1)
+
+
+def record_change(kind: str, key: str) -> None:
+    """
+    데이터를 변경한 함수가 변경한 레코드를 보고한다.
+    다음 verify_integrity 호출 때 이 레코드와 관련된 규칙만 검사한다.
+
+    매개변수:
+        kind: str - "movie"(영화 고유 번호), "schedule"(상영 고유 번호),
+                    "student"(학번), "booking"(예매 레코드가 바뀐 상영 고유 번호)
+        key: str  - 변경된 레코드의 키
+    """
+    global VERIFIED_CLEAN
+    PENDING_CHANGES[kind].add(key)
+    VERIFIED_CLEAN = False
+
+
+def verify_integrity_full() -> Dict[str, str]:
+    """
+    네 데이터 파일을 각각 한 번씩만 읽어 모든 규칙을 검사한다.
+
+    반환값:
+        Dict[str, str] - 파일 이름 → 검사한 파일 내용 (저장소 적재에 재사용)
+    """
+    if STORE is not None:
+        # 트랜잭션 로그에만 있는 변경을 먼저 데이터 파일에 반영
+        STORE.compact()
+
+    texts: Dict[str, str] = {}
+
+    texts[MOVIE_FILE], movies = scan_movie_file(Path(MOVIE_FILE))
+
+    texts[SCHEDULE_FILE], schedules = scan_schedule_file(Path(SCHEDULE_FILE))
+    set_schedule_end_times(schedules, {m.movie_id: m.running_time for m in movies})
+
+    if not check_sorted_schedule_id(schedules):
+        exit_with_schedule_rule_error()
     
-    students = parse_student_data(Path(STUDENT_FILE))
+    if not check_movie_id_reference(schedules, movies):
+        exit_with_schedule_rule_error()
 
-    is_ok, error_lines = validate_student_id_duplication(Path(STUDENT_FILE))
-    if not is_ok:
-        error(f"학생 데이터 파일\n{STUDENT_FILE}가 올바르지 않습니다! 프로그램을 종료합니다.")
-        for line in error_lines:
-            print(line)
-        sys.exit(1)
+    if not check_daily_schedule_limit(schedules):
+        exit_with_schedule_rule_error()
+
+    if not check_schedule_time_conflict(schedules, movies):
+        exit_with_schedule_rule_error()
+
+    if not check_schedule_end_time_before_midnight(schedules, movies):
+        exit_with_schedule_rule_error()
     
-    is_ok, error_lines = validate_booking_syntax(Path(BOOKING_FILE))
-    if not is_ok:
-        error(f"예매 데이터 파일\n{BOOKING_FILE}가 올바르지 않습니다! 프로그램을 종료합니다.")
-        for line in error_lines:
-            print(line)
-        sys.exit(1)
+    texts[STUDENT_FILE], students = scan_student_file(Path(STUDENT_FILE))
     
-    bookings = parse_booking_data(Path(BOOKING_FILE))
+    texts[BOOKING_FILE], bookings = scan_booking_file(Path(BOOKING_FILE))
 
-    is_ok = check_duplicate_seats(bookings)
-    if not is_ok:
-        error(f"데이터 파일\n{BOOKING_FILE}가 올바르지 않습니다!\n 의미 규칙이 위반되었습니다. 프로그램을 종료합니다.")
-        sys.exit(1)
+    if not check_duplicate_seats(bookings):
+        exit_with_booking_rule_error()
 
-    is_ok = check_seat_consistency(bookings, schedules)
-    if not is_ok:
-        error(f"데이터 파일\n{BOOKING_FILE}가 올바르지 않습니다!\n 의미 규칙이 위반되었습니다. 프로그램을 종료합니다.")
-        sys.exit(1)                 
+    if not check_seat_consistency(bookings, schedules):
+        exit_with_booking_rule_error()
 
-    is_ok = check_schedule_id_reference(bookings, schedules)
-    if not is_ok:
-        error(f"데이터 파일\n{BOOKING_FILE}가 올바르지 않습니다!\n 의미 규칙이 위반되었습니다. 프로그램을 종료합니다.")
-        sys.exit(1)
+    if not check_schedule_id_reference(bookings, schedules):
+        exit_with_booking_rule_error()
 
-    is_ok = check_student_id_reference(bookings, students)      
-    if not is_ok:
-        error(f"데이터 파일\n{BOOKING_FILE}가 올바르지 않습니다!\n 의미 규칙이 위반되었습니다. 프로그램을 종료합니다.")
-        sys.exit(1)
+    if not check_student_id_reference(bookings, students):
+        exit_with_booking_rule_error()
 
-    remove_zero_seat_bookings(Path(BOOKING_FILE))
-        
+    texts[BOOKING_FILE] = remove_zero_seat_bookings(Path(BOOKING_FILE), texts[BOOKING_FILE])
+
+    if STORE is not None:
+        # 데이터 파일을 직접 고쳤을 수 있으므로 저장소를 다시 적재 (방금 읽은 내용 재사용)
+        STORE.load(texts)
+    return texts
+
+
+def _adjacent_schedule_id(lines: List[str], row: int, step: int) -> str | None:
+    """row에서 step 방향으로 가장 가까운 유효(T) 상영 레코드의 고유 번호를 찾는다."""
+    row += step
+    while 0 <= row < len(lines):
+        parts = lines[row].split("/")
+        if len(parts) == 7 and parts[5] == "T":
+            return parts[0]
+        row += step
+    return None
+
+
+def verify_integrity_incremental(changes: Dict[str, set]) -> None:
+    """
+    마지막 검사 이후 변경된 레코드와 관련된 규칙만 다시 검사한다.
+    예) 좌석이 바뀐 상영 1건 → 그 상영 레코드의 형식, 같은 날짜 상영들의 규칙,
+        그 상영에 대한 예매들의 좌석 중복/일관성/참조 규칙
+    데이터 파일 대신 저장소(STORE)를 조회하며, 오류 메시지와 종료 동작은
+    verify_integrity_full과 동일하다.
+
+    매개변수:
+        changes: Dict[str, set] - record_change로 보고된 변경 레코드 (종류 → 키 집합)
+    """
+    movie_ids = changes["movie"]
+    schedule_ids = changes["schedule"]
+    student_ids = changes["student"]
+    # 예매 규칙을 다시 검사할 상영 고유 번호 (상영 자체가 바뀐 경우도 포함)
+    booked_ids = changes["booking"] | schedule_ids
+
+    if not (movie_ids or schedule_ids or student_ids or booked_ids):
+        return
+
+    store = STORE
+    movies = list(store.movies.values())
+
+    # 1. 영화: 변경된 영화 레코드의 형식 + 고유 번호/제목 중복
+    if movie_ids:
+        movie_lines = store.lines[MOVIE_FILE]
+        error_lines = [
+            line for line in movie_lines
+            if line.split("/", 1)[0] in movie_ids and not is_valid_movie_line(line)
+        ]
+        if error_lines:
+            exit_with_error_lines("영화", MOVIE_FILE, error_lines)
+
+        valid_records = [(line.split("/"), line) for line in movie_lines]
+        valid_records = [(parts, line) for parts, line in valid_records if len(parts) == 5 and parts[3] == "T"]
+        changed_titles = {parts[1] for parts, _ in valid_records if parts[0] in movie_ids}
+
+        # 고유 번호 중복 → 제목 중복 순서로 검사 (전체 검사와 동일한 순서)
+        for field_idx, keys in ((0, movie_ids), (1, changed_titles)):
+            counts: Dict[str, int] = defaultdict(int)
+            for parts, _ in valid_records:
+                if parts[field_idx] in keys:
+                    counts[parts[field_idx]] += 1
+            duplicated = {key for key, cnt in counts.items() if cnt >= 2}
+            if duplicated:
+                exit_with_error_lines(
+                    "영화", MOVIE_FILE,
+                    [line for parts, line in valid_records if parts[field_idx] in duplicated],
+                )
+
+        # 변경된 영화를 상영 중인 레코드가 있으면 러닝 타임 변경이 여러 날짜에
+        # 영향을 줄 수 있으므로 전체 검사로 대신한다.
+        if any(sch.movie_id in movie_ids for sch in store.schedules.values()):
+            verify_integrity_full()
+            return
+
+    # 2. 상영: 변경된 상영 레코드의 형식 + 같은 날짜 상영들의 규칙
+    schedule_lines = store.lines[SCHEDULE_FILE]
+    error_lines = [
+        schedule_lines[store.schedule_rows[scd_id]] for scd_id in sorted(booked_ids)
+        if scd_id in store.schedule_rows
+        and not is_valid_schedule_line(schedule_lines[store.schedule_rows[scd_id]])
+    ]
+    if error_lines:
+        exit_with_error_lines("상영", SCHEDULE_FILE, error_lines)
+
+    changed_schedules = [store.schedules[scd_id] for scd_id in schedule_ids if scd_id in store.schedules]
+    target_schedules = [store.schedules[scd_id] for scd_id in booked_ids if scd_id in store.schedules]
+
+    # 정렬 규칙: 변경된 레코드와 그 앞뒤 유효 레코드의 순서만 비교
+    # (고유 번호가 중복된 유효 레코드도 여기서 걸러진다)
+    for sch in changed_schedules:
+        row = store.schedule_rows[sch.schedule_id]
+        prev_id = _adjacent_schedule_id(schedule_lines, row, -1)
+        next_id = _adjacent_schedule_id(schedule_lines, row, 1)
+        if prev_id is not None and int(sch.schedule_id) <= int(prev_id):
+            exit_with_schedule_rule_error()
+        if next_id is not None and int(next_id) <= int(sch.schedule_id):
+            exit_with_schedule_rule_error()
+
+    if not check_movie_id_reference(changed_schedules, movies):
+        exit_with_schedule_rule_error()
+
+    changed_dates = {f"{sid[0:4]}-{sid[4:6]}-{sid[6:8]}" for sid in schedule_ids}
+    schedules_by_date: Dict[str, List[Schedule]] = defaultdict(list)
+    for sch in store.schedules.values():
+        if sch.movie_date in changed_dates:
+            schedules_by_date[sch.movie_date].append(sch)
+
+    for same_date in schedules_by_date.values():
+        if not check_daily_schedule_limit(same_date):
+            exit_with_schedule_rule_error()
+        if not check_schedule_time_conflict(same_date, movies):
+            exit_with_schedule_rule_error()
+
+    if not check_schedule_end_time_before_midnight(changed_schedules, movies):
+        exit_with_schedule_rule_error()
+
+    # 3. 학생: 변경된 학번 레코드의 형식 + 학번 중복
+    students = list(store.students.values())
+    if student_ids:
+        changed_lines = [
+            line for line in store.lines[STUDENT_FILE] if line.split("/", 1)[0] in student_ids
+        ]
+        error_lines = [line for line in changed_lines if not is_valid_student_line(line)]
+        if error_lines:
+            exit_with_error_lines("학생", STUDENT_FILE, error_lines)
+        if len(changed_lines) > len({line.split("/", 1)[0] for line in changed_lines}):
+            id_counts: Dict[str, int] = defaultdict(int)
+            for line in changed_lines:
+                id_counts[line.split("/", 1)[0]] += 1
+            exit_with_error_lines(
+                "학생", STUDENT_FILE,
+                [line for line in changed_lines if id_counts[line.split("/", 1)[0]] >= 2],
+            )
+
+    # 4. 예매: 대상 상영의 예매 레코드 형식 + 좌석 중복/일관성 + 참조 무결성
+    if not booked_ids:
+        return
+
+    booking_lines = store.lines[BOOKING_FILE]
+    error_lines = []
+    bookings: List[Booking] = []
+    rows = sorted(row for scd_id in booked_ids for row in store.schedule_bookings.get(scd_id, ()))
+    for row in rows:
+        booking = store.bookings[row]
+        if not is_valid_booking_line(booking_lines[row]):
+            error_lines.append(booking_lines[row])
+            continue
+        bookings.append(booking)
+
+    if error_lines:
+        exit_with_error_lines("예매", BOOKING_FILE, error_lines)
+
+    if not check_duplicate_seats(bookings):
+        exit_with_booking_rule_error()
+
+    if not check_seat_consistency(bookings, target_schedules):
+        exit_with_booking_rule_error()
+
+    if not check_schedule_id_reference(bookings, target_schedules):
+        exit_with_booking_rule_error()
+
+    if not check_student_id_reference(bookings, students):
+        exit_with_booking_rule_error()
+
+    if any(not b.seats for b in bookings):
+        store.deactivate_zero_seat_bookings(booked_ids)
+
+
+def verify_integrity(full: bool = False) -> Dict[str, str] | None:
+    """
+    데이터 무결성 검사.
+    - full=True 이거나 KUCINEMA_VERIFY_MODE=full 이면 네 데이터 파일 전체를 검사한다.
+    - 그 외에는 마지막 검사 이후 record_change로 보고된 레코드와 관련된 규칙만 검사하고,
+      FULL_VERIFY_INTERVAL번의 증분 검사마다 한 번은 전체 검사를 수행한다.
+
+    반환값:
+        전체 검사를 했으면 검사한 파일 내용 (verify_integrity_full 참고), 아니면 None
+    """
+    global INCREMENTAL_VERIFY_COUNT, VERIFIED_CLEAN
+
+    changes = {kind: set(keys) for kind, keys in PENDING_CHANGES.items()}
+    for keys in PENDING_CHANGES.values():
+        keys.clear()
+    # 검사 도중 오류로 종료되면 스냅샷을 저장하지 않도록 통과할 때까지 False
+    VERIFIED_CLEAN = False
+
+    texts = None
+    periodic = FULL_VERIFY_INTERVAL > 0 and INCREMENTAL_VERIFY_COUNT >= FULL_VERIFY_INTERVAL
+    if full or VERIFY_MODE == "full" or periodic:
+        INCREMENTAL_VERIFY_COUNT = 0
+        texts = verify_integrity_full()
+    else:
+        INCREMENTAL_VERIFY_COUNT += 1
+        verify_integrity_incremental(changes)
+
+    VERIFIED_CLEAN = True
+    return texts
+
+
+############################################################
+###################### 데이터 저장소 ##########################
+############################################################
+
+def movie_to_line(movie: Movie, valid: str = "T") -> str:
+    """Movie 객체를 영화 데이터 파일의 레코드 한 줄로 변환한다."""
+    return f"{movie.movie_id}/{movie.movie_name}/{movie.running_time}/{valid}/{movie.time_stamp}"
+
+
+def schedule_to_line(schedule: Schedule, valid: str = "T") -> str:
+    """Schedule 객체를 상영 데이터 파일의 레코드 한 줄로 변환한다."""
+    return (
+        f"{schedule.schedule_id}/{schedule.movie_id}/{schedule.movie_date}/"
+        f"{schedule.movie_start_time}/{seats_to_str(schedule.seats_vector)}/{valid}/{schedule.time_stamp}"
+    )
+
+
+def student_to_line(student: Student) -> str:
+    """Student 객체를 학생 데이터 파일의 레코드 한 줄로 변환한다."""
+    return f"{student.student_id}/{student.password}/{student.timestamp}"
+
+
+def booking_to_line(booking: Booking, valid: str = "T") -> str:
+    """Booking 객체를 예매 데이터 파일의 레코드 한 줄로 변환한다."""
+    return f"{booking.student_id}/{booking.schedule_id}/{seats_to_str(booking.seats)}/{valid}/{booking.timestamp}"
+
+
+TOMBSTONE_MARK = b"/F/"  # 무효(F) 레코드의 끝부분: .../F/YYYY-MM-DD
+
+
+def iter_record_lines(path: Path, live_only: bool = False):
+    """
+    데이터 파일을 mmap으로 열어 (줄 번호, 레코드) 를 한 줄씩 돌려준다.
+    파일 전체를 문자열/리스트로 만들지 않고, 돌려주는 줄만 문자열로 만든다.
+
+    매개변수:
+        path: Path       - 데이터 파일 경로 (없거나 비어 있으면 아무것도 돌려주지 않음)
+        live_only: bool  - True이면 무효(F) 레코드를 문자열로 만들지 않고 건너뛴다.
+                           (영화/상영/예매 파일 전용, 무결성 검사를 통과한 파일이어야 함)
+    """
+    try:
+        f = path.open("rb")
+    except FileNotFoundError:
+        return
+    with f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            size = len(buf)
+            start = row = 0
+            while start < size:
+                end = buf.find(b"\n", start)
+                if end < 0:
+                    end = size
+                # CRLF 줄바꿈이면 레코드는 \r 앞에서 끝난다 (splitlines와 동일)
+                record_end = end - 1 if end > start and buf[end - 1:end] == b"\r" else end
+                # 유효 여부 필드는 끝에서 두 번째 필드, 타임 스탬프는 10자
+                if not (live_only and buf[record_end - 13:record_end - 10] == TOMBSTONE_MARK):
+                    yield row, buf[start:record_end].decode("utf-8")
+                row += 1
+                start = end + 1
+
+
+def write_file_atomic(path: Path, text: str | bytes) -> None:
+    """
+    임시 파일에 내용을 쓰고 fsync한 뒤 원래 파일과 교체한다.
+    쓰는 도중 프로그램이 중단되어도 데이터 파일이 잘린 채로 남지 않는다.
+    (bytes를 넘기면 이진 파일로 쓴다)
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    if isinstance(text, bytes):
+        f = tmp_path.open("wb")
+    else:
+        f = tmp_path.open("w", encoding="utf-8", newline="\n")
+    with f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def replay_journal(home: Path) -> None:
+    """
+    이전 실행에서 데이터 파일에 반영되지 못한 트랜잭션 로그를 데이터 파일에 다시 적용하고 로그를 지운다.
+    로그 한 줄이 트랜잭션 하나이며, 개행으로 끝나지 않은 마지막 줄(기록 도중 중단)은 버린다.
+
+    로그 형식: <파일 이름>/<U|A>/<줄 번호>/<레코드> 항목들을 탭으로 구분
+        U - 해당 줄을 레코드로 교체, A - 파일 끝에 레코드 추가
+    같은 로그를 두 번 적용해도 결과가 같다. (압축 도중 중단된 경우 대비)
+    """
+    journal_path = home / JOURNAL_FILE
+    if not journal_path.exists():
+        return
+
+    files: Dict[str, List[str]] = {}
+    for tx_line in journal_path.read_text(encoding="utf-8").splitlines(keepends=True):
+        if not tx_line.endswith("\n"):
+            break
+        for entry in tx_line.rstrip("\n").split("\t"):
+            parts = entry.split("/", 3)
+            if len(parts) != 4 or parts[0] not in (MOVIE_FILE, SCHEDULE_FILE, STUDENT_FILE, BOOKING_FILE):
+                continue
+            file_name, op, row, record = parts
+            if file_name not in files:
+                path = home / file_name
+                files[file_name] = path.read_text(encoding="utf-8").splitlines() if path.exists() else []
+            lines = files[file_name]
+            row = int(row)
+            if op == "A" and row >= len(lines):
+                lines.append(record)
+            elif op == "U" and row < len(lines):
+                lines[row] = record
+
+    for file_name, lines in files.items():
+        write_file_atomic(home / file_name, "\n".join(lines))
+    journal_path.unlink()
+
+
+MAX_RUNNING_TIME = 240  # 러닝 타임 최댓값(분) — 영화 레코드 의미 규칙과 동일
+
+
+@contextmanager
+def data_lock(home: Path):
+    """데이터 디렉터리의 잠금 파일(LOCK_FILE)에 배타적 권고 잠금을 건다. (다른 프로세스가 풀 때까지 대기)"""
+    with (home / LOCK_FILE).open("a+b") as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def shared_write(method):
+    """DataStore의 쓰기 메서드를 store.exclusive() 안에서 실행한다. (공유 모드가 아니면 그대로 실행)"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.exclusive():
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+class LazyFileLines(dict):
+    """
+    파일 이름 → 레코드 문자열 리스트.
+    없는 파일을 처음 조회할 때 데이터 파일을 읽어 채운다. (스냅샷에서 적재한 저장소는
+    레코드를 고칠 때까지 데이터 파일을 읽지 않는다)
+    """
+
+    def __init__(self, store: DataStore) -> None:
+        super().__init__()
+        self.store = store
+
+    def __missing__(self, file_name: str) -> List[str]:
+        path = self.store.home / file_name
+        text = path.read_text(encoding="utf-8") if path.exists() else ""
+        self.store.newline_at_end[file_name] = text.endswith("\n")
+        lines = text.splitlines()
+        self[file_name] = lines
+        return lines
+
+
+class DataStore:
+    """
+    네 데이터 파일을 프로그램 시작 시 한 번만 읽어 메모리에 보관하는 저장소.
+    메뉴 함수는 파일을 다시 읽지 않고 이 저장소를 조회하며,
+    데이터 변경은 저장소의 메서드로만 수행한다. (데이터 파일과 캐시를 함께 갱신)
+
+    lines         : 파일 이름 → 레코드 문자열 리스트 (F 레코드 포함, 개행 제외, 파일 순서)
+    movies        : 영화 고유 번호 → 유효(T) 영화
+    movie_rows    : 영화 고유 번호 → 유효(T) 레코드의 줄 번호
+    schedules     : 상영 고유 번호 → 유효(T) 상영 (상영 고유 번호 오름차순)
+    schedule_rows : 상영 고유 번호 → 유효(T) 레코드의 줄 번호
+    students      : 학번 → 학생
+    bookings      : 줄 번호 → 유효(T) 예매 (파일 순서)
+    student_bookings  : 학번 → 그 학생의 유효(T) 예매 줄 번호 집합
+    schedule_bookings : 상영 고유 번호 → 그 상영의 유효(T) 예매 줄 번호 집합
+      (예매 내역 조회/취소와 상영별 검사가 전체 예매가 아니라 해당 예매만 보도록 하는 색인)
+    date_intervals    : 영화 날짜 → 유효(T) 상영의 (시작 분, 종료 분, 상영 고유 번호) 리스트 (시작 순)
+      (상영 추가/수정 시 시간 충돌 검사를 이분 탐색으로 하기 위한 색인)
+    영화 제목 → 영화 고유 번호 색인은 movie_titles()가 처음 필요할 때 만들어 두고,
+    영화가 추가/수정/삭제되면 버린다. (제목 중복 검사가 영화 데이터 파일을 다시 읽지 않도록)
+
+    레코드 단위 변경(_update/_add)은 _commit에서 한 트랜잭션으로 저장된다.
+    예매/취소는 STORAGE_MODE가 "journal"이면 트랜잭션 로그에 한 줄만 추가하고(fsync 1회),
+    그 외에는 바뀐 데이터 파일을 바로 다시 쓰거나 끝에 추가한다.
+    줄 번호가 바뀌는 변경(중간 삽입, 정렬)은 _rewrite로 데이터 파일 전체를 다시 쓴다.
+    """
+
+    def __init__(self, home: Path) -> None:
+        self.home = home
+        self.lines: Dict[str, List[str]] = LazyFileLines(self)
+        self.newline_at_end: Dict[str, bool] = {}  # 파일이 개행으로 끝나는지 (추가 시 빈 줄 방지)
+        self.movies: Dict[str, Movie] = {}
+        self.movie_rows: Dict[str, int] = {}
+        self.schedules: Dict[str, Schedule] = {}
+        self.schedule_rows: Dict[str, int] = {}
+        self.students: Dict[str, Student] = {}
+        self.bookings: Dict[int, Booking] = {}
+        self.student_bookings: Dict[str, set] = defaultdict(set)
+        self.schedule_bookings: Dict[str, set] = defaultdict(set)
+        self.date_intervals: Dict[str, List[Tuple[int, int, str]]] = defaultdict(list)
+        self._movie_titles: Dict[str, str] | None = None
+        self.tx: List[Tuple[str, str, int, str]] = []  # 현재 트랜잭션 (파일 이름, U/A, 줄 번호, 레코드)
+        self.dirty: set = set()                        # 트랜잭션 로그에만 반영된 데이터 파일
+        self.journal_count = 0                          # 마지막 압축 이후 로그에 쓴 트랜잭션 수
+        self.schedule_lines_sorted = False              # 상영 파일 전체(F 포함)가 고유 번호 순인지 확인했는지
+        self.signature: List[str] | None = None         # 마지막으로 읽거나 쓴 때의 데이터 파일 서명 (공유 모드)
+        self.lock_depth = 0                             # exclusive() 중첩 깊이
+
+    # ----- 적재 -----
+    def load(self, texts: Dict[str, str] | None = None) -> None:
+        """
+        (무결성 검사를 통과한) 네 데이터 파일을 읽어 캐시를 채운다.
+
+        매개변수:
+            texts: 파일 이름 → 파일 내용. verify_integrity_full이 방금 읽은 내용을 넘기면
+                   데이터 파일을 다시 읽지 않는다. (트랜잭션 로그는 이미 반영된 상태)
+        """
+        if texts is None:
+            replay_journal(self.home)
+        self.tx, self.dirty, self.journal_count = [], set(), 0
+        self.schedule_lines_sorted = False
+        self.lines = LazyFileLines(self)
+
+        def records(file_name: str, live_only: bool = True):
+            # 검사에서 읽은 내용이 있으면 그대로 쓰고, 없으면 mmap으로 유효(T) 레코드만 읽는다
+            # (이 경우 줄 리스트는 레코드를 고칠 때 LazyFileLines가 채운다)
+            if texts is None:
+                return iter_record_lines(self.home / file_name, live_only)
+            text = texts[file_name]
+            self.lines[file_name] = text.splitlines()
+            self.newline_at_end[file_name] = text.endswith("\n")
+            return enumerate(self.lines[file_name])
+
+        self.movies, self.movie_rows = {}, {}
+        for row, line in records(MOVIE_FILE):
+            movie = movie_from_line(line)
+            if movie is not None:
+                self.movies[movie.movie_id] = movie
+                self.movie_rows[movie.movie_id] = row
+
+        self.schedules, self.schedule_rows = {}, {}
+        for row, line in records(SCHEDULE_FILE):
+            schedule = schedule_from_line(line)
+            if schedule is not None:
+                self.schedules[schedule.schedule_id] = schedule
+                self.schedule_rows[schedule.schedule_id] = row
+
+        self.students = {}
+        for _, line in records(STUDENT_FILE, live_only=False):
+            student = student_from_line(line)
+            if student is not None:
+                self.students[student.student_id] = student
+
+        self.bookings = {}
+        for row, line in records(BOOKING_FILE):
+            booking = booking_from_line(line)
+            if booking is not None:
+                self.bookings[row] = booking
+
+        self._build_indexes()
+        self.signature = data_file_signature(self.home)
+
+    def _build_indexes(self) -> None:
+        """movies/schedules/bookings로부터 종료 시각과 색인(제목, 날짜별 시간, 학번/상영별 예매)을 새로 만든다."""
+        self._movie_titles = None
+        set_schedule_end_times(
+            self.schedules.values(), {movie_id: movie.running_time for movie_id, movie in self.movies.items()}
+        )
+        self.date_intervals = defaultdict(list)
+        for schedule in self.schedules.values():
+            self._index_schedule(schedule)
+
+        self.student_bookings, self.schedule_bookings = defaultdict(set), defaultdict(set)
+        for row, booking in self.bookings.items():
+            self.student_bookings[booking.student_id].add(row)
+            self.schedule_bookings[booking.schedule_id].add(row)
+
+    # ----- 영화 목록 -----
+    def movie_titles(self) -> Dict[str, str]:
+        """유효(T) 영화의 제목 → 영화 고유 번호 (영화가 바뀔 때까지 재사용)"""
+        if self._movie_titles is None:
+            self._movie_titles = {movie.movie_name: movie_id for movie_id, movie in self.movies.items()}
+        return self._movie_titles
+
+    def running_time_of(self, movie_id: str) -> int:
+        """유효(T) 영화의 러닝 타임 (영화가 없으면 0)"""
+        movie = self.movies.get(movie_id)
+        return movie.running_time if movie else 0
+
+    # ----- 상영 시간 색인 -----
+    def _schedule_interval(self, schedule: Schedule) -> Tuple[int, int, str]:
+        """상영의 (시작 분, 종료 분, 상영 고유 번호)"""
+        return schedule.start_minutes, schedule.end_minutes, schedule.schedule_id
+
+    def _index_schedule(self, schedule: Schedule) -> None:
+        """유효(T) 상영을 날짜별 시간 색인에 넣는다."""
+        insort(self.date_intervals[schedule.movie_date], self._schedule_interval(schedule))
+
+    def _unindex_schedule(self, schedule: Schedule) -> None:
+        """상영을 날짜별 시간 색인에서 뺀다."""
+        intervals = self.date_intervals[schedule.movie_date]
+        interval = self._schedule_interval(schedule)
+        i = bisect_left(intervals, interval)
+        if i < len(intervals) and intervals[i] == interval:
+            del intervals[i]
+
+    def has_time_conflict(self, scd_date: str, new_start: int, new_end: int, exclude: str | None = None) -> bool:
+        """
+        scd_date의 유효 상영 중 [new_start, new_end](분)와 겹치는 상영이 있는지 검사한다.
+        겹침 판정: newStart <= oldEnd and newEnd >= oldStart (경계가 맞닿아도 겹침)
+
+        매개변수:
+            exclude: 비교에서 제외할 상영 고유 번호 (수정 대상 자신)
+        """
+        intervals = self.date_intervals.get(scd_date)
+        if not intervals:
+            return False
+        # oldStart <= newEnd 인 상영만 후보이고, 러닝 타임이 MAX_RUNNING_TIME 이하이므로
+        # oldStart < newStart - MAX_RUNNING_TIME 인 상영은 oldEnd < newStart 라서 겹칠 수 없다
+        lo = bisect_left(intervals, (new_start - MAX_RUNNING_TIME,))
+        hi = bisect_left(intervals, (new_end + 1,))
+        for old_start, old_end, scd_id in intervals[lo:hi]:
+            if scd_id != exclude and new_start <= old_end and new_end >= old_start:
+                return True
+        return False
+
+    # ----- 예매 색인 -----
+    def _index_booking(self, row: int, booking: Booking) -> None:
+        """유효(T) 예매를 bookings와 학번/상영 색인에 등록한다."""
+        self.bookings[row] = booking
+        self.student_bookings[booking.student_id].add(row)
+        self.schedule_bookings[booking.schedule_id].add(row)
+
+    def _unindex_booking(self, row: int) -> Booking:
+        """예매를 bookings와 학번/상영 색인에서 빼고 반환한다."""
+        booking = self.bookings.pop(row)
+        self.student_bookings[booking.student_id].discard(row)
+        self.schedule_bookings[booking.schedule_id].discard(row)
+        return booking
+
+    def bookings_of_student(self, student_id: str) -> List[Tuple[int, Booking]]:
+        """학생의 유효(T) 예매 (줄 번호, 예매) 목록 (파일 순서)"""
+        return [(row, self.bookings[row]) for row in sorted(self.student_bookings.get(student_id, ()))]
+
+    def bookings_of_schedule(self, scd_id: str) -> List[Tuple[int, Booking]]:
+        """상영의 유효(T) 예매 (줄 번호, 예매) 목록 (파일 순서)"""
+        return [(row, self.bookings[row]) for row in sorted(self.schedule_bookings.get(scd_id, ()))]
+
+    # ----- 공유 모드 -----
+    def sync(self) -> bool:
+        """
+        마지막으로 읽거나 쓴 뒤 다른 프로세스가 데이터 파일을 바꿨으면 다시 적재한다. (크기/수정 시각 비교)
+        반환값: 다시 적재했으면 True
+        """
+        global LATEST_DATE_STR
+        if SHARED_MODE != "on" or self.signature == data_file_signature(self.home):
+            return False
+        self.load()
+        if LATEST_DATE_STR is not None:
+            # 다른 프로세스가 쓴 레코드까지 반영해 메타데이터 파일의 최종 작업 날짜가 줄지 않도록 한다
+            latest = load_latest_date(self.home) or scan_latest_date()
+            LATEST_DATE_STR = max(LATEST_DATE_STR, latest)
+        return True
+
+    @contextmanager
+    def exclusive(self):
+        """
+        공유 모드에서 데이터를 고치는 구간. 잠금을 잡고 다른 프로세스의 변경을 먼저 적재한 뒤 실행하고,
+        끝나면 자기가 쓴 파일의 서명을 기억한다. (중첩되면 바깥 구간의 잠금을 그대로 사용)
+        """
+        if SHARED_MODE != "on" or self.lock_depth:
+            yield
+            return
+        with data_lock(self.home):
+            self.lock_depth += 1
+            try:
+                self.sync()
+                yield
+            finally:
+                self.lock_depth -= 1
+                self.signature = data_file_signature(self.home)
+
+    # ----- 파일 쓰기 -----
+    def _update(self, file_name: str, row: int, record: str) -> None:
+        """row번째 레코드를 교체한다. (_commit에서 저장)"""
+        self.lines[file_name][row] = record
+        self.tx.append((file_name, "U", row, record))
+
+    def _add(self, file_name: str, record: str) -> int:
+        """레코드를 끝에 추가하고 그 줄 번호를 반환한다. (_commit에서 저장)"""
+        lines = self.lines[file_name]
+        lines.append(record)
+        self.tx.append((file_name, "A", len(lines) - 1, record))
+        return len(lines) - 1
+
+    def _commit(self, journal: bool = False) -> None:
+        """
+        현재 트랜잭션의 변경을 저장한다.
+
+        매개변수:
+            journal: bool - True이고 저널 저장 모드이면 트랜잭션 로그에만 기록 (예매/취소)
+        """
+        tx, self.tx = self.tx, []
+        if not tx:
+            return
+        self._note_latest_date(record for _, _, _, record in tx)
+
+        if journal and STORAGE_MODE == "journal" and SHARED_MODE != "on":
+            self._append_to_journal("\t".join(f"{file_name}/{op}/{row}/{record}" for file_name, op, row, record in tx))
+            self.dirty.update(file_name for file_name, _, _, _ in tx)
+            self.journal_count += 1
+            if COMPACT_INTERVAL > 0 and self.journal_count >= COMPACT_INTERVAL:
+                self.compact()
+            else:
+                self._save_latest_date()
+            return
+
+        # 줄이 바뀐 파일(로그에만 반영된 파일 포함)은 전체를 다시 쓰고, 추가만 있는 파일은 끝에 이어 쓴다
+        rewritten = {file_name for file_name, op, _, _ in tx if op == "U" or file_name in self.dirty}
+        for file_name, op, _, record in tx:
+            if op == "A" and file_name not in rewritten:
+                self._append_to_file(file_name, record)
+        self.dirty.update(rewritten)
+        if self.dirty:
+            self.compact()
+        else:
+            self._save_latest_date()
+
+    def _note_latest_date(self, records) -> None:
+        """새로 쓴 레코드의 타임 스탬프(마지막 10자)로 최종 작업 날짜를 갱신한다."""
+        global LATEST_DATE_STR
+        if LATEST_DATE_STR is not None:
+            LATEST_DATE_STR = max([LATEST_DATE_STR, *(record[-10:] for record in records)])
+
+    def _save_latest_date(self) -> None:
+        """
+        데이터 파일을 고친 뒤 메타데이터 파일을 갱신한다.
+        최종 작업 날짜를 아직 모르면(init_latest_date 이전) 쓰지 않는다. (서명이 맞지 않아 다음에 전체 검색)
+        """
+        if LATEST_DATE_STR is not None:
+            save_latest_date(self.home, LATEST_DATE_STR)
+
+    def _append_to_journal(self, entry: str) -> None:
+        """트랜잭션 로그 끝에 트랜잭션 한 줄을 추가하고 fsync한다."""
+        with (self.home / JOURNAL_FILE).open("a", encoding="utf-8", newline="\n") as f:
+            f.write(entry + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _append_to_file(self, file_name: str, record: str) -> None:
+        """데이터 파일 끝에 레코드 한 줄을 이어 쓴다."""
+        path = self.home / file_name
+        with path.open("a", encoding="utf-8", newline="\n") as f:
+            if f.tell() > 0 and not self.newline_at_end[file_name]:
+                f.write(f"\n{record}")
+            else:
+                f.write(record)
+        self.newline_at_end[file_name] = False
+
+    def _rewrite(self, file_name: str, *records: str) -> None:
+        """
+        줄 번호가 바뀐 데이터 파일을 (로그에 남은 변경과 함께) 다시 쓴다.
+        records: 새로 쓰거나 고친 레코드 (최종 작업 날짜 갱신용)
+        """
+        self._note_latest_date(records)
+        self.dirty.add(file_name)
+        self.compact()
+
+    def compact(self) -> None:
+        """트랜잭션 로그에만 반영된 변경을 데이터 파일에 원자적으로 다시 쓰고 로그를 비운다."""
+        if not self.dirty and not self.journal_count:
+            return
+        for file_name in sorted(self.dirty):
+            write_file_atomic(self.home / file_name, "\n".join(self.lines[file_name]))
+            self.newline_at_end[file_name] = False
+        self.dirty.clear()
+        if self.journal_count:
+            (self.home / JOURNAL_FILE).unlink(missing_ok=True)
+            self.journal_count = 0
+        self._save_latest_date()
+
+    def _insert_schedule_line(self, record: str) -> None:
+        """
+        상영 레코드를 상영 고유 번호 순서에 맞는 줄에 끼워 넣는다. (self.schedules에는 이미 추가된 상태)
+
+        무결성 검사는 유효(T) 레코드의 정렬만 보장하므로, 처음 한 번은 F 레코드까지 정렬되어 있는지 확인해
+        아니면 전체를 정렬한다. 그 뒤로는 파일이 정렬된 상태로 유지되므로 이분 탐색으로 위치를 찾고,
+        끼운 줄 뒤의 줄 번호만 한 칸씩 민다. (같은 고유 번호의 F 레코드가 있으면 그 뒤에 넣는다)
+        """
+        lines = self.lines[SCHEDULE_FILE]
+        scd_id = record[:12]
+        if not self.schedule_lines_sorted:
+            if any(lines[i][:12] > lines[i + 1][:12] for i in range(len(lines) - 1)):
+                lines.append(record)
+                lines.sort(key=lambda x: x[:12])
+                self.schedule_rows = {}
+                for row, line in enumerate(lines):
+                    parts = line.split("/")
+                    if len(parts) == 7 and parts[5] == "T":
+                        self.schedule_rows[parts[0]] = row
+                self.schedules = {key: self.schedules[key] for key in self.schedule_rows}
+                self.schedule_lines_sorted = True
+                return
+            self.schedule_lines_sorted = True
+
+        lo, hi = 0, len(lines)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if lines[mid][:12] <= scd_id:
+                lo = mid + 1
+            else:
+                hi = mid
+        lines.insert(lo, record)
+
+        shifted = False
+        for other_id, other_row in self.schedule_rows.items():
+            if other_row >= lo:
+                self.schedule_rows[other_id] = other_row + 1
+                shifted = True
+        self.schedule_rows[scd_id] = lo
+        if shifted:
+            # 뒤에 더 큰 고유 번호의 상영이 있으면 상영 순서를 맞춘다 (거의 정렬된 상태라 선형 시간)
+            self.schedules = {key: self.schedules[key] for key in sorted(self.schedules)}
+
+    # ----- 학생 -----
+    @shared_write
+    def add_student(self, student_id: str, password: str) -> bool:
+        """
+        신규 학생 레코드를 추가한다.
+        반환값: 추가했으면 True, 그 학번이 이미 있으면(공유 모드에서 다른 단말기가 먼저 가입) False
+        """
+        if student_id in self.students:
+            return False
+        student = Student()
+        student.student_id = student_id
+        student.password = password
+        student.timestamp = CURRENT_DATE_STR
+        self._add(STUDENT_FILE, student_to_line(student))
+        self._commit()
+        self.students[student_id] = student
+        record_change("student", student_id)
+        return True
+
+    # ----- 예매 -----
+    @shared_write
+    def book(self, student_id: str, scd_id: str, seats: int, defer: bool = False) -> Booking | None:
+        """
+        상영의 좌석 유무 벡터에 예매 좌석을 반영하고 예매 레코드를 추가한다.
+        좌석을 비교한 뒤 쓰므로(compare-and-set), 그 사이 다른 단말기가 같은 좌석을 예매했으면 쓰지 않는다.
+
+        매개변수:
+            student_id: str   - 예매하는 학번
+            scd_id: str       - 상영 고유 번호
+            seats: int        - 이번 예매의 좌석 비트마스크 (선택한 좌석만 1)
+            defer: bool       - True이면 저장을 미루고 flush()에서 다른 예매와 함께 저장 (공유 모드에서는 무시)
+
+        반환값:
+            Booking - 추가한 예매
+            None    - 상영이 없어졌거나 좌석 중 하나라도 이미 예매된 경우
+        """
+        schedule = self.schedules.get(scd_id)
+        if schedule is None or schedule.seats_vector & seats:
+            return None
+        schedule.seats_vector |= seats
+        schedule.time_stamp = CURRENT_DATE_STR
+        self._update(SCHEDULE_FILE, self.schedule_rows[scd_id], schedule_to_line(schedule))
+
+        booking = Booking()
+        booking.student_id = student_id
+        booking.schedule_id = scd_id
+        booking.seats = seats
+        booking.timestamp = CURRENT_DATE_STR
+        row = self._add(BOOKING_FILE, booking_to_line(booking))
+        if not defer or SHARED_MODE == "on":
+            self._commit(journal=True)
+        self._index_booking(row, booking)
+        record_change("booking", scd_id)
+        return booking
+
+    @shared_write
+    def book_batch(self, entries: List[Tuple[str, str, int]]) -> List[str]:
+        """
+        여러 예매를 한꺼번에 검사하고 한 트랜잭션으로 저장한다. (단체/대량 예매, 인원 제한 없음)
+        모든 예매를 메모리의 좌석 유무 벡터와 (그리고 같은 묶음의 다른 예매와) 대조해
+        하나라도 문제가 있으면 아무것도 쓰지 않는다.
+
+        매개변수:
+            entries: (학번, 상영 고유 번호, 좌석 비트마스크) 목록
+
+        반환값:
+            List[str] - 오류 목록 ("<순번>: <사유>", 순번은 1부터). 비어 있으면 모두 예매됨
+        """
+        errors: List[str] = []
+        taken: Dict[str, int] = {}  # 상영 고유 번호 → 기존 좌석 + 이 묶음에서 앞서 예매한 좌석
+        for i, (student_id, scd_id, seats) in enumerate(entries, start=1):
+            schedule = self.schedules.get(scd_id)
+            if student_id not in self.students:
+                errors.append(f"{i}: 존재하지 않는 학번입니다. ({student_id})")
+            elif schedule is None or (CURRENT_DATE_STR is not None and schedule.movie_date <= CURRENT_DATE_STR):
+                errors.append(f"{i}: 예매할 수 없는 상영입니다. ({scd_id})")
+            elif not 0 < seats < (1 << SEAT_COUNT):
+                errors.append(f"{i}: 올바르지 않은 좌석입니다.")
+            else:
+                occupied = taken.get(scd_id, schedule.seats_vector)
+                if occupied & seats:
+                    errors.append(f"{i}: 이미 예매된 좌석입니다. ({' '.join(vector_to_seats(occupied & seats))})")
+                taken[scd_id] = occupied | seats
+        if errors:
+            return errors
+
+        for student_id, scd_id, seats in entries:
+            booking = Booking()
+            booking.student_id = student_id
+            booking.schedule_id = scd_id
+            booking.seats = seats
+            booking.timestamp = CURRENT_DATE_STR
+            row = self._add(BOOKING_FILE, booking_to_line(booking))
+            self._index_booking(row, booking)
+        for scd_id, occupied in taken.items():
+            schedule = self.schedules[scd_id]
+            schedule.seats_vector = occupied
+            schedule.time_stamp = CURRENT_DATE_STR
+            self._update(SCHEDULE_FILE, self.schedule_rows[scd_id], schedule_to_line(schedule))
+        self._commit(journal=True)
+        for scd_id in taken:
+            record_change("booking", scd_id)
+        return []
+
+    def flush(self) -> None:
+        """book(defer=True)로 미뤄 둔 예매들을 한 트랜잭션으로 저장한다. (저널 저장 모드면 로그 한 줄, fsync 1회)"""
+        self._commit(journal=True)
+
+    def find_booking(self, student_id: str, scd_id: str, seats: int) -> int | None:
+        """
+        학생의 그 상영, 그 좌석 유효 예매의 줄 번호 (없으면 None)
+        한 상영의 유효 예매끼리는 좌석이 겹치지 않으므로 (학번, 상영, 좌석)은 예매 하나를 가리킨다.
+        """
+        for row in self.student_bookings.get(student_id, ()):
+            booking = self.bookings[row]
+            if booking.schedule_id == scd_id and booking.seats == seats:
+                return row
+        return None
+
+    @shared_write
+    def cancel(self, student_id: str, scd_id: str, seats: int, row: int | None = None) -> bool:
+        """
+        예매를 취소한다. (예매 레코드 T → F, 상영의 좌석 유무 벡터에서 해당 좌석 해제)
+        잠금 안에서 다시 적재한 예매가 취소하려던 예매와 같은지 확인한 뒤 쓴다. (compare-and-set)
+        줄 번호는 다른 단말기의 보관(archive_inactive) 등으로 바뀔 수 있으므로
+        row의 예매가 다르면 (학번, 상영, 좌석)으로 다시 찾는다.
+
+        매개변수:
+            student_id: str   - 예매한 학번
+            scd_id: str       - 상영 고유 번호
+            seats: int        - 그 예매의 좌석 비트마스크
+            row: int | None   - 예매를 조회할 때의 줄 번호 (bookings의 키, 없으면 찾아서 사용)
+
+        반환값: 취소했으면 True, 그 예매가 없는 경우(공유 모드에서 다른 단말기가 취소) False
+        """
+        booking = self.bookings.get(row)
+        if booking is None or (booking.student_id, booking.schedule_id, booking.seats) != (student_id, scd_id, seats):
+            row = self.find_booking(student_id, scd_id, seats)
+            if row is None:
+                return False
+        booking = self._unindex_booking(row)
+        booking.timestamp = CURRENT_DATE_STR
+        self._update(BOOKING_FILE, row, booking_to_line(booking, "F"))
+
+        schedule = self.schedules[booking.schedule_id]
+        schedule.seats_vector &= ~booking.seats
+        schedule.time_stamp = CURRENT_DATE_STR
+        self._update(SCHEDULE_FILE, self.schedule_rows[booking.schedule_id], schedule_to_line(schedule))
+        self._commit(journal=True)
+        record_change("booking", booking.schedule_id)
+        return True
+
+    @shared_write
+    def deactivate_zero_seat_bookings(self, scd_ids: set | None = None) -> None:
+        """
+        좌석이 하나도 없는 예매 레코드의 유효 여부를 F로 바꾼다. (remove_zero_seat_bookings와 동일한 규칙)
+
+        매개변수:
+            scd_ids: 이 상영들의 예매만 확인 (None이면 전체 예매)
+        """
+        if scd_ids is None:
+            candidates = self.bookings.items()
+        else:
+            candidates = [item for scd_id in scd_ids for item in self.bookings_of_schedule(scd_id)]
+        rows = [row for row, booking in candidates if not booking.seats]
+        if not rows:
+            return
+        for row in sorted(rows):
+            booking = self._unindex_booking(row)
+            booking.timestamp = CURRENT_DATE_STR or "1582-10-15"
+            self._update(BOOKING_FILE, row, booking_to_line(booking, "F"))
+        self._commit()
+        warn("예매 데이터 파일에 무의미한 예매 레코드가 존재합니다. 해당 예매 레코드를 삭제합니다.")
+
+    # ----- 영화 -----
+    @shared_write
+    def add_movie(self, movie_title: str, running_time: int) -> str:
+        """비어 있는 가장 작은 영화 고유 번호로 영화 레코드를 추가하고 그 번호를 반환한다."""
+        current_ids = {int(movie_id) for movie_id in self.movies}
+        movie_id = 1
+        while movie_id in current_ids:
+            movie_id += 1
+
+        movie = Movie()
+        movie.movie_id = f"{movie_id:04d}"
+        movie.movie_name = movie_title
+        movie.running_time = running_time
+        movie.time_stamp = CURRENT_DATE_STR
+        self.movie_rows[movie.movie_id] = self._add(MOVIE_FILE, movie_to_line(movie))
+        self._commit()
+        self.movies[movie.movie_id] = movie
+        self._movie_titles = None
+        record_change("movie", movie.movie_id)
+        return movie.movie_id
+
+    @shared_write
+    def modify_movie(self, movie_id: str, movie_title: str | None, running_time: int | None) -> None:
+        """기존 영화 레코드를 F로 바꾸고, 바로 다음 줄에 수정된 T 레코드를 추가한다."""
+        row = self.movie_rows.get(movie_id)
+        if row is None:
+            return
+        lines = self.lines[MOVIE_FILE]
+        old = self.movies[movie_id]
+
+        # 기존 레코드는 유효 여부만 F로 바꾼다 (타임 스탬프 유지)
+        lines[row] = movie_to_line(old, "F")
+
+        movie = Movie()
+        movie.movie_id = movie_id
+        movie.movie_name = movie_title if movie_title is not None else old.movie_name
+        movie.running_time = running_time if running_time is not None else old.running_time
+        movie.time_stamp = CURRENT_DATE_STR
+        lines.insert(row + 1, movie_to_line(movie))
+
+        # 삽입 위치 뒤의 줄 번호를 한 칸씩 민다
+        for other_id, other_row in self.movie_rows.items():
+            if other_row > row:
+                self.movie_rows[other_id] = other_row + 1
+        self.movie_rows[movie_id] = row + 1
+        self.movies[movie_id] = movie
+        self._movie_titles = None
+        if movie.running_time != old.running_time:
+            # 이 영화를 상영하는 유효 상영의 종료 시각과 시간 색인을 다시 계산
+            for schedule in self.schedules.values():
+                if schedule.movie_id == movie_id:
+                    self._unindex_schedule(schedule)
+                    schedule.end_minutes = schedule.start_minutes + movie.running_time
+                    self._index_schedule(schedule)
+        self._rewrite(MOVIE_FILE, lines[row], lines[row + 1])
+        record_change("movie", movie_id)
+
+    @shared_write
+    def delete_movie(self, movie_id: str) -> None:
+        """영화 레코드의 유효 여부를 F로 바꾸고 타임 스탬프를 갱신한다."""
+        row = self.movie_rows.pop(movie_id, None)
+        if row is None:
+            return
+        movie = self.movies.pop(movie_id)
+        self._movie_titles = None
+        movie.time_stamp = CURRENT_DATE_STR
+        self._update(MOVIE_FILE, row, movie_to_line(movie, "F"))
+        self._commit()
+        record_change("movie", movie_id)
+
+    # ----- 상영 -----
+    @shared_write
+    def add_schedule(self, movie_id: str, scd_date: str, scd_time: str) -> str:
+        """빈 좌석 벡터로 상영 레코드를 추가하고 상영 고유 번호를 반환한다."""
+        schedule = Schedule()
+        schedule.schedule_id = scd_date.replace("-", "") + scd_time.replace(":", "")
+        schedule.movie_id = movie_id
+        schedule.movie_date = scd_date
+        schedule.movie_start_time = scd_time
+        schedule.seats_vector = 0
+        schedule.time_stamp = CURRENT_DATE_STR
+        schedule.start_minutes = time_to_minutes(scd_time)
+        schedule.end_minutes = schedule.start_minutes + self.running_time_of(schedule.movie_id)
+        self.schedules[schedule.schedule_id] = schedule
+        self._index_schedule(schedule)
+        record = schedule_to_line(schedule)
+        self._insert_schedule_line(record)
+        self._rewrite(SCHEDULE_FILE, record)
+        record_change("schedule", schedule.schedule_id)
+        return schedule.schedule_id
+
+    @shared_write
+    def move_schedule(self, scd_id: str, scd_date: str, scd_time: str) -> str | None:
+        """
+        상영 날짜/시작 시간 수정 (Soft Update).
+        기존 레코드를 F로 바꾸고 새 날짜/시간의 레코드를 추가한 뒤 새 상영 고유 번호를 반환한다.
+        """
+        row = self.schedule_rows.pop(scd_id, None)
+        if row is None:
+            return None
+        old = self.schedules.pop(scd_id)
+        self._unindex_schedule(old)
+        old.time_stamp = CURRENT_DATE_STR
+        # 정렬 삽입 후 파일 전체를 다시 쓰므로 트랜잭션에 남기지 않고 바로 교체
+        old_record = schedule_to_line(old, "F")
+        self.lines[SCHEDULE_FILE][row] = old_record
+
+        schedule = Schedule()
+        schedule.schedule_id = scd_date.replace("-", "") + scd_time.replace(":", "")
+        schedule.movie_id = old.movie_id
+        schedule.movie_date = scd_date
+        schedule.movie_start_time = scd_time
+        schedule.seats_vector = 0
+        schedule.time_stamp = CURRENT_DATE_STR
+        schedule.start_minutes = time_to_minutes(scd_time)
+        schedule.end_minutes = schedule.start_minutes + self.running_time_of(schedule.movie_id)
+        self.schedules[schedule.schedule_id] = schedule
+        self._index_schedule(schedule)
+        record = schedule_to_line(schedule)
+        self._insert_schedule_line(record)
+        self._rewrite(SCHEDULE_FILE, old_record, record)
+        record_change("schedule", scd_id)
+        record_change("schedule", schedule.schedule_id)
+        return schedule.schedule_id
+
+    @shared_write
+    def delete_schedule(self, scd_id: str) -> None:
+        """상영 레코드의 유효 여부를 F로 바꾸고 타임 스탬프를 갱신한다."""
+        row = self.schedule_rows.pop(scd_id, None)
+        if row is None:
+            return
+        schedule = self.schedules.pop(scd_id)
+        self._unindex_schedule(schedule)
+        schedule.time_stamp = CURRENT_DATE_STR
+        self._update(SCHEDULE_FILE, row, schedule_to_line(schedule, "F"))
+        self._commit()
+        record_change("schedule", scd_id)
+
+    # ----- 데이터 정리 -----
+    @shared_write
+    def archive_inactive(self, before_date: str) -> Dict[str, int]:
+        """
+        무효(F) 레코드와 before_date보다 이전 날짜의 상영(그 상영의 예매 포함)을
+        보관 디렉터리(ARCHIVE_DIR)의 월별 보관 파일로 옮기고 데이터 파일을 다시 쓴다.
+        보관 파일 이름은 <데이터 파일 이름>-YYYY-MM.txt 이며 월은 레코드의 타임 스탬프 기준이다.
+        (보관 파일도 scan_latest_date가 읽으므로 최종 작업 날짜는 바뀌지 않는다)
+
+        남는 레코드는 그대로 무결성 검사를 통과한다. (지난 상영과 그 예매를 함께 옮기므로
+        참조/좌석 일치 규칙이 유지되고, 정렬된 상영 파일에서 줄을 빼도 정렬은 유지된다)
+
+        반환값:
+            Dict[str, int] - 데이터 파일 이름 → 옮긴 레코드 수 (옮긴 것이 없는 파일은 제외)
+        """
+        self.compact()
+        past = {scd_id for scd_id, sch in self.schedules.items() if sch.movie_date < before_date}
+
+        def archived(file_name: str, line: str) -> bool:
+            parts = line.split("/")
+            if parts[-2] == "F":
+                return True
+            if file_name == SCHEDULE_FILE:
+                return parts[0] in past
+            if file_name == BOOKING_FILE:
+                return parts[1] in past
+            return False
+
+        # 보관 파일에 먼저 기록(fsync)한 뒤 데이터 파일을 교체하므로 중간에 중단되어도 레코드를 잃지 않는다
+        moved: Dict[str, int] = {}
+        kept: Dict[str, List[str]] = {}
+        archive_dir = self.home / ARCHIVE_DIR
+        for file_name in (BOOKING_FILE, SCHEDULE_FILE, MOVIE_FILE):
+            keep: List[str] = []
+            by_month: Dict[str, List[str]] = defaultdict(list)
+            for line in self.lines[file_name]:
+                if archived(file_name, line):
+                    by_month[line[-10:-3]].append(line)
+                else:
+                    keep.append(line)
+            if not by_month:
+                continue
+            archive_dir.mkdir(exist_ok=True)
+            for month, records in sorted(by_month.items()):
+                archive_path = archive_dir / f"{Path(file_name).stem}-{month}.txt"
+                with archive_path.open("a", encoding="utf-8", newline="\n") as f:
+                    f.write("".join(record + "\n" for record in records))
+                    f.flush()
+                    os.fsync(f.fileno())
+            kept[file_name] = keep
+            moved[file_name] = len(self.lines[file_name]) - len(keep)
+
+        for file_name, keep in kept.items():
+            write_file_atomic(self.home / file_name, "\n".join(keep))
+        if moved:
+            self._save_latest_date()
+            self.load()  # 줄 번호가 바뀌었으므로 다시 적재
+        return moved
+
+
+def load_store(texts: Dict[str, str] | None = None) -> DataStore:
+    """
+    데이터 파일을 읽어 전역 저장소(STORE)를 새로 만든다.
+
+    매개변수:
+        texts: 무결성 검사에서 이미 읽은 파일 내용 (있으면 파일을 다시 읽지 않음)
+    """
+    global STORE
+    STORE = DataStore(home_path())
+    STORE.load(texts)
+    return STORE
+
+
+def compact_store() -> None:
+    """
+    프로그램 종료 시 트랜잭션 로그에만 있는 변경을 데이터 파일에 반영한다.
+    스냅샷 모드이고 마지막 무결성 검사 이후 변경이 없으면 스냅샷도 새로 저장한다.
+    """
+    if STORE is not None:
+        STORE.compact()
+        if SNAPSHOT_MODE == "on" and VERIFIED_CLEAN:
+            save_snapshot(STORE)
+
+
+atexit.register(compact_store)
+
+
+############################################################
+####################### 이진 스냅샷 ##########################
+############################################################
+# 파일 구조 (리틀 엔디언, struct)
+#   헤더     : 매직 b"KUCS", 버전
+#   파일 서명 : 영화/상영/학생/예매 데이터 파일 각각 (크기, 수정 시각(ns), SHA-256)
+#   개수     : 영화, 상영, 학생, 예매 레코드 수
+#   레코드   : 유효(T) 영화(뒤에 UTF-8 제목), 상영(좌석 비트마스크), 학생, 예매 (줄 번호 포함)
+SNAPSHOT_MAGIC = b"KUCS"
+SNAPSHOT_VERSION = 1
+SNAPSHOT_DATA_FILES = (MOVIE_FILE, SCHEDULE_FILE, STUDENT_FILE, BOOKING_FILE)
+SNAP_HEADER = struct.Struct("<4sH")
+SNAP_FILE_SIG = struct.Struct("<QQ32s")
+SNAP_COUNTS = struct.Struct("<IIII")
+SNAP_MOVIE = struct.Struct("<4sHI10sH")            # 고유 번호, 러닝 타임, 줄 번호, 타임 스탬프, 제목 바이트 수
+SNAP_SCHEDULE = struct.Struct("<12s4s10s5sII10s")  # 고유 번호, 영화 고유 번호, 날짜, 시작 시간, 좌석, 줄 번호, 타임 스탬프
+SNAP_STUDENT = struct.Struct("<2s4s10s")           # 학번, 비밀번호, 타임 스탬프
+SNAP_BOOKING = struct.Struct("<2s12sII10s")        # 학번, 상영 고유 번호, 좌석, 줄 번호, 타임 스탬프
+# 수정 시각이 이보다 최근인 파일은 같은 시각 안에 다시 바뀔 수 있으므로 수정 시각을 믿지 않고 해시로 비교
+SNAPSHOT_MTIME_GRACE_NS = 2_000_000_000
+
+
+def _file_digest(path: Path) -> bytes:
+    """데이터 파일 내용의 SHA-256"""
+    return hashlib.sha256(path.read_bytes()).digest()
+
+
+def save_snapshot(store: DataStore) -> None:
+    """
+    (무결성 검사를 통과한) 저장소를 이진 스냅샷으로 저장한다.
+    데이터 파일의 크기/수정 시각/해시를 함께 기록해 다음 실행 때 파일이 그대로인지 확인한다.
+    """
+    with store.exclusive():  # 공유 모드: 다른 단말기의 변경을 먼저 적재하고 그동안 파일이 바뀌지 않게 한다
+        store.compact()  # 스냅샷 내용과 데이터 파일 내용을 일치시킨다
+        _write_snapshot(store)
+
+
+def _write_snapshot(store: DataStore) -> None:
+    """save_snapshot 본체 (데이터 파일 서명과 레코드를 묶어 SNAPSHOT_FILE로 저장)"""
+    now_ns = time.time_ns()
+    parts: List[bytes] = [SNAP_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION)]
+    for file_name in SNAPSHOT_DATA_FILES:
+        path = store.home / file_name
+        stat = path.stat()
+        mtime_ns = stat.st_mtime_ns if now_ns - stat.st_mtime_ns > SNAPSHOT_MTIME_GRACE_NS else 0
+        parts.append(SNAP_FILE_SIG.pack(stat.st_size, mtime_ns, _file_digest(path)))
+
+    parts.append(SNAP_COUNTS.pack(len(store.movies), len(store.schedules), len(store.students), len(store.bookings)))
+    for movie_id, movie in store.movies.items():
+        name = movie.movie_name.encode("utf-8")
+        parts.append(SNAP_MOVIE.pack(
+            movie_id.encode(), movie.running_time, store.movie_rows[movie_id], movie.time_stamp.encode(), len(name)
+        ))
+        parts.append(name)
+    for scd_id, sch in store.schedules.items():
+        parts.append(SNAP_SCHEDULE.pack(
+            scd_id.encode(), sch.movie_id.encode(), sch.movie_date.encode(), sch.movie_start_time.encode(),
+            sch.seats_vector, store.schedule_rows[scd_id], sch.time_stamp.encode(),
+        ))
+    for student in store.students.values():
+        parts.append(SNAP_STUDENT.pack(student.student_id.encode(), student.password.encode(), student.timestamp.encode()))
+    for row, booking in store.bookings.items():
+        parts.append(SNAP_BOOKING.pack(
+            booking.student_id.encode(), booking.schedule_id.encode(), booking.seats, row, booking.timestamp.encode()
+        ))
+
+    write_file_atomic(store.home / SNAPSHOT_FILE, b"".join(parts))
+
+
+def _read_snapshot(home: Path, buf: mmap.mmap) -> DataStore | None:
+    """mmap한 스냅샷을 DataStore로 만든다. 데이터 파일이 스냅샷 이후 바뀌었으면 None"""
+    magic, version = SNAP_HEADER.unpack_from(buf, 0)
+    if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+        return None
+    offset = SNAP_HEADER.size
+
+    for file_name in SNAPSHOT_DATA_FILES:
+        size, mtime_ns, digest = SNAP_FILE_SIG.unpack_from(buf, offset)
+        offset += SNAP_FILE_SIG.size
+        path = home / file_name
+        stat = path.stat()
+        if stat.st_size != size:
+            return None
+        if stat.st_mtime_ns != mtime_ns and _file_digest(path) != digest:
+            return None
+
+    n_movies, n_schedules, n_students, n_bookings = SNAP_COUNTS.unpack_from(buf, offset)
+    offset += SNAP_COUNTS.size
+    store = DataStore(home)
+
+    for _ in range(n_movies):
+        movie_id, running_time, row, time_stamp, name_len = SNAP_MOVIE.unpack_from(buf, offset)
+        offset += SNAP_MOVIE.size
+        m = Movie()
+        m.movie_id = movie_id.decode()
+        m.movie_name = buf[offset:offset + name_len].decode("utf-8")
+        m.running_time = running_time
+        m.time_stamp = time_stamp.decode()
+        offset += name_len
+        store.movies[m.movie_id] = m
+        store.movie_rows[m.movie_id] = row
+
+    end = offset + n_schedules * SNAP_SCHEDULE.size
+    for scd_id, movie_id, movie_date, start, seats, row, time_stamp in SNAP_SCHEDULE.iter_unpack(buf[offset:end]):
+        s = Schedule()
+        s.schedule_id = scd_id.decode()
+        s.movie_id = movie_id.decode()
+        s.movie_date = movie_date.decode()
+        s.movie_start_time = start.decode()
+        s.seats_vector = seats
+        s.time_stamp = time_stamp.decode()
+        s.start_minutes = time_to_minutes(s.movie_start_time)
+        store.schedules[s.schedule_id] = s
+        store.schedule_rows[s.schedule_id] = row
+    offset = end
+
+    end = offset + n_students * SNAP_STUDENT.size
+    for student_id, password, timestamp in SNAP_STUDENT.iter_unpack(buf[offset:end]):
+        student = Student()
+        student.student_id = student_id.decode()
+        student.password = password.decode()
+        student.timestamp = timestamp.decode()
+        store.students[student.student_id] = student
+    offset = end
+
+    end = offset + n_bookings * SNAP_BOOKING.size
+    for student_id, schedule_id, seats, row, timestamp in SNAP_BOOKING.iter_unpack(buf[offset:end]):
+        booking = Booking()
+        booking.student_id = student_id.decode()
+        booking.schedule_id = schedule_id.decode()
+        booking.seats = seats
+        booking.timestamp = timestamp.decode()
+        store.bookings[row] = booking
+    if end != len(buf):
+        return None
+
+    store._build_indexes()
+    store.signature = data_file_signature(home)
+    return store
+
+
+def load_snapshot_store() -> DataStore | None:
+    """
+    데이터 파일이 마지막 스냅샷 저장 때와 같으면 스냅샷을 mmap으로 읽어 전역 저장소(STORE)를 만든다.
+
+    반환값:
+        DataStore - 스냅샷을 사용한 경우
+        None      - 스냅샷이 없거나, 손상되었거나, 데이터 파일이 바뀐 경우 (전체 검사 필요)
+    """
+    global STORE
+    path = home_path() / SNAPSHOT_FILE
+    try:
+        with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            store = _read_snapshot(home_path(), buf)
+    except (OSError, ValueError, struct.error, UnicodeDecodeError):
+        return None
+    if store is not None:
+        STORE = store
+    return store
 
-  
 
 # ---------------------------------------------------------------
 # 파일/환경 준비
@@ -1539,7 +2775,59 @@ def home_path() -> Path:
 # ---------------------------------------------------------------
 # 날짜(6.1) — 문법/의미 검증
 # ---------------------------------------------------------------
+def data_file_signature(home: Path) -> List[str]:
+    """네 데이터 파일의 "<파일 이름>/<크기>/<수정 시각(ns)>" 목록 (메타데이터 파일의 최신 여부 판단용)"""
+    signature = []
+    for file_name in (MOVIE_FILE, SCHEDULE_FILE, STUDENT_FILE, BOOKING_FILE):
+        stat = (home / file_name).stat()
+        signature.append(f"{file_name}/{stat.st_size}/{stat.st_mtime_ns}")
+    return signature
+
+
+def save_latest_date(home: Path, latest: str) -> None:
+    """
+    최종 작업 날짜와 현재 데이터 파일 서명을 메타데이터 파일(META_FILE)에 쓴다.
+    메타데이터 파일은 다시 구할 수 있는 값이므로 fsync하지 않는다. (잘리거나 없으면 전체 검색으로 복구)
+    """
+    path = home / META_FILE
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text("\n".join([f"latest/{latest}", *data_file_signature(home)]) + "\n", encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def load_latest_date(home: Path) -> str | None:
+    """
+    메타데이터 파일의 최종 작업 날짜를 반환한다.
+    파일이 없거나, 형식이 맞지 않거나, 기록 이후 데이터 파일이 바뀌었으면 None
+    """
+    try:
+        lines = (home / META_FILE).read_text(encoding="utf-8").splitlines()
+        signature = data_file_signature(home)
+    except (OSError, UnicodeDecodeError):
+        return None
+    if not lines or not lines[0].startswith("latest/"):
+        return None
+    latest = lines[0][len("latest/"):]
+    if not RE_DATE.fullmatch(latest) or lines[1:] != signature:
+        return None
+    return latest
+
+
 def init_latest_date() -> str:
+    """
+    최종 작업 날짜를 반환하는 함수
+    데이터 파일을 고치는 모든 경로가 메타데이터 파일(META_FILE)을 함께 갱신하므로 보통은 그 값을 쓰고,
+    메타데이터 파일이 없거나 오래되었으면(외부 수정, 비정상 종료 후 복구 등) 전체 검색으로 다시 구한다.
+    반환값: str (최종 작업 날짜)
+    """
+    latest = load_latest_date(home_path())
+    if latest is None:
+        latest = scan_latest_date()
+        save_latest_date(home_path(), latest)
+    return latest
+
+
+def scan_latest_date() -> str:
     """
     모든 데이터 파일을 읽어 가장 최근의 타임스탬프를 반환하는 함수
     반환값: str (최종 작업 날짜)
@@ -1552,8 +2840,9 @@ def init_latest_date() -> str:
     schedule_path = home_path() / SCHEDULE_FILE
     student_path = home_path() / STUDENT_FILE
     booking_path = home_path() / BOOKING_FILE    
-    # 읽어야 할 파일 목록 정의
+    # 읽어야 할 파일 목록 정의 (데이터 정리로 옮긴 레코드의 보관 파일 포함)
     target_files = [movie_path, schedule_path, student_path, booking_path]
+    target_files += sorted((home_path() / ARCHIVE_DIR).glob("*.txt"))
     
     # 2. 영화, 상영, 학생, 예매 데이터 파일을 각각 한 레코드씩 읽는다.
     for filename in target_files:
@@ -1589,6 +2878,21 @@ def init_latest_date() -> str:
     # 4. latest가 None이 아닌 경우, latest를 반환한다.
     return latest
 
+def validate_current_date(s: str) -> str | None:
+    """
+    내부 현재 날짜로 쓸 수 있는지 검사한다. (prompt_input_date와 같은 규칙, 헤드리스 실행용)
+    반환값: 문제가 있으면 사유, 없으면 None
+    """
+    if not RE_DATE.fullmatch(s):
+        return "날짜 형식이 맞지 않습니다."
+    try:
+        date(int(s[0:4]), int(s[5:7]), int(s[8:10]))
+    except ValueError:
+        return "존재하지 않는 날짜입니다."
+    if s < LATEST_DATE_STR:
+        return f"최종 작업 날짜({LATEST_DATE_STR}) 전의 날짜입니다."
+    return None
+
 def prompt_input_date() -> str:
     """6.1 날짜 입력 프롬프트"""
     global LATEST_DATE_STR, LOGGED_IN_SID
@@ -1650,24 +2954,23 @@ def prompt_password_existing(expected_pw: str) -> bool:
         # 정상
         return True
 
-def prompt_password_new(student_path: Path, sid: str, students: Dict[str, str]) -> None:
-    """6.2.4 신규 회원: 비밀번호 설정 후 파일에 <학번>/<비밀번호> 추가"""
+def prompt_password_new(sid: str, students: Dict[str, str]) -> bool:
+    """
+    6.2.4 신규 회원: 비밀번호 설정 후 파일에 <학번>/<비밀번호> 추가
+    반환값: 가입했으면 True, 공유 모드에서 다른 단말기가 같은 학번으로 먼저 가입했으면 False
+    """
     while True:
         pw = input("신규 회원입니다. 비밀번호를 설정해주세요 (4자리 숫자) : ")
         if not RE_PASSWORD.fullmatch(pw):
             info("비밀번호의 형식이 올바르지 않습니다. 다시 입력해주세요.")
             continue
         # 파일에 추가
-        with student_path.open("r", encoding="utf-8") as f:
-            content = f.read()
-        with student_path.open("a", encoding="utf-8", newline="\n") as f:
-            if content:
-                f.write(f"\n{sid}/{pw}/{CURRENT_DATE_STR}")
-            else:
-                f.write(f"{sid}/{pw}/{CURRENT_DATE_STR}")
+        if not STORE.add_student(sid, pw):
+            info("이미 가입된 학번입니다. 다시 로그인해주세요.")
+            return False
         students[sid] = pw
         #info("신규 회원 가입이 완료되었습니다.")
-        break
+        return True
 
 
 # ---------------------------------------------------------------
@@ -1679,9 +2982,9 @@ def prompt_password_new(student_path: Path, sid: str, students: Dict[str, str])
 ROWS = ["A", "B", "C", "D", "E"]
 COLS = [1, 2, 3, 4, 5]
 
-def create_seat_buffer(seat_vector: list[int]) -> dict[str, int]:
+def create_seat_buffer(seat_vector: int) -> dict[str, int]:
     """
-    영화의 좌석 유무 벡터(길이 25, 0/1)를 
+    영화의 좌석 유무 비트마스크를
     {'A1':0, 'A2':1, ..., 'E5':1} 형태로 변환
     """
     seat_buffer: dict[str, int] = {}
@@ -1689,7 +2992,7 @@ def create_seat_buffer(seat_vector: list[int]) -> dict[str, int]:
     for row in ROWS:
         for col in COLS:
             seat_id = f"{row}{col}"
-            seat_buffer[seat_id] = seat_vector[idx]
+            seat_buffer[seat_id] = (seat_vector >> idx) & 1
             idx += 1
     return seat_buffer
 
@@ -1718,6 +3021,57 @@ def print_seat_board(seat_buffer: dict[str, int]) -> None:
                 line.append("■")  # 현재 예매 중
         print(" ", " ".join(line))
 
+def is_bookable_schedule(sch: Schedule | None) -> bool:
+    """예매/취소할 수 있는 상영인지 (현재 날짜 이후(당일 제외)의 유효 상영)"""
+    return sch is not None and sch.movie_date > CURRENT_DATE_STR
+
+def validate_seat_names(seats: list, max_count: int | None = MAX_PEOPLE) -> str | None:
+    """
+    한 번에 예매할 좌석 이름 목록을 검사한다. (menu1의 인원 수/좌석 규칙, 헤드리스 실행용)
+
+    매개변수:
+        seats: list     - 좌석 이름 목록 (예: ['A1', 'B3'])
+        max_count: int  - 최대 좌석 수 (None이면 전체 좌석 수까지, 단체 예매)
+
+    반환값: 문제가 있으면 사유, 없으면 None
+    """
+    limit = max_count if max_count is not None else SEAT_COUNT
+    if not 1 <= len(seats) <= limit:
+        return f"좌석은 1~{limit}개를 선택해야 합니다."
+    if not all(isinstance(seat, str) and RE_SEAT_NAME.fullmatch(seat) for seat in seats):
+        return "올바르지 않은 좌석입니다."
+    if len(set(seats)) != len(seats):
+        return "동일 좌석 중복 선택은 불가능합니다."
+    return None
+
+def bookable_dates() -> list[str]:
+    """현재 날짜 이후(당일 제외)에 유효 상영이 있는 날짜 목록 (오름차순)"""
+    return sorted({sch.movie_date for sch in STORE.schedules.values() if is_bookable_schedule(sch)})
+
+def showtimes_on(selected_date: str) -> list[dict]:
+    """
+    해당 날짜의 유효 상영 목록 (시작 시간순)
+    각 항목: {"id": 상영 고유 번호, "title", "date", "time": "HH:MM-HH:MM", "seats": 좌석 비트마스크}
+    """
+    movies: list[dict] = []
+    for sch in STORE.schedules.values():
+        if sch.movie_date != selected_date or sch.movie_id not in STORE.movies:
+            continue
+        movie = STORE.movies[sch.movie_id]
+        time_str = schedule_time_range(sch)
+
+        movies.append({
+            "id": sch.schedule_id,
+            "title": movie.movie_name,
+            "date": sch.movie_date,
+            "time": time_str,
+            "seats": sch.seats_vector,
+        })
+    def sort_key(m: dict) -> str:
+        return m["time"].split("-")[0]
+    movies.sort(key=sort_key)
+    return movies
+
 def select_date() -> str | None:
     """
     6.4.1 날짜 선택
@@ -1729,25 +3083,7 @@ def select_date() -> str | None:
         error("내부 현재 날짜가 설정되어 있지 않습니다.")
         return None
 
-    schedule_path = home_path() / SCHEDULE_FILE
-    movie_path = home_path() / MOVIE_FILE
-    lines = schedule_path.read_text(encoding="utf-8").splitlines()
-
-    dates: list[str] = []
-    for line in lines:
-        if not line.strip():
-            continue
-        parts = line.split("/")
-        if len(parts) != 7:
-            continue
-        _, movie_id, movie_date, _, _, valid, _ = parts
-        if valid != "T":
-            continue
-        if movie_date > CURRENT_DATE_STR and movie_date not in dates:
-            dates.append(movie_date)
-
-    dates.sort()
-    dates = dates[:9]
+    dates = bookable_dates()[:9]
     n = len(dates)
 
     print("영화예매를 선택하셨습니다. 아래는 예매 가능한 날짜 리스트입니다.")
@@ -1776,54 +3112,7 @@ def select_movie(selected_date: str) -> dict | None:
     """
     6.4.2 영화 선택 — 입력받은 날짜의 영화를 시간순으로 제시하고 선택
     """
-    movie_path = home_path() / MOVIE_FILE
-    schedule_path = home_path() / SCHEDULE_FILE
-    scd_lines = schedule_path.read_text(encoding="utf-8").splitlines()
-    movie_lines = movie_path.read_text(encoding="utf-8").splitlines()
-
-    movie_map = {}
-    if movie_path.exists():
-        with open(movie_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                parts = line.strip().split('/')
-                # format: mov_id/title/runtime/valid/ts
-                if len(parts) == 5 and parts[3] == 'T':
-                    movie_map[parts[0]] = [parts[1], parts[2]]
-
-    movies: list[dict] = []
-    for line in scd_lines:
-        if not line.strip():
-            continue
-        parts = line.split("/")
-        if len(parts) != 7:
-            continue
-        if parts[-2] != "T":
-            continue
-        
-        mov_id = parts[1]
-        if mov_id in movie_map:
-            title = movie_map[mov_id][0]
-            scd_id = parts[0]
-            date_str = parts[2]
-            startTime = parts[3]
-            runtime = int(movie_map[mov_id][1])
-            end_hour = (int(startTime[0:2]) + (int(startTime[3:5]) + runtime) // 60) % 24
-            end_minute = (int(startTime[3:5]) + runtime) % 60
-            endTime = f"{end_hour:02d}:{end_minute:02d}"
-            time_str = f"{startTime}-{endTime}"
-            
-            seats = parts[4]
-            if date_str == selected_date:
-                movies.append({
-                    "id": scd_id,
-                    "title": title,
-                    "date": date_str,
-                    "time": time_str,
-                    "seats": ast.literal_eval(seats)
-                })
-    def sort_key(m: dict) -> str:
-        return m["time"].split("-")[0]
-    movies.sort(key=sort_key)
+    movies = showtimes_on(selected_date)
     n = len(movies)
 
     print(f"{selected_date}의 상영시간표입니다.")
@@ -1857,65 +3146,37 @@ def select_movie(selected_date: str) -> dict | None:
         return movies[num - 1]
 
 def input_people(selected_movie: dict) -> int | None:
-    """6.4.3 인원 수 입력 — 최대 4명, 0이면 이전 단계로"""
+    """6.4.3 인원 수 입력 — 최대 MAX_PEOPLE명, 0이면 이전 단계로"""
     movie_date = selected_movie["date"]
     movie_time = selected_movie["time"]
     movie_title = selected_movie["title"]
 
     while True:
-        s = input(f"{movie_date} {movie_time} | 〈{movie_title}〉를 선택하셨습니다. 인원 수를 입력해주세요 (최대 4명): ").strip()
+        s = input(f"{movie_date} {movie_time} | 〈{movie_title}〉를 선택하셨습니다. 인원 수를 입력해주세요 (최대 {MAX_PEOPLE}명): ").strip()
         if not re.fullmatch(r"\d", s or "") or re.search(r"[A-Za-z]", s):
             print("올바르지 않은 입력입니다. 한 자리 숫자만 입력하세요.")
             continue
         n = int(s)
-        if not (0 <= n <= 4):
+        if not (0 <= n <= MAX_PEOPLE):
             print("범위 밖의 입력입니다. 다시 입력해주세요.")
             continue
         if n == 0:
             return None
         return n
 
-def finalize_booking(selected_movie: dict, chosen_seats: list[str], student_id: str,
-                     schedule_path: Path, booking_path: Path) -> None:
+def finalize_booking(selected_movie: dict, chosen_seats: list[str], student_id: str) -> bool:
     scd_id = selected_movie["id"]
-    # 이번 예매의 좌석 벡터 만들기 (내가 선택한 좌석만 1)
-    new_booking_vector = [0] * 25
-    for seat in chosen_seats:
-        row_idx = ROWS.index(seat[0])
-        col_idx = int(seat[1]) - 1
-        new_booking_vector[row_idx * 5 + col_idx] = 1
-
-    # schedule-info.txt 업데이트 (기존 1 유지 + 새 1 추가)
-    lines = schedule_path.read_text(encoding="utf-8").splitlines()
-    updated_lines: list[str] = []
-    for line in lines:
-        parts = line.strip().split("/")
-        if len(parts) != 7:
-            updated_lines.append(line)
-            continue
-        scd_id_in_file = parts[0].strip()
-        if scd_id_in_file == scd_id:
-            seats = ast.literal_eval(parts[-3])
-            for i in range(25):
-                seats[i] = 1 if (seats[i] == 1 or new_booking_vector[i] == 1) else 0
-            parts[-3] = "[" + ",".join(map(str, seats)) + "]"
-            parts[-1] = CURRENT_DATE_STR
-            updated_line = "/".join(parts)
-
-            updated_lines.append(updated_line)
-        else:
-            updated_lines.append(line)
-    schedule_path.write_text("\n".join(updated_lines), encoding="utf-8")
+    # 이번 예매의 좌석 비트마스크 만들기 (내가 선택한 좌석만 1)
+    new_booking_vector = seats_to_vector(chosen_seats)
 
+    # schedule-info.txt 업데이트 (기존 1 유지 + 새 1 추가) 후
     # booking-info.txt에 새로운 예매 레코드 추가
-    with open(booking_path, "a+", encoding="utf-8") as f:
-        f.seek(0)
-        is_empty = (f.read().strip() == "")
-        booking_vec_str = ",".join(map(str, new_booking_vector))
-        if is_empty:
-            f.write(f"{student_id}/{scd_id}/[{booking_vec_str}]/T/{CURRENT_DATE_STR}")
-        else:
-            f.write(f"\n{student_id}/{scd_id}/[{booking_vec_str}]/T/{CURRENT_DATE_STR}")
+    # (공유 모드에서 그 사이 다른 단말기가 같은 좌석을 예매했으면 실패)
+    if STORE.book(student_id, scd_id, new_booking_vector) is None:
+        sch = STORE.schedules.get(scd_id)
+        selected_movie["seats"] = sch.seats_vector if sch is not None else 0
+        return False
+    return True
 
 def input_seats(selected_movie: dict, n: int) -> bool:
     """
@@ -1932,14 +3193,15 @@ def input_seats(selected_movie: dict, n: int) -> bool:
         s = input(f"{k + 1}번째로 예매할 좌석을 입력하세요. (예:A1): ").strip().upper()
         if s == "0":
             return False
-        if not re.fullmatch(r"[A-E][1-5]", s) or re.search(r"[가-힣]", s):
+        if not RE_SEAT_NAME.fullmatch(s) or re.search(r"[가-힣]", s):
             print("올바르지 않은 입력입니다.")
             continue
         if seat_buffer[s] == 1:
             print("이미 예매된 좌석입니다.")
             continue
-        if s in chosen_seats:
-            print("동일 좌석 중복 선택은 불가능합니다.")
+        reason = validate_seat_names(chosen_seats + [s], max_count=n)
+        if reason is not None:
+            print(reason)  # 동일 좌석 중복 선택
             continue
         seat_buffer[s] = 2
         chosen_seats.append(s)
@@ -1950,15 +3212,13 @@ def input_seats(selected_movie: dict, n: int) -> bool:
             print()
             continue
         else:
-            schedule_path = home_path() / SCHEDULE_FILE
-            booking_path = home_path() / BOOKING_FILE
-            finalize_booking(
+            if not finalize_booking(
                 selected_movie=selected_movie,
                 chosen_seats=chosen_seats,
                 student_id=LOGGED_IN_SID,
-                schedule_path=schedule_path,
-                booking_path=booking_path,
-            )
+            ):
+                print("다른 단말기에서 먼저 예매된 좌석이 있습니다. 좌석을 다시 선택해주세요.")
+                return False
             print(f"{', '.join(chosen_seats)} 자리 예매가 완료되었습니다. 주 프롬프트로 돌아갑니다.")
             return True
 
@@ -2001,52 +3261,66 @@ def menu1() -> None:
 
 
 # ===== menu2: 예매 내역 조회 =====
-def get_movie_details() -> dict[str, dict]:
-    movie_path = home_path() / MOVIE_FILE
-    schedule_path = home_path() / SCHEDULE_FILE
-
-    movie_map = {}
-    if movie_path.exists():
-        with open(movie_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                parts = line.strip().split('/')
-                # format: mov_id/title/runtime/valid/ts
-                if len(parts) == 5 and parts[3] == 'T':
-                    movie_map[parts[0]] = [parts[1], parts[2]]
-
-    lines = schedule_path.read_text(encoding="utf-8").splitlines()
+def get_movie_details(scd_ids: list[str]) -> dict[str, dict]:
+    """주어진 상영 고유 번호들의 제목/날짜/시간 정보 (유효한 상영만)"""
     details: dict[str, dict] = {}
-    for line in lines:
-        if not line.strip():
-            continue
-        parts = line.split('/')
-        if parts[-2] != "T":
+    for scd_id in scd_ids:
+        sch = STORE.schedules.get(scd_id)
+        if sch is None:
             continue
-        if len(parts) == 7:
-            schedule_id = parts[0].strip()
-            movie_id = parts[1].strip()
-            title = movie_map[movie_id][0]
-            date_str = parts[2].strip()
-            
-            startTime = parts[3]
-            runtime = int(movie_map[movie_id][1])
-            end_hour = (int(startTime[0:2]) + (int(startTime[3:5]) + runtime) // 60) % 24
-            end_minute = (int(startTime[3:5]) + runtime) % 60
-            endTime = f"{end_hour:02d}:{end_minute:02d}"
-            time_str = f"{startTime}-{endTime}"
-            
-            details[schedule_id] = {"title": title, "date": date_str, "time": time_str}
+        movie = STORE.movies[sch.movie_id]
+
+        time_str = schedule_time_range(sch)
+
+        details[sch.schedule_id] = {"title": movie.movie_name, "date": sch.movie_date, "time": time_str}
     return details
 
-def vector_to_seats(vector: list[int]) -> list[str]:
+def seats_to_vector(seat_names: list[str]) -> int:
+    """좌석 이름 목록(예: ['A1', 'B3'])을 좌석 비트마스크로 변환 (vector_to_seats의 역)"""
+    vector = 0
+    for seat in seat_names:
+        row_idx = ROWS.index(seat[0])
+        col_idx = int(seat[1]) - 1
+        vector |= 1 << (row_idx * 5 + col_idx)
+    return vector
+
+def vector_to_seats(vector: int) -> list[str]:
+    """좌석 비트마스크에서 1인 좌석 이름 목록 (예: ['A1', 'B3'])"""
     booked_seats: list[str] = []
-    for i, status in enumerate(vector):
-        if status == 1:
+    for i in range(SEAT_COUNT):
+        if (vector >> i) & 1:
             row = ROWS[i // 5]
             col = COLS[i % 5]
             booked_seats.append(f"{row}{col}")
     return booked_seats
 
+def booking_history(student_id: str) -> list[dict]:
+    """
+    학생의 '지나가지 않은'(현재 날짜 포함) 유효 예매 목록 (파일 순서, 정렬은 호출하는 쪽에서)
+    각 항목: {"row": 예매 줄 번호, "scd_id", "title", "date", "time", "seats": 좌석 이름 목록}
+    """
+    my_bookings = STORE.bookings_of_student(student_id)
+    movie_details = get_movie_details([booking.schedule_id for _, booking in my_bookings])
+
+    user_bookings: list[dict] = []
+    for row, booking in my_bookings:
+        movie_id = booking.schedule_id
+        if movie_id not in movie_details:
+            continue
+        movie_info = movie_details[movie_id]
+        movie_date = movie_info["date"]
+        if movie_date < CURRENT_DATE_STR:
+            continue
+        user_bookings.append({
+            "row": row,
+            "scd_id": movie_id,
+            "title": movie_info["title"],
+            "date": movie_date,
+            "time": movie_info["time"],
+            "seats": vector_to_seats(booking.seats),
+        })
+    return user_bookings
+
 def menu2() -> None:
     """
     6.3.2 예매 내역 조회 — 현재 로그인 사용자의 '지나가지 않은' 예매 내역 출력
@@ -2057,35 +3331,7 @@ def menu2() -> None:
     if not CURRENT_DATE_STR:
         error("가상 현재 날짜가 설정되지 않았습니다.")
         return
-    booking_path = home_path() / BOOKING_FILE
-    movie_details = get_movie_details()
-
-    try:
-        lines = booking_path.read_text(encoding="utf-8").splitlines()
-    except FileNotFoundError:
-        error(f"'{BOOKING_FILE}' 파일을 찾을 수 없습니다.")
-        return
-    user_bookings: list[dict] = []
-    for line in lines:
-        if not line.strip():
-            continue
-        parts = line.split('/')
-        if len(parts) == 5 and parts[0].strip() == LOGGED_IN_SID and parts[3].strip() == "T":
-            movie_id = parts[1].strip()
-            if movie_id not in movie_details:
-                continue
-            movie_info = movie_details[movie_id]
-            movie_date = movie_info["date"]
-            if movie_date < CURRENT_DATE_STR:
-                continue
-            vector_str = parts[2].strip()
-            seat_vector = ast.literal_eval(vector_str)
-            user_bookings.append({
-                "title": movie_info["title"],
-                "date": movie_date,
-                "time": movie_info["time"],
-                "seats": vector_to_seats(seat_vector),
-            })
+    user_bookings = booking_history(LOGGED_IN_SID)
     print(f"\n{LOGGED_IN_SID} 님의 예매 내역입니다.")
     if not user_bookings:
         print(f"{LOGGED_IN_SID} 님의 예매 내역이 존재하지 않습니다. 주 프롬프트로 돌아갑니다.")
@@ -2104,96 +3350,29 @@ def menu2() -> None:
             print(f"{i}) {booking['date']} {booking['time']} | {booking['title']} | {seat_list_str}")
             
     print("주 프롬프트로 돌아갑니다.")
-
-
-# ===== menu3: 예매 취소 =====
-def load_records(path: Path) -> list[str]:
-    if not path.exists():
-        return []
-    return path.read_text(encoding="utf-8").splitlines()
-
-def parse_schedule_record(line: str) -> dict:
-    uid, movie_id, ddate, ttime, seats, _, _ = line.split("/")
-    return {
-        "uid": uid.strip(),
-        "movie_id": movie_id.strip(),
-        "date": ddate.strip(),
-        "time": ttime.strip(),
-        "seats": ast.literal_eval(seats.strip()),
-    }
-
-def parse_booking_record(line: str) -> dict:
-    sid, uid, seats = line.split("/", 2)
-    return {"sid": sid.strip(), "uid": uid.strip(), "seats": ast.literal_eval(seats.strip())}
-
-def save_records(path: Path, records: list[str]) -> None:
-    with path.open("w", encoding="utf-8") as f:
-        for i, line in enumerate(records):
-            line = line.strip()
-            if i < len(records) - 1:
-                f.write(line + "\n")
-            else:
-                f.write(line)
-
 def select_cancelation(student_id: str) -> dict | None:
     if CURRENT_DATE_STR is None:
         error("내부 현재 날짜가 설정되어 있지 않습니다.")
         return None
-    booking_path = home_path() / BOOKING_FILE
-    movie_path = home_path() / MOVIE_FILE
-    schedule_path = home_path() / SCHEDULE_FILE
-    booking_lines = booking_path.read_text(encoding="utf-8").splitlines()
-    movie_lines = movie_path.read_text(encoding="utf-8").splitlines()
-    schedule_lines = schedule_path.read_text(encoding="utf-8").splitlines()
-
-    movie_map = {}
-    if movie_path.exists():
-        with open(movie_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                parts = line.strip().split('/')
-                # format: mov_id/title/runtime/valid/ts
-                if len(parts) == 5 and parts[3] == 'T':
-                    movie_map[parts[0]] = [parts[1], parts[2]]
 
     bookings: list[dict] = []
-    for line in booking_lines:
-        if not line.strip():
-            continue
-        parts = line.split("/")
-        if len(parts) != 5:
-            continue
-        student_who_booked, scd_id, seat_vec, validity, timestamp = parts
-        if validity != "T":
-            continue
+    for row, booking in STORE.bookings_of_student(student_id):
+        scd_id = booking.schedule_id
         movie_date = scd_id[0:4] + "-" + scd_id[4:6] + "-" + scd_id[6:8]
-        if student_id == student_who_booked and movie_date > CURRENT_DATE_STR and validity == "T":
-            for scd_line in schedule_lines:
-                if not scd_line.strip():
-                    continue
-                scd_parts = scd_line.split("/")
-                if not scd_parts:
-                    continue
-                line_scd_id = scd_parts[0].strip()
-
-                if scd_id == line_scd_id:
-                    pm = parse_schedule_record(scd_line)
-                    if pm is None:
-                        error(f"parse_movie_record 실패: {scd_line}")
-                        continue
-                    startTime = pm["time"]
-                    runtime = int(movie_map[pm["movie_id"]][1])
-                    end_hour = (int(startTime[0:2]) + (int(startTime[3:5]) + runtime) // 60) % 24
-                    end_minute = (int(startTime[3:5]) + runtime) % 60
-                    endTime = f"{end_hour:02d}:{end_minute:02d}"
-                    time_str = f"{startTime}-{endTime}"     
-                    bookings.append({
-                        "scd_id": scd_id.strip(),
-                        "seats": ast.literal_eval(seat_vec.strip()),
-                        "title": movie_map[pm["movie_id"]][0],
-                        "date": pm["date"],
-                        "time": time_str,
-                    })
-                    break
+        if movie_date > CURRENT_DATE_STR:
+            sch = STORE.schedules.get(scd_id)
+            if sch is None:
+                continue
+            movie = STORE.movies[sch.movie_id]
+            time_str = schedule_time_range(sch)
+            bookings.append({
+                "row": row,
+                "scd_id": scd_id,
+                "seats": booking.seats,
+                "title": movie.movie_name,
+                "date": sch.movie_date,
+                "time": time_str,
+            })
     if not bookings:
         info(f"{student_id}님의 예매 내역이 존재하지 않습니다. 주 프롬프트로 돌아갑니다.")
         return None
@@ -2201,9 +3380,8 @@ def select_cancelation(student_id: str) -> dict | None:
     bookings = bookings[:9]
     n = len(bookings)
     info(f"{student_id}님의 예매 내역입니다.")
-    seat_names = [f"{row}{col}" for row in "ABCDE" for col in range(1, 6)]
     for i, d in enumerate(bookings, start=1):
-        booked = [seat_names[idx] for idx, v in enumerate(d['seats']) if v == 1]
+        booked = vector_to_seats(d['seats'])
         seat_str = " ".join(booked) if booked else "(예매된 좌석 없음)"
         print(f"{i}) {d['date']} {d['time']} | {d['title']} | {seat_str}")
     print("0) 뒤로 가기")
@@ -2213,9 +3391,8 @@ def select_cancelation(student_id: str) -> dict | None:
         if not re.fullmatch(r"\d", s):
             print("올바르지 않은 입력입니다. 취소할 내역의 번호만 입력하세요.")
             info(f"{student_id}님의 예매 내역입니다.")
-            seat_names = [f"{row}{col}" for row in "ABCDE" for col in range(1, 6)]
             for i, d in enumerate(bookings, start=1):
-                booked = [seat_names[idx] for idx, v in enumerate(d['seats']) if v == 1]
+                booked = vector_to_seats(d['seats'])
                 seat_str = " ".join(booked) if booked else "(예매된 좌석 없음)"
                 print(f"{i}) {d['date']} {d['time']} | {d['title']} | {seat_str}")
             print("0) 뒤로 가기")
@@ -2224,9 +3401,8 @@ def select_cancelation(student_id: str) -> dict | None:
         if not (0 <= num <= n):
             print("범위 밖의 입력입니다. 다시 입력해주세요.")
             info(f"{student_id}님의 예매 내역입니다.")
-            seat_names = [f"{row}{col}" for row in "ABCDE" for col in range(1, 6)]
             for i, d in enumerate(bookings, start=1):
-                booked = [seat_names[idx] for idx, v in enumerate(d['seats']) if v == 1]
+                booked = vector_to_seats(d['seats'])
                 seat_str = " ".join(booked) if booked else "(예매된 좌석 없음)"
                 print(f"{i}) {d['date']} {d['time']} | {d['title']} | {seat_str}")            
             print("0) 뒤로 가기")
@@ -2236,57 +3412,19 @@ def select_cancelation(student_id: str) -> dict | None:
         return bookings[num - 1]
 
 def confirm_cancelation(selected_booking: dict) -> None:
-    schedule_path = home_path() / SCHEDULE_FILE
-    booking_path = home_path() / BOOKING_FILE
-
-    seat_names = [f"{row}{col}" for row in "ABCDE" for col in range(1, 6)]
-
-    seats = selected_booking.get('seats', [])
+    seats = selected_booking.get('seats', 0)
     if not seats:
         print("(예매된 좌석 없음)")
         return
-    booked = [seat_names[idx] for idx, v in enumerate(seats) if v == 1]
+    booked = vector_to_seats(seats)
     seat_str = " ".join(booked) if booked else "(예매된 좌석 없음)"
     n = input(f"{selected_booking['date']} {selected_booking['time']} | {selected_booking['title']}의 예매를 취소하겠습니까? (Y/N)")
 
     if n == 'Y':
-        booking_lines = booking_path.read_text(encoding="utf-8").splitlines()
-        new_booking_lines: list[str] = []
-        for line in booking_lines:
-            if not line.strip():
-                continue
-            parts = line.split("/")
-            if len(parts) != 5:
-                continue
-            student_who_booked, scd_id, seat_vec, validity, _ = parts
-            if (student_who_booked == LOGGED_IN_SID and 
-                scd_id == selected_booking['scd_id'] and 
-                ast.literal_eval(seat_vec.strip()) == selected_booking['seats'] and
-                validity == "T"):
-                line = f"{student_who_booked}/{scd_id}/{seat_vec}/F/{CURRENT_DATE_STR}"
-            new_booking_lines.append(line)
-
-        schedule_lines = schedule_path.read_text(encoding="utf-8").splitlines()
-        new_schedule_lines: list[str] = []
-        for line in schedule_lines:
-            if not line.strip():
-                continue
-            parts = line.split("/")
-            if len(parts) != 7:
-                continue
-            uid, scd_id, ddate, ttime, seats, validity, _ = parts
-            if uid == selected_booking['scd_id']:
-                current_seats = ast.literal_eval(seats.strip())
-                restored_seats = [max(0, cs - ss) for cs, ss in zip(current_seats, selected_booking['seats'])]
-                seat_str2 = "[" + ",".join(map(str, restored_seats)) + "]"
-                new_line = f"{uid}/{scd_id}/{ddate}/{ttime}/{seat_str2}/T/{CURRENT_DATE_STR}"
-                new_schedule_lines.append(new_line)
-            else:
-                new_schedule_lines.append(line)
-
-        save_records(booking_path, new_booking_lines)
-        save_records(schedule_path, new_schedule_lines)
-        info("예매가 취소되었습니다.")
+        if STORE.cancel(LOGGED_IN_SID, selected_booking['scd_id'], seats, selected_booking['row']):
+            info("예매가 취소되었습니다.")
+        else:
+            info("이미 취소된 예매입니다.")
     else:
         menu3()
         return
@@ -2319,42 +3457,18 @@ def menu4() -> None:
     if not CURRENT_DATE_STR:
         error("가상 현재 날짜가 설정되지 않았습니다. 프로그램을 다시 시작해주세요.")
         return
-    movie_path = home_path() / MOVIE_FILE
-    schedule_path = home_path() / SCHEDULE_FILE
-
-    movie_map = {}
-    if movie_path.exists():
-        with open(movie_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                parts = line.strip().split('/')
-                # format: mov_id/title/runtime/valid/ts
-                if len(parts) == 5 and parts[3] == 'T':
-                    movie_map[parts[0]] = [parts[1], parts[2]]
-    try:
-        lines = schedule_path.read_text(encoding="utf-8").splitlines()
-    except FileNotFoundError:
-        error(f"'{SCHEDULE_FILE}' 파일을 찾을 수 없습니다.")
-        return
     available_movies: list[dict] = []
-    for line in lines:
-        if not line.strip():
+    for sch in STORE.schedules.values():
+        movie_date = sch.movie_date
+        if movie_date < CURRENT_DATE_STR:
             continue
-        parts = line.split('/')
-        if len(parts) == 7:
-            movie_date = parts[2].strip()
-            if movie_date < CURRENT_DATE_STR:
-                continue
-            startTime = parts[3]
-            runtime = int(movie_map[parts[1].strip()][1])
-            end_hour = (int(startTime[0:2]) + (int(startTime[3:5]) + runtime) // 60) % 24
-            end_minute = (int(startTime[3:5]) + runtime) % 60
-            endTime = f"{end_hour:02d}:{end_minute:02d}"
-            time_str = f"{startTime}-{endTime}"     
-            available_movies.append({
-                "date": movie_date,
-                "time": time_str.strip(),
-                "title": movie_map[parts[1].strip()][0],
-            })
+        movie = STORE.movies[sch.movie_id]
+        time_str = schedule_time_range(sch)
+        available_movies.append({
+            "date": movie_date,
+            "time": time_str,
+            "title": movie.movie_name,
+        })
     print(f"상영시간표 조회를 선택하셨습니다. 현재 조회 가능한 모든 상영 시간표를 출력합니다.")
     if not available_movies:
         print("상영이 예정된 영화가 없습니다.")
@@ -2395,6 +3509,7 @@ def dispatch_menu(choice: str) -> None:
     if func is None:
         error("잘못된 메뉴 선택입니다.")
         return
+    STORE.sync()  # 공유 모드: 다른 단말기의 변경을 반영한 데이터로 메뉴를 보여준다
     try:
         func()
     except SystemExit:
@@ -2435,19 +3550,8 @@ def input_movie_title() -> str | None:
     - 반환값: 입력 받은 영화 제목(str) 또는 None
     """
     
-    # 1. 영화 데이터 파일로부터 레코드 유효 여부가 T인 모든 영화 제목을 읽어 튜플로 저장
-    existing_titles = set()
-    if os.path.exists(MOVIE_FILE):
-        with open(MOVIE_FILE, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                if not line: continue
-                # 포맷: id/title/time/validity/date (구분자 '/' 기준)
-                parts = line.split('/')
-                if len(parts) >= 4 and parts[3] == 'T':
-                    existing_titles.add(parts[1])
-    
-    existing_titles_tuple = tuple(existing_titles)
+    # 1. 레코드 유효 여부가 T인 모든 영화 제목 (저장소의 영화 목록)
+    existing_titles = STORE.movie_titles()
 
     while True:
         # 2. 영화 제목 입력 받기
@@ -2463,7 +3567,7 @@ def input_movie_title() -> str | None:
             continue
 
         # 4. 중복 제목 확인
-        if title in existing_titles_tuple:
+        if title in existing_titles:
             print("이미 존재하는 영화 제목입니다. 다시 입력해주세요.")
             continue
 
@@ -2500,36 +3604,7 @@ def add_movie(movie_title: str, running_time: int):
     4. add_movie
     - 기능: 영화 데이터 파일에 레코드 추가
     """
-    current_ids = set()
-    movie_file = home_path() / MOVIE_FILE
-    file_exists = os.path.exists(MOVIE_FILE)
-    is_empty = True
-
-    with open(movie_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-        if content.strip():
-            is_empty = False
-            f.seek(0)
-            for line in f:
-                line = line.strip()
-                if not line: continue
-                parts = line.split('/')
-                if parts[0].isdigit():
-                    if parts[3] == 'T':
-                        current_ids.add(int(parts[0]))
-    
-    movie_id = 1
-    while movie_id in current_ids:
-        movie_id += 1
-
-    record = f"{movie_id:04d}/{movie_title}/{running_time}/T/{CURRENT_DATE_STR}"
-
-    # 2. 파일 쓰기
-    with open(MOVIE_FILE, 'a', encoding='utf-8') as f:
-        if not is_empty:
-            f.write(f"\n{record}")
-        else:
-            f.write(record)
+    STORE.add_movie(movie_title, running_time)
 
 def admin_menu1():
     """
@@ -2571,32 +3646,11 @@ def print_modifiable_movie_list() -> set:
     """
     수정 가능한 영화 목록(상영 정보가 없는 영화)을 출력하고 ID 집합 반환
     """
-    movie_data = {}  # {id: (title, runtime)}
-    screening_ids = set()
-    movie_file = home_path() / MOVIE_FILE
-    schedule_file = home_path() / SCHEDULE_FILE
-    # 1. 영화 데이터 파일 읽기 (유효여부 T인 것만)
-    with open(movie_file, 'r', encoding='utf-8') as f:
-        for line in f:
-            line = line.strip()
-            if not line: continue
-            parts = line.split('/')
-            # parts: [id, title, running_time, valid, date]
-            if len(parts) == 5 and parts[3] == 'T':
-                movie_data[parts[0]] = (parts[1], parts[2])
-
-    # 2. 상영 데이터 파일 읽기 (유효여부 T인 것만)
-    with open(schedule_file, 'r', encoding='utf-8') as f:
-        for line in f:
-            line = line.strip()
-            if not line: continue
-            parts = line.split('/')
-            # 상영 데이터 구조: id/movie_id/.../valid/... 
-            if len(parts) == 7 and parts[-2] == 'T': 
-                screening_ids.add(parts[1]) 
+    # 1~2. 유효(T) 영화 / 유효(T) 상영에 쓰인 영화
+    screening_ids = {sch.movie_id for sch in STORE.schedules.values()}
 
     # 3. 차집합 연산 (영화 파일엔 있고, 상영 파일엔 없는 것)
-    modifiable_ids = set(movie_data.keys()) - screening_ids
+    modifiable_ids = set(STORE.movies.keys()) - screening_ids
 
     # 4 ~ 7. 출력
     print("수정 가능한 영화 목록입니다. 수정할 영화의 영화 고유 번호를 입력해주세요.")
@@ -2604,8 +3658,8 @@ def print_modifiable_movie_list() -> set:
     # 정렬하여 출력 (선택 사항이나 보기 좋게 하기 위함)
     sorted_ids = sorted(list(modifiable_ids))
     for mid in sorted_ids:
-        title, runtime = movie_data[mid]
-        print(f"{mid} | {title} | {runtime}")
+        movie = STORE.movies[mid]
+        print(f"{mid} | {movie.movie_name} | {movie.running_time}")
 
     print("0. 뒤로 가기")
 
@@ -2645,17 +3699,13 @@ def input_modify_movie_func(movie_id: str) -> str | None:
     """
     수정할 항목(제목/러닝타임) 선택
     """
-    # 현재 영화 정보를 가져오기 위한 파일 읽기 (출력 메시지 구성을 위해)
+    # 현재 영화 정보 (출력 메시지 구성을 위해)
     current_title = ""
     current_time = ""
-    
-    with open(MOVIE_FILE, 'r', encoding='utf-8') as f:
-        for line in f:
-            parts = line.strip().split('/')
-            if parts[0] == movie_id and parts[3] == 'T':
-                current_title = parts[1]
-                current_time = parts[2]
-                break
+    movie = STORE.movies.get(movie_id)
+    if movie is not None:
+        current_title = movie.movie_name
+        current_time = movie.running_time
     
     # 1 ~ 4. 메뉴 출력
     print(f"<{movie_id} | {current_title} | {current_time}>을 선택하셨습니다. 원하는 동작에 해당하는 번호를 입력하세요.")
@@ -2696,15 +3746,8 @@ def input_modify_movie_title() -> str | None:
     """
     수정할 영화 제목 입력
     """
-    # 1. 기존 제목 로딩
-    existing_titles = set()
-    if os.path.exists(MOVIE_FILE):
-        with open(MOVIE_FILE, 'r', encoding='utf-8') as f:
-            for line in f:
-                parts = line.strip().split('/')
-                if len(parts) >= 4 and parts[3] == 'T':
-                    existing_titles.add(parts[1])
-    existing_titles_tuple = tuple(existing_titles)
+    # 1. 기존 제목 (저장소의 영화 목록)
+    existing_titles = STORE.movie_titles()
 
     while True:
         # 2. 입력
@@ -2720,7 +3763,7 @@ def input_modify_movie_title() -> str | None:
             continue
 
         # 4. 중복 검사
-        if title in existing_titles_tuple:
+        if title in existing_titles:
             print("이미 존재하는 영화 제목입니다. 다른 제목을 입력해주세요.")
             continue
 
@@ -2756,51 +3799,9 @@ def input_modify_running_time() -> int | None:
 def modify_movie(movie_id: str, movie_title: str | None, running_time: int | None):
     """
     영화 레코드 수정 (기존 레코드 F 처리 -> 바로 뒤에 새 레코드 T 추가)
+    수정할 값이 None이면 기존 값을 유지한다.
     """
-    if not os.path.exists(MOVIE_FILE):
-        return
-
-    lines = []
-    with open(MOVIE_FILE, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
-
-    target_index = -1
-    original_line = ""
-    
-    # 1. 수정 대상 찾기
-    for i, line in enumerate(lines):
-        parts = line.strip().split('/')
-        if parts[0] == movie_id and parts[3] == 'T':
-            target_index = i
-            original_line = line.strip()
-            break
-    
-    if target_index != -1:
-        # 기존 정보 파싱
-        parts = original_line.split('/')
-        old_title = parts[1]
-        old_time = parts[2]
-        
-        # 수정할 값 결정 (입력된 값이 없으면 기존 값 유지)
-        new_title = movie_title if movie_title is not None else old_title
-        new_time = running_time if running_time is not None else old_time
-        
-        # 2. 기존 레코드 유효여부 F로 변경
-        # 포맷: id/title/time/valid/date
-        # 날짜도 업데이트해야 하는지 명세엔 없으나, 보통 수정 시점 날짜로 하거나 기존 유지.
-        # 여기서는 기존 레코드의 내용은 건드리지 않고 유효성만 F로 바꿉니다.
-        parts[3] = 'F' 
-        lines[target_index] = "/".join(parts) + "\n"
-
-        # 3. 새로운 레코드 생성 및 삽입
-        new_record = f"{movie_id}/{new_title}/{new_time}/T/{CURRENT_DATE_STR}\n"
-        
-        # "동일한 위치에 그 직후에" 추가
-        lines.insert(target_index + 1, new_record)
-
-        # 파일 다시 쓰기
-        with open(MOVIE_FILE, 'w', encoding='utf-8') as f:
-            f.writelines(lines)
+    STORE.modify_movie(movie_id, movie_title, running_time)
 
 def admin_menu2():
     """
@@ -2861,32 +3862,11 @@ def print_deletable_movie_list() -> set:
     """
     삭제 가능한 영화 목록(상영 정보가 없는 영화)을 출력하고 ID 집합 반환
     """
-    movie_data = {}  # {id: (title, runtime)}
-    screening_ids = set()
-    movie_file = home_path() / MOVIE_FILE
-    schedule_file = home_path() / SCHEDULE_FILE
-    # 1. 영화 데이터 파일 읽기 (유효여부 T인 것만)
-    with open(movie_file, 'r', encoding='utf-8') as f:
-        for line in f:
-            line = line.strip()
-            if not line: continue
-            parts = line.split('/')
-            # parts: [id, title, running_time, valid, date]
-            if len(parts) == 5 and parts[3] == 'T':
-                movie_data[parts[0]] = (parts[1], parts[2])
-
-    # 2. 상영 데이터 파일 읽기 (유효여부 T인 것만)
-    with open(schedule_file, 'r', encoding='utf-8') as f:
-        for line in f:
-            line = line.strip()
-            if not line: continue
-            parts = line.split('/')
-            # 상영 데이터 구조: id/movie_id/.../valid/... 
-            if len(parts) == 7 and parts[-2] == 'T': 
-                screening_ids.add(parts[1]) 
+    # 1~2. 유효(T) 영화 / 유효(T) 상영에 쓰인 영화
+    screening_ids = {sch.movie_id for sch in STORE.schedules.values()}
 
     # 3. 차집합 연산 (영화 파일엔 있고, 상영 파일엔 없는 것)
-    deletable_ids = set(movie_data.keys()) - screening_ids
+    deletable_ids = set(STORE.movies.keys()) - screening_ids
 
     # 4 ~ 7. 출력
     print("삭제 가능한 영화 목록입니다. 삭제할 영화의 영화 고유 번호를 입력해주세요.")
@@ -2895,8 +3875,8 @@ def print_deletable_movie_list() -> set:
     # 정렬하여 출력
     sorted_ids = sorted(list(deletable_ids))
     for mid in sorted_ids:
-        title, runtime = movie_data[mid]
-        print(f"{mid} | {title} | {runtime}")
+        movie = STORE.movies[mid]
+        print(f"{mid} | {movie.movie_name} | {movie.running_time}")
         
     print("0. 뒤로 가기")
 
@@ -2934,30 +3914,7 @@ def delete_movie(movie_id: str):
     """
     영화 레코드 삭제 (유효 여부를 T -> F로 수정 및 날짜 업데이트)
     """
-    if not os.path.exists(MOVIE_FILE):
-        return
-
-    lines = []
-    with open(MOVIE_FILE, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
-
-    updated = False
-    for i, line in enumerate(lines):
-        parts = line.strip().split('/')
-        # 1. 대상 찾기 (ID 일치, 유효성 T)
-        if len(parts) >= 5 and parts[0] == movie_id and parts[3] == 'T':
-            # 2. 수정 (T -> F, 날짜 업데이트)
-            parts[3] = 'F'
-            parts[4] = CURRENT_DATE_STR
-            
-            # 다시 합쳐서 리스트 업데이트
-            lines[i] = "/".join(parts) + "\n"
-            updated = True
-            break # ID는 고유하므로 찾으면 중단
-
-    if updated:
-        with open(MOVIE_FILE, 'w', encoding='utf-8') as f:
-            f.writelines(lines)
+    STORE.delete_movie(movie_id)
 
 def admin_menu3():
     """
@@ -2989,39 +3946,17 @@ def admin_menu3():
 
 def show_available_movie() -> list[str]:
     """
-    movie-info.txt에서 'T'인 영화 목록을 출력하고, 유효한 영화 ID 리스트를 반환
+    유효(T)한 영화 목록을 출력하고, 유효한 영화 ID 리스트를 반환
     """
-    movie_path = home_path() / MOVIE_FILE
-    valid_ids = []
-    
     print("영화 데이터 파일에 존재하는 영화 목록입니다. 상영 시간표에 추가할 영화 고유 번호를 입력하세요.")
     print("영화 고유 번호 | 영화 제목 | 러닝 타임(분)")
-    
-    # [변경 1] 정렬을 위해 데이터를 잠시 저장할 리스트 생성
-    temp_movies = [] 
-
-    if movie_path.exists():
-        with open(movie_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                if not line: continue
-                parts = line.split('/')
-                # 형식: id/title/runtime/valid/timestamp
-                
-                # [변경 2] 'T'인 레코드를 즉시 출력하지 않고 temp_movies 리스트에 저장 (튜플 형태)
-                if len(parts) >= 5 and parts[3] == 'T':
-                    # (영화ID, 제목, 러닝타임) 묶어서 저장
-                    temp_movies.append((parts[0], parts[1], parts[2]))
-    
-    # [변경 3] 수집된 영화 목록을 영화 ID(첫 번째 요소) 기준으로 오름차순 정렬
-    temp_movies.sort(key=lambda x: x[0])
 
-    # [변경 4] 정렬된 목록을 순회하며 출력하고 반환할 ID 리스트 생성
+    # 영화 ID 기준으로 오름차순 정렬하여 출력하고 반환할 ID 리스트 생성
     valid_ids = []
-    for m in temp_movies:
-        # m[0]: ID, m[1]: 제목, m[2]: 러닝타임
-        print(f"{m[0]} | {m[1]} | {m[2]}")
-        valid_ids.append(m[0])
+    for movie_id in sorted(STORE.movies):
+        movie = STORE.movies[movie_id]
+        print(f"{movie_id} | {movie.movie_name} | {movie.running_time}")
+        valid_ids.append(movie_id)
     
     print("0. 뒤로 가기")
     return valid_ids
@@ -3052,17 +3987,9 @@ def input_scd_date(movie_id: str) -> str | None:
     상영 날짜 입력 및 검증 (시간 여행, 일일 쿼터 제한)
     """
     # 영화 정보 출력을 위해 영화 제목, 러닝타임 가져오기
-    movie_title = ""
-    movie_runtime = ""
-    movie_path = home_path() / MOVIE_FILE
-    if movie_path.exists():
-        with open(movie_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                parts = line.strip().split('/')
-                if len(parts) >= 5 and parts[0] == movie_id and parts[3] == 'T':
-                    movie_title = parts[1]
-                    movie_runtime = parts[2]
-                    break
+    movie = STORE.movies.get(movie_id)
+    movie_title = movie.movie_name if movie else ""
+    movie_runtime = movie.running_time if movie else ""
     
     print(f"<{movie_id} | {movie_title} | {movie_runtime}>을 선택하셨습니다.")
 
@@ -3095,13 +4022,9 @@ def input_scd_date(movie_id: str) -> str | None:
     
         # 4. 일일 상영 수 제한 (10개 미만인지 확인)
         cnt = 0
-        schedule_path = home_path() / SCHEDULE_FILE
-        if schedule_path.exists():
-            with open(schedule_path, 'r', encoding='utf-8') as f:
-                for line in f:
-                    parts = line.strip().split('/')
-                    if len(parts) >= 7 and parts[2] == scd_date and parts[5] == 'T':
-                        cnt += 1
+        for sch in STORE.schedules.values():
+            if sch.movie_date == scd_date:
+                cnt += 1
 
         if cnt >= 9:
             print("일일 영화 상영 수를 초과했습니다. 다시 입력해주세요.")
@@ -3119,65 +4042,18 @@ def chk_overlap_date(scd_id: str, running_time: int, scd_date: str) -> bool:
     [설계서 9. chk_overlap_date]
     영화 날짜를 수정할 때, 변경된 날짜에서 시간 충돌이 발생하는지 검사
     """
-    schedule_path = home_path() / SCHEDULE_FILE
-    
-    # 1. schedule-info.txt에서 scd_id에 해당하는 레코드의 '영화 시작 시간'을 찾음
-    scd_time = ""
-    if schedule_path.exists():
-        with open(schedule_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                parts = line.strip().split('/')
-                if len(parts) >= 7 and parts[0] == scd_id and parts[5] == 'T':
-                    scd_time = parts[3] # 영화 시작 시간
-                    break
-    
-    if not scd_time: return False # 레코드가 없으면 검사 불가 (False 반환)
+    # 1. scd_id에 해당하는 상영의 '영화 시작 시간'을 찾음
+    target = STORE.schedules.get(scd_id)
+    if target is None: return False # 레코드가 없으면 검사 불가 (False 반환)
+    scd_time = target.movie_start_time
 
     # 2. 시간 계산 (분 단위)
-    h, m = map(int, scd_time.split(':'))
-    newStart = h * 60 + m
+    newStart = time_to_minutes(scd_time)
     newEnd = newStart + running_time
 
-    # 3. schedule-info.txt에서 조건에 맞는 레코드 필터링 및 중복 검사
-    # 조건: 영화 날짜 == scd_date AND 상영 고유 번호 != scd_id AND 유효 여부 == "T"
-    if schedule_path.exists():
-        with open(schedule_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                parts = line.strip().split('/')
-                if len(parts) < 7: continue
-                
-                ex_scd_id = parts[0]
-                ex_movie_id = parts[1]
-                ex_date = parts[2]
-                ex_time = parts[3]
-                ex_valid = parts[5]
-
-                # 필터링
-                if ex_date == scd_date and ex_scd_id != scd_id and ex_valid == 'T':
-                    # A. 영화 고유 번호를 old_movie_id에 저장
-                    old_movie_id = ex_movie_id
-                    
-                    # B. movie-info.txt에서 old_movie_id의 러닝 타임 가져오기
-                    old_running_time = 0
-                    movie_path = home_path() / MOVIE_FILE
-                    if movie_path.exists():
-                        with open(movie_path, 'r', encoding='utf-8') as mf:
-                            for mline in mf:
-                                mparts = mline.strip().split('/')
-                                if len(mparts) >= 5 and mparts[0] == old_movie_id and mparts[3] == 'T':
-                                    old_running_time = int(mparts[2])
-                                    break
-                    
-                    # C. oldStart, oldEnd 계산
-                    eh, em = map(int, ex_time.split(':'))
-                    oldStart = eh * 60 + em
-                    oldEnd = oldStart + old_running_time
-                    
-                    # D. 겹침 판별
-                    if newStart <= oldEnd and newEnd >= oldStart:
-                        return True # 겹침
-
-    return False # 겹치지 않음
+    # 3. 같은 날짜(scd_date)의 유효 상영 중 자기 자신(scd_id)을 제외하고 겹침 검사
+    #    (날짜별 시간 색인을 이분 탐색, 판정: newStart <= oldEnd and newEnd >= oldStart)
+    return STORE.has_time_conflict(scd_date, newStart, newEnd, exclude=scd_id)
 
 def chk_overlap_time(scd_id: str, running_time: int, scd_time: str) -> bool:
     """
@@ -3189,9 +4065,6 @@ def chk_overlap_time(scd_id: str, running_time: int, scd_time: str) -> bool:
         running_time: 영화 러닝 타임
         scd_time: 사용자가 입력한 새로운 시작 시간 (HH:MM)
     """
-    schedule_path = home_path() / SCHEDULE_FILE
-    movie_path = home_path() / MOVIE_FILE 
-
     # 1. scd_id에서 날짜 파싱 (YYYYMMDD...) -> YYYY-MM-DD
     # 수정 기능이므로 날짜는 scd_id에 있는 날짜(기존 날짜)를 유지한다고 가정
     # (만약 날짜 수정 기능에서 이 함수를 쓴다면 로직이 달라져야 하나, 
@@ -3202,57 +4075,12 @@ def chk_overlap_time(scd_id: str, running_time: int, scd_time: str) -> bool:
     scd_date = f"{yyyy}-{mm}-{dd}"
 
     # 2. 입력받은 scd_time으로 새로운 시작/종료 시간 계산
-    # (파일에서 읽지 않고, 인자로 받은 scd_time 사용)
-    h, m = map(int, scd_time.split(':'))
-    newStart = h * 60 + m
+    newStart = time_to_minutes(scd_time)
     newEnd = newStart + running_time
 
-    # 3. 24:00(1440분) 초과 검사
-    # 24:00은 허용 안 함 (1440 이상이면 오류)
-    #if newEnd >= 1440: 
-    #    print("영화 종료 시간은 24:00 이후일 수 없습니다. 다시 입력해주세요.")
-    #    return True
-
-    # 4. schedule-info.txt 필터링 및 중복 검사
-    if schedule_path.exists():
-        with open(schedule_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                parts = line.strip().split('/')
-                if len(parts) < 7: continue
-                
-                ex_scd_id = parts[0]
-                ex_movie_id = parts[1]
-                ex_date = parts[2]
-                ex_time = parts[3]
-                ex_valid = parts[5]
-
-                # 조건: 날짜 일치 AND 유효함(T)
-                # ★ 핵심: 수정 대상인 자기 자신(scd_id)은 비교에서 제외 ★
-                if ex_date == scd_date and ex_scd_id != scd_id and ex_valid == 'T':
-                    
-                    # A. 비교 대상의 러닝타임 가져오기 (old_movie_id)
-                    old_movie_id = ex_movie_id
-                    old_running_time = 0
-                    
-                    if movie_path.exists():
-                        with open(movie_path, 'r', encoding='utf-8') as mf:
-                            for mline in mf:
-                                mparts = mline.strip().split('/')
-                                if len(mparts) >= 5 and mparts[0] == old_movie_id and mparts[3] == 'T':
-                                    old_running_time = int(mparts[2])
-                                    break
-                    
-                    # B. 비교 대상의 시작/종료 시간 계산
-                    eh, em = map(int, ex_time.split(':'))
-                    oldStart = eh * 60 + em
-                    oldEnd = oldStart + old_running_time
-                    
-                    # C. 겹침 판별
-                    # (Start1 < End2) and (End1 > Start2)
-                    if newStart <= oldEnd and newEnd >= oldStart:
-                        return True
-
-    return False
+    # 3. 같은 날짜의 유효 상영과 중복 검사
+    #    ★ 핵심: 수정 대상인 자기 자신(scd_id)은 비교에서 제외 ★
+    return STORE.has_time_conflict(scd_date, newStart, newEnd, exclude=scd_id)
 # ---------------------------------------------------------------
 # 8.6 상영 시간표 수정
 # ---------------------------------------------------------------
@@ -3261,52 +4089,26 @@ def print_modifiable_scd_list() -> set:
     """
     수정 가능한(예매 없음, 미래, 유효함) 스케줄 목록을 출력하고 ID 집합 반환
     """
-    schedule_path = home_path() / SCHEDULE_FILE
-    movie_path = home_path() / MOVIE_FILE
-    
     modifiable_ids = set()
-    
-    if not schedule_path.exists():
-        return modifiable_ids
-
-    # 영화 정보 로드
-    movie_info = {}
-    if movie_path.exists():
-        with open(movie_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                parts = line.strip().split('/')
-                if len(parts) >= 5 and parts[3] == 'T':
-                    movie_info[parts[0]] = {'title': parts[1], 'runtime': parts[2]}
 
     print("상영 데이터 파일에 존재하는 수정 가능한 상영 시간표 목록입니다. 수정할 상영 고유 번호를 입력하세요.")
     print("상영 고유 번호 | 영화 제목 | 러닝 타임(분) | 영화 날짜 | 영화 시작 시간")
 
     schedules_to_print = []
-    with open(schedule_path, 'r', encoding='utf-8') as f:
-        for line in f:
-            parts = line.strip().split('/')
-            # 구조: scd_id/movie_id/date/time/vec/valid/ts
-            if len(parts) < 7: continue
-            
-            scd_id, mid, date_str, time_str, vec_str, valid = parts[0], parts[1], parts[2], parts[3], parts[4], parts[5]
-            
-            # 조건: 유효T, 날짜>=현재, 벡터가 모두 0(예매 없음)
-            try:
-                seats = ast.literal_eval(vec_str)
-                is_empty_seats = all(s == 0 for s in seats)
-            except:
-                is_empty_seats = False
-
-            if valid == 'T' and date_str >= CURRENT_DATE_STR and is_empty_seats:
-                m_data = movie_info.get(mid, {'title': '알수없음', 'runtime': '0'})
-                schedules_to_print.append({
-                    'id': scd_id,
-                    'title': m_data['title'],
-                    'runtime': m_data['runtime'],
-                    'date': date_str,
-                    'time': time_str
-                })
-                modifiable_ids.add(scd_id)
+    for sch in STORE.schedules.values():
+        # 조건: 유효T, 날짜>=현재, 벡터가 모두 0(예매 없음)
+        is_empty_seats = sch.seats_vector == 0
+
+        if sch.movie_date >= CURRENT_DATE_STR and is_empty_seats:
+            movie = STORE.movies.get(sch.movie_id)
+            schedules_to_print.append({
+                'id': sch.schedule_id,
+                'title': movie.movie_name if movie else '알수없음',
+                'runtime': movie.running_time if movie else '0',
+                'date': sch.movie_date,
+                'time': sch.movie_start_time
+            })
+            modifiable_ids.add(sch.schedule_id)
 
     # 정렬하여 출력
     schedules_to_print.sort(key=lambda x: x['id'])
@@ -3344,35 +4146,13 @@ def input_modify_scd_func(scd_id: str) -> str | None:
     """
     수정할 항목(날짜/시간) 선택
     """
-    # 선택된 스케줄 정보 출력을 위해 파일 읽기
-    target_scd = None
-    schedule_path = home_path() / SCHEDULE_FILE
-    movie_path = home_path() / MOVIE_FILE
-    
-    # 영화 정보 로드
-    movie_info = {}
-    if movie_path.exists():
-        with open(movie_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                parts = line.strip().split('/')
-                if len(parts) >= 5:
-                    movie_info[parts[0]] = {'title': parts[1], 'runtime': parts[2]}
-
-    if schedule_path.exists():
-        with open(schedule_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                parts = line.strip().split('/')
-                if len(parts) >= 7 and parts[0] == scd_id:
-                    mid = parts[1]
-                    m_data = movie_info.get(mid, {'title': '알수없음', 'runtime': '0'})
-                    target_scd = {
-                        'id': scd_id, 'title': m_data['title'], 'runtime': m_data['runtime'],
-                        'date': parts[2], 'time': parts[3]
-                    }
-                    break
-    
-    if target_scd:
-        print(f"<{target_scd['id']} | {target_scd['title']} | {target_scd['runtime']} | {target_scd['date']} | {target_scd['time']}>을 선택하셨습니다. 원하는 동작에 해당하는 번호를 입력하세요.")
+    # 선택된 스케줄 정보 출력
+    sch = STORE.schedules.get(scd_id)
+    if sch is not None:
+        movie = STORE.movies.get(sch.movie_id)
+        title = movie.movie_name if movie else '알수없음'
+        runtime = movie.running_time if movie else '0'
+        print(f"<{scd_id} | {title} | {runtime} | {sch.movie_date} | {sch.movie_start_time}>을 선택하셨습니다. 원하는 동작에 해당하는 번호를 입력하세요.")
 
     print("1. 영화 날짜 수정")
     print("2. 영화 시작 시간 수정")
@@ -3399,26 +4179,11 @@ def input_modify_scd_date(scd_id: str) -> str | None:
     (is_valid_date_string, count_daily_schedules 함수 없이 직접 구현)
     """
     # 러닝타임 가져오기 (chk_overlap_date 호출용)
-    schedule_path = home_path() / SCHEDULE_FILE
-    movie_path = home_path() / MOVIE_FILE
+    # 스케줄에서 movie_id 찾기 -> 영화에서 runtime 찾기
     runtime = 0
-    
-    # 스케줄에서 movie_id 찾기 -> movie_info에서 runtime 찾기
-    mid = ""
-    if schedule_path.exists():
-        with open(schedule_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                parts = line.strip().split('/')
-                if len(parts) >= 7 and parts[0] == scd_id: # 7개 필드 확인
-                    mid = parts[1]
-                    break
-    if mid and movie_path.exists():
-        with open(movie_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                parts = line.strip().split('/')
-                if len(parts) >= 5 and parts[0] == mid:
-                    runtime = int(parts[2])
-                    break
+    sch = STORE.schedules.get(scd_id)
+    if sch is not None:
+        runtime = STORE.running_time_of(sch.movie_id)
 
     while True:
         scd_date = input("수정할 영화 상영 날짜를 입력해주세요 (YYYY-MM-DD): ").strip()
@@ -3445,29 +4210,12 @@ def input_modify_scd_date(scd_id: str) -> str | None:
              continue
 
         # 4. 일일 상영 수 제한 (10개 미만인지 직접 카운트)
+        # 수정이므로 바뀔 날짜(scd_date)에 이미 있는 유효한(T) 상영 수를 세되,
+        # 날짜를 바꾸지 않는 경우를 위해 자기 자신(scd_id)은 카운트에서 제외
         cnt = 0
-        if schedule_path.exists():
-            with open(schedule_path, 'r', encoding='utf-8') as f:
-                for line in f:
-                    parts = line.strip().split('/')
-                    # 구조: scd_id/movie_id/date/time/vec/valid/ts
-                    # 자기 자신은 날짜가 바뀌므로 어차피 카운트에서 제외되거나,
-                    # 날짜가 안 바뀌면 자기 포함 10개인지 체크해야 함.
-                    # 수정이므로 '바뀔 날짜(scd_date)'에 있는 다른 스케줄 개수 + (만약 날짜 안 바꾸면 나 포함) 확인
-                    # 하지만 여기선 '바뀔 날짜'에 이미 있는 유효한(T) 스케줄 개수만 세면 됨.
-                    
-                    # 주의: 내가 날짜를 안 바꾸면(같은 날짜 입력), 나는 이미 파일에 T로 존재하므로 cnt에 포함됨.
-                    # 내가 날짜를 바꾸면, 바뀔 날짜엔 내가 아직 없으므로 cnt에 포함 안 됨.
-                    # 기획서 의도상 "해당 날짜의 상영 레코드 수"를 제한하는 것이므로
-                    # 수정될 날짜에 이미 있는 스케줄 수를 세되, '자기 자신'은 제외하고 세는 것이 논리적으로 맞음 (수정 후 T로 들어갈 거니까).
-                    # 다만 input_scd_date(신규추가) 로직과 동일하게 '파일에 있는 T 개수'를 그대로 세면
-                    # 날짜 변경 시: 대상 날짜의 기존 스케줄 수 (내 거 없음) -> 10개면 추가 불가 (OK)
-                    # 날짜 미변경 시: 내 거 포함 10개 -> 수정 불가? (내 거 1개 빼고 9개여야 수정 가능)
-                    
-                    if len(parts) >= 7 and parts[2] == scd_date and parts[5] == 'T':
-                         # 수정 기능이므로 자기 자신(scd_id)은 카운트에서 제외해야 정확함
-                         if parts[0] != scd_id:
-                            cnt += 1
+        for ex in STORE.schedules.values():
+            if ex.movie_date == scd_date and ex.schedule_id != scd_id:
+                cnt += 1
         
         if cnt >= 9:
              print("일일 영화 상영 수를 초과했습니다. 다시 입력해주세요.")
@@ -3485,25 +4233,10 @@ def input_modify_scd_time(scd_id: str) -> str | None:
     수정할 영화 시작 시간 입력 및 검증
     """
     # 러닝타임 가져오기
-    schedule_path = home_path() / SCHEDULE_FILE
-    movie_path = home_path() / MOVIE_FILE
-    runtime = 0
-    
-    mid = ""
-    if schedule_path.exists():
-        with open(schedule_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                parts = line.strip().split('/')
-                if parts[0] == scd_id:
-                    mid = parts[1]
-                    break
-    if mid and movie_path.exists():
-        with open(movie_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                parts = line.strip().split('/')
-                if parts[0] == mid:
-                    running_time = int(parts[2])
-                    break
+    running_time = 0
+    sch = STORE.schedules.get(scd_id)
+    if sch is not None:
+        running_time = STORE.running_time_of(sch.movie_id)
 
     while True:
         scd_time = input("수정할 영화 시작 시간을 입력해주세요 (HH:MM): ").strip()
@@ -3540,97 +4273,21 @@ def input_modify_scd_time(scd_id: str) -> str | None:
 
 def modify_scd_date(scd_id: str, scd_date: str) -> None:
     """
-    상영 날짜 수정 (Soft Update) - 줄바꿈 오류 수정됨
+    상영 날짜 수정 (Soft Update) - 기존 레코드 F 처리 후 새 날짜의 레코드를 정렬 위치에 추가
     """
-    lines = []
-    schedule_path = home_path() / SCHEDULE_FILE
-    
-    target_line = ""
-    
-    if schedule_path.exists():
-        with open(schedule_path, 'r', encoding='utf-8') as f:
-            # readlines() 대신 한 줄씩 읽어서 strip() 후 처리하는 것이 안전함
-            for line in f:
-                if line.strip(): # 빈 줄 제외
-                    lines.append(line.strip()) # 개행 문자 제거하고 저장
-            
-    # 2. 기존 레코드 F 처리 및 타겟 찾기
-    # 인덱스가 아니라 리스트를 순회하며 처리
-    new_lines = []
-    for line in lines:
-        parts = line.split('/')
-        if parts[0] == scd_id and parts[5] == 'T':
-            parts[5] = 'F'
-            parts[6] = CURRENT_DATE_STR
-            target_line = line
-            new_lines.append("/".join(parts)) # 수정된 내용 추가
-        else:
-            new_lines.append(line) # 기존 내용 그대로 추가
-            
-    if target_line:
-        parts = target_line.split('/')
-        mid = parts[1]
-        old_time = parts[3]
-        
-        # 새 ID 생성
-        new_scd_id = scd_date.replace("-", "") + old_time.replace(":", "")
-        zero_vector = "[" + ",".join(["0"]*25) + "]"
-        
-        # 새 레코드 추가
-        new_record = f"{new_scd_id}/{mid}/{scd_date}/{old_time}/{zero_vector}/T/{CURRENT_DATE_STR}"
-        new_lines.append(new_record)
-        
-        # 정렬
-        new_lines.sort(key=lambda x: x.split('/')[0]) 
-
-        # [핵심 수정] 저장 시 개행 문자(\n)를 명시적으로 붙여서 join
-        with open(schedule_path, 'w', encoding='utf-8') as f:
-            f.write("\n".join(new_lines) + "\n") # 마지막 줄에도 개행 추가 권장
+    sch = STORE.schedules.get(scd_id)
+    if sch is None:
+        return
+    STORE.move_schedule(scd_id, scd_date, sch.movie_start_time)
 
 def modify_scd_time(scd_id: str, scd_time: str) -> None:
     """
-    상영 시간 수정 (Soft Update) - 줄바꿈 오류 수정됨
+    상영 시간 수정 (Soft Update) - 기존 레코드 F 처리 후 새 시간의 레코드를 정렬 위치에 추가
     """
-    lines = []
-    schedule_path = home_path() / SCHEDULE_FILE
-    
-    target_line = ""
-    
-    if schedule_path.exists():
-        with open(schedule_path, 'r', encoding='utf-8') as f:
-             for line in f:
-                if line.strip():
-                    lines.append(line.strip())
-            
-    new_lines = []
-    for line in lines:
-        parts = line.split('/')
-        if parts[0] == scd_id and parts[5] == 'T':
-            parts[5] = 'F'
-            parts[6] = CURRENT_DATE_STR
-            target_line = line
-            new_lines.append("/".join(parts))
-        else:
-            new_lines.append(line)
-            
-    if target_line:
-        parts = target_line.split('/')
-        mid = parts[1]
-        old_date = parts[2]
-        
-        # 새 ID 생성
-        new_scd_id = old_date.replace("-", "") + scd_time.replace(":", "")
-        zero_vector = "[" + ",".join(["0"]*25) + "]"
-        
-        new_record = f"{new_scd_id}/{mid}/{old_date}/{scd_time}/{zero_vector}/T/{CURRENT_DATE_STR}"
-        new_lines.append(new_record)
-        
-        # 정렬
-        new_lines.sort(key=lambda x: x.split('/')[0])
-
-        # [핵심 수정] 저장 시 개행 문자(\n)를 명시적으로 붙여서 join
-        with open(schedule_path, 'w', encoding='utf-8') as f:
-            f.write("\n".join(new_lines) + "\n")
+    sch = STORE.schedules.get(scd_id)
+    if sch is None:
+        return
+    STORE.move_schedule(scd_id, sch.movie_date, scd_time)
 
 def admin_menu5():
     """
@@ -3695,15 +4352,7 @@ def input_scd_time(movie_id: str, scd_date: str) -> str | None:
             print("범위 밖의 입력입니다. 다시 입력해주세요.")
             continue
         
-        running_time = 0
-        movie_path = home_path() / MOVIE_FILE
-        if movie_path.exists():
-            with open(movie_path, 'r', encoding='utf-8') as f:
-                for line in f:
-                    parts = line.strip().split('/')
-                    if len(parts) >= 5 and parts[0] == movie_id and parts[3] == 'T':
-                        running_time = int(parts[2])
-                        break
+        running_time = STORE.running_time_of(movie_id)
 
         # 2. 24:00 이후 검사 로직 추가 (8.5.3 의미 규칙)
         h, m = map(int, scd_time.split(':'))
@@ -3724,34 +4373,7 @@ def add_scd(movie_id: str, scd_date: str, scd_time: str) -> None:
     """
     상영 데이터 파일에 레코드 추가 (오름차순 정렬 유지)
     """
-    # 상영 고유 번호 생성 (YYYYMMDDHHmm)
-    scd_id = scd_date.replace("-", "") + scd_time.replace(":", "")
-    
-    # 좌석 유무 벡터 (25개의 0)
-    zero_vector = "[" + ",".join(["0"] * 25) + "]"
-    
-    # 새 레코드 생성
-    new_record = f"{scd_id}/{movie_id}/{scd_date}/{scd_time}/{zero_vector}/T/{CURRENT_DATE_STR}"
-    
-    schedule_path = home_path() / SCHEDULE_FILE
-    
-    # 1. 기존 파일 내용 읽기
-    lines = []
-    if schedule_path.exists():
-        with open(schedule_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                if line.strip():
-                    lines.append(line.strip())
-
-    # 2. 새 레코드 리스트에 추가
-    lines.append(new_record)
-
-    # 3. 상영 고유 번호(첫 번째 필드) 기준으로 오름차순 정렬
-    lines.sort(key=lambda x: x.split('/')[0])
-
-    # 4. 파일 덮어쓰기 (정렬된 순서대로 저장)
-    with open(schedule_path, 'w', encoding='utf-8') as f:
-        f.write("\n".join(lines))
+    STORE.add_schedule(movie_id, scd_date, scd_time)
 
         
 def chk_overlap(movie_id: str, scd_date: str, scd_time: str) -> bool:
@@ -3759,64 +4381,14 @@ def chk_overlap(movie_id: str, scd_date: str, scd_time: str) -> bool:
     [설계서 7. chk_overlap]
     상영 시간표 추가(admin_menu4) 시 중복 검사
     """
-    movie_path = home_path() / MOVIE_FILE
-    schedule_path = home_path() / SCHEDULE_FILE
-
     # 1. 현재 영화의 러닝타임(running_time) 및 시간 계산
-    running_time = 0
-    if movie_path.exists():
-        with open(movie_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                parts = line.strip().split('/')
-                if len(parts) >= 5 and parts[0] == movie_id and parts[3] == 'T':
-                    running_time = int(parts[2])
-                    break
+    running_time = STORE.running_time_of(movie_id)
     
-    h, m = map(int, scd_time.split(':'))
-    newStart = h * 60 + m
+    newStart = time_to_minutes(scd_time)
     newEnd = newStart + running_time
 
-    # (설계서에는 없으나 로직상 필요한 24시 체크, 설계서 7번 항목에는 명시되지 않았지만 
-    # admin_menu4의 input_scd_time 처리 과정에 언급됨. 여기서는 순수 중복 체크 로직만 수행)
-    
-    # 2. schedule-info.txt 필터링
-    if schedule_path.exists():
-        with open(schedule_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                parts = line.strip().split('/')
-                if len(parts) < 7: continue
-                
-                ex_scd_id = parts[0]
-                ex_movie_id = parts[1]
-                ex_date = parts[2]
-                ex_time = parts[3]
-                ex_valid = parts[5]
-
-                # 조건: 날짜 일치 AND 유효함
-                if ex_date == scd_date and ex_valid == 'T':
-                    # A. old_movie_id
-                    old_movie_id = ex_movie_id
-                    
-                    # B. old_running_time
-                    old_running_time = 0
-                    if movie_path.exists():
-                        with open(movie_path, 'r', encoding='utf-8') as mf:
-                            for mline in mf:
-                                mparts = mline.strip().split('/')
-                                if len(mparts) >= 5 and mparts[0] == old_movie_id and mparts[3] == 'T':
-                                    old_running_time = int(mparts[2])
-                                    break
-                    
-                    # C. oldStart, oldEnd
-                    eh, em = map(int, ex_time.split(':'))
-                    oldStart = eh * 60 + em
-                    oldEnd = oldStart + old_running_time
-                    
-                    # D. 겹침 판별
-                    if newStart <= oldEnd and newEnd >= oldStart:
-                        return True
-
-    return False
+    # 2. 같은 날짜의 유효 상영과 겹침 판별 (날짜별 시간 색인을 이분 탐색)
+    return STORE.has_time_conflict(scd_date, newStart, newEnd)
 
 def admin_menu4():
     """
@@ -3855,58 +4427,26 @@ def print_deletable_scd_list() -> set:
     """
     삭제 가능한(예매 없음, 미래, 유효함) 스케줄 목록을 출력하고 ID 집합 반환
     """
-    schedule_path = home_path() / SCHEDULE_FILE
-    movie_path = home_path() / MOVIE_FILE
-    
     deletable_ids = set()
-    
-    if not schedule_path.exists():
-        return deletable_ids
-
-    # 영화 정보 로드
-    movie_info = {}
-    if movie_path.exists():
-        with open(movie_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                parts = line.strip().split('/')
-                if len(parts) >= 5 and parts[3] == 'T':
-                    movie_info[parts[0]] = {'title': parts[1], 'runtime': parts[2]}
 
     print("상영 데이터 파일에 존재하는 삭제 가능한 상영 시간표 목록입니다. 삭제할 상영 고유 번호를 입력하세요.")
     print("상영 고유 번호 | 영화 제목 | 러닝 타임(분) | 영화 날짜 | 영화 시작 시간")
 
     schedules_to_print = []
-    with open(schedule_path, 'r', encoding='utf-8') as f:
-        for line in f:
-            parts = line.strip().split('/')
-            # 구조: scd_id/movie_id/date/time/vec/valid/ts
-            if len(parts) < 7: continue
-            
-            scd_id, mid, date_str, time_str, vec_str, valid = parts[0], parts[1], parts[2], parts[3], parts[4], parts[5]
-            
-            # 조건: 유효T, 날짜>=현재, 벡터가 모두 0(예매 없음)
-            try:
-                seats = ast.literal_eval(vec_str)
-                is_empty_seats = all(s == 0 for s in seats)
-            except:
-                is_empty_seats = False
-
-            # 내부 현재 날짜 '후'의 상영 시간표 (설계서 8.7 본문: 내부 현재 날짜 후)
-            # 보통 당일 삭제도 막는 것이 안전하므로 > 로 처리하거나, 
-            # 4.4 입력 날짜 규칙(>=)과 일관성을 위해 >= 로 처리할 수 있음.
-            # 여기서는 설계서 텍스트("내부 현재 날짜 후")를 따라 > 로 구현하되, 
-            # 필요시 >= 로 변경 가능. (8.6 수정에서는 >= CURRENT_DATE_STR 로 구현했음)
-            # 통일성을 위해 여기서도 >= CURRENT_DATE_STR 로 구현합니다.
-            if valid == 'T' and date_str >= CURRENT_DATE_STR and is_empty_seats:
-                m_data = movie_info.get(mid, {'title': '알수없음', 'runtime': '0'})
-                schedules_to_print.append({
-                    'id': scd_id,
-                    'title': m_data['title'],
-                    'runtime': m_data['runtime'],
-                    'date': date_str,
-                    'time': time_str
-                })
-                deletable_ids.add(scd_id)
+    for sch in STORE.schedules.values():
+        # 조건: 유효T, 날짜>=현재, 벡터가 모두 0(예매 없음)
+        is_empty_seats = sch.seats_vector == 0
+
+        if sch.movie_date >= CURRENT_DATE_STR and is_empty_seats:
+            movie = STORE.movies.get(sch.movie_id)
+            schedules_to_print.append({
+                'id': sch.schedule_id,
+                'title': movie.movie_name if movie else '알수없음',
+                'runtime': movie.running_time if movie else '0',
+                'date': sch.movie_date,
+                'time': sch.movie_start_time
+            })
+            deletable_ids.add(sch.schedule_id)
 
     # 정렬하여 출력 (상영 고유 번호 기준 오름차순)
     schedules_to_print.sort(key=lambda x: x['id'])
@@ -3944,30 +4484,7 @@ def delete_scd(scd_id: str) -> None:
     """
     상영 레코드 삭제 (유효 여부를 T -> F로 수정 및 타임스탬프 갱신)
     """
-    lines = []
-    schedule_path = home_path() / SCHEDULE_FILE
-    
-    if schedule_path.exists():
-        with open(schedule_path, 'r', encoding='utf-8') as f:
-            # 안전하게 모든 줄 읽기 (개행 제거)
-            for line in f:
-                if line.strip():
-                    lines.append(line.strip())
-    
-    new_lines = []
-    for line in lines:
-        parts = line.strip().split('/')
-        # 구조: id(0)/mid(1)/date(2)/time(3)/vec(4)/valid(5)/ts(6)
-        if len(parts) >= 7 and parts[0] == scd_id and parts[5] == 'T':
-            parts[5] = 'F' # 유효 여부 F
-            parts[6] = CURRENT_DATE_STR # 타임스탬프 갱신
-            new_lines.append("/".join(parts))
-        else:
-            new_lines.append(line)
-
-    # 파일 덮어쓰기 (개행 문자 추가하여 join)
-    with open(schedule_path, 'w', encoding='utf-8') as f:
-        f.write("\n".join(new_lines) + "\n")
+    STORE.delete_schedule(scd_id)
 
 def admin_menu6():
     """
@@ -3994,6 +4511,22 @@ def admin_menu6():
         # 5. 함수 종료
         return
 
+# ---------------------------------------------------------------
+# 데이터 정리(관리자 7) — 무효 레코드/지난 상영 보관
+# ---------------------------------------------------------------
+def admin_menu7():
+    """
+    무효(F) 레코드와 현재 날짜 이전의 상영(및 그 예매)을 월별 보관 파일로 옮긴다.
+    데이터 파일에는 유효하고 조회 가능한 레코드만 남는다.
+    """
+    moved = STORE.archive_inactive(CURRENT_DATE_STR)
+    if not moved:
+        print("보관할 레코드가 없습니다. 관리자 주 프롬프트로 돌아갑니다.")
+        return
+    labels = {MOVIE_FILE: "영화", SCHEDULE_FILE: "상영", BOOKING_FILE: "예매"}
+    summary = ", ".join(f"{labels[name]} {count}건" for name, count in moved.items())
+    print(f"{summary}을 {ARCHIVE_DIR} 디렉터리로 옮겼습니다. 관리자 주 프롬프트로 돌아갑니다.")
+
 # ---------------------------------------------------------------
 # 관리자 주 프롬프트(8.1) & 메뉴 디스패치
 # ---------------------------------------------------------------
@@ -4006,10 +4539,11 @@ def show_admin_main_menu() -> None:
     print("4) 상영 시간표 추가")
     print("5) 상영 시간표 수정")
     print("6) 상영 시간표 삭제")
+    print("7) 데이터 정리")
     print("0) 종료")
 
 def dispatch_admin_menu(choice: str) -> None:
-    """동일 파일 내의 admin_menu1~admin_menu6 함수를 직접 호출."""
+    """동일 파일 내의 admin_menu1~admin_menu7 함수를 직접 호출."""
     mapping = {
         "0": admin_menu0,
         "1": admin_menu1,
@@ -4018,11 +4552,13 @@ def dispatch_admin_menu(choice: str) -> None:
         "4": admin_menu4,
         "5": admin_menu5,
         "6": admin_menu6,
+        "7": admin_menu7,
     }
     func = mapping.get(choice)
     if func is None:
         error("잘못된 메뉴 선택입니다.")
         return
+    STORE.sync()  # 공유 모드: 다른 단말기의 변경을 반영한 데이터로 메뉴를 보여준다
     try:
         func()
     except SystemExit:
@@ -4041,38 +4577,280 @@ def admin_main_prompt_loop() -> None:
             info("올바르지 않은 입력입니다. 다시 입력해주세요.")
             continue
 
-        # 의미 규칙: {1,2,3,4,5,6,0}
-        if s not in {"1", "2", "3", "4", "5", "6", "0"}:
+        # 의미 규칙: {1,2,3,4,5,6,7,0}
+        if s not in {"1", "2", "3", "4", "5", "6", "7", "0"}:
             info("범위 밖의 입력입니다. 다시 입력해주세요.")
             continue
 
-        # 1~6: 해당 메뉴 모듈로 디스패치
+        # 1~7: 해당 메뉴 모듈로 디스패치
         dispatch_admin_menu(s)
 
 
 # ---------------------------------------------------------------
-# 엔트리포인트: 전체 플로우 결합
+# 계측 모드 — 동작별 호출 수/지연 시간/파일 입출력/파싱한 레코드 수
+#   install_instrumentation이 아래 함수들을 모듈 전역(과 DataStore 메서드)에서 감싼 함수로 바꿔 끼운다.
+#   호출하는 쪽은 전역 이름으로 찾으므로 코드를 고치지 않아도 감싼 함수가 불린다.
+#   파일 입출력과 레코드 수는 그 순간 실행 중인 모든 동작(바깥 메뉴 포함)에 더한다.
 # ---------------------------------------------------------------
-def main() -> None:
+class OpStats:
+    """계측 모드에서 동작 하나의 누적 통계"""
+
+    def __init__(self) -> None:
+        self.latencies: List[float] = []  # 호출마다 걸린 시간(초)
+        self.opens = 0                    # 연 파일 수
+        self.files: set = set()           # 연 파일 이름
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.records = 0                  # 파싱한 레코드 수 (*_from_line 호출)
+
+INSTRUMENT_STATS: Dict[str, OpStats] = defaultdict(OpStats)
+INSTRUMENT_STACK: List[OpStats] = []  # 실행 중인 동작 (바깥 → 안쪽)
+
+def _note_file_io(path: Path, read: int = 0, written: int = 0) -> None:
+    """실행 중인 모든 동작에 파일 한 번 열기와 읽고 쓴 바이트 수를 더한다."""
+    for stats in INSTRUMENT_STACK:
+        stats.opens += 1
+        stats.files.add(Path(path).name)
+        stats.bytes_read += read
+        stats.bytes_written += written
+
+def _instrumented_op(func, op_name):
+    """func 호출 한 번을 op_name(인자) 동작으로 계측하는 함수를 만든다."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        stats = INSTRUMENT_STATS[op_name(*args, **kwargs)]
+        INSTRUMENT_STACK.append(stats)
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            stats.latencies.append(time.perf_counter() - start)
+            INSTRUMENT_STACK.pop()
+    return wrapper
+
+def _instrumented_io(func, io_of):
+    """호출 전에 io_of(인자) → (경로, 읽은 바이트, 쓴 바이트)를 실행 중인 동작에 더하는 함수를 만든다."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        path, read, written = io_of(*args, **kwargs)
+        _note_file_io(path, read, written)
+        return func(*args, **kwargs)
+    return wrapper
+
+def _instrumented_parse(func):
+    """레코드 한 줄을 파싱할 때마다 실행 중인 동작의 레코드 수를 더하는 함수를 만든다."""
+    @functools.wraps(func)
+    def wrapper(line):
+        for stats in INSTRUMENT_STACK:
+            stats.records += 1
+        return func(line)
+    return wrapper
+
+def _file_size(path: Path) -> int:
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+def _encoded_size(text: str | bytes) -> int:
+    return len(text) if isinstance(text, bytes) else len(text.encode("utf-8"))
+
+def install_instrumentation() -> None:
+    """계측 대상 함수들을 감싼 함수로 바꾸고, 종료할 때 보고서를 쓰도록 등록한다."""
+    g = globals()
+    ops = {
+        "dispatch_menu": lambda choice: f"menu{choice}",
+        "dispatch_admin_menu": lambda choice: f"admin_menu{choice}",
+        "open_data": lambda: "open_data",
+        "verify_integrity_full": lambda: "verify_integrity_full",
+        "verify_integrity_incremental": lambda changes: "verify_integrity_incremental",
+        "check_file": lambda data_path: "check_file",
+        "read_data_text": lambda data_path, file_label: "read_data_text",
+        "write_file_atomic": lambda path, text: "write_file_atomic",
+    }
+    file_io = {
+        "check_file": lambda data_path: (data_path, 0, 0),
+        "read_data_text": lambda data_path, file_label: (data_path, _file_size(data_path), 0),
+        "write_file_atomic": lambda path, text: (path, 0, _encoded_size(text)),
+        # mmap으로 파일 전체를 훑으므로 파일 크기를 읽은 바이트로 센다
+        "iter_record_lines": lambda path, live_only=False: (path, _file_size(path), 0),
+    }
+    for name, io_of in file_io.items():
+        g[name] = _instrumented_io(g[name], io_of)
+    for name, op_name in ops.items():
+        g[name] = _instrumented_op(g[name], op_name)
+    for name in ("movie_from_line", "schedule_from_line", "student_from_line", "booking_from_line"):
+        g[name] = _instrumented_parse(g[name])
+
+    DataStore._append_to_file = _instrumented_io(
+        DataStore._append_to_file,
+        lambda self, file_name, record: (self.home / file_name, 0, _encoded_size(record) + 1),
+    )
+    DataStore._append_to_journal = _instrumented_io(
+        DataStore._append_to_journal,
+        lambda self, entry: (self.home / JOURNAL_FILE, 0, _encoded_size(entry) + 1),
+    )
+    atexit.register(write_instrument_report)
+
+def _percentile(sorted_values: List[float], p: int) -> float:
+    """정렬된 값들의 p 분위수 (최근접 순위)"""
+    return sorted_values[min(len(sorted_values) - 1, len(sorted_values) * p // 100)]
+
+def write_instrument_report() -> None:
+    """동작별 통계를 INSTRUMENT_REPORT 파일에 쓴다. (호출 수가 많은 동작부터)"""
+    lines = [
+        f"{'동작':<30} {'호출':>6} {'합계ms':>10} {'p50ms':>9} {'p90ms':>9} {'p99ms':>9} {'최대ms':>9}"
+        f" {'파일열기':>8} {'읽기B':>12} {'쓰기B':>12} {'레코드':>9}  파일"
+    ]
+    for name, stats in sorted(INSTRUMENT_STATS.items(), key=lambda item: -len(item[1].latencies)):
+        if not stats.latencies:
+            continue
+        ms = sorted(t * 1000 for t in stats.latencies)
+        lines.append(
+            f"{name:<30} {len(ms):>6} {sum(ms):>10.1f} {_percentile(ms, 50):>9.2f} {_percentile(ms, 90):>9.2f}"
+            f" {_percentile(ms, 99):>9.2f} {ms[-1]:>9.2f} {stats.opens:>8} {stats.bytes_read:>12}"
+            f" {stats.bytes_written:>12} {stats.records:>9}  {','.join(sorted(stats.files))}".rstrip()
+        )
+    Path(INSTRUMENT_REPORT).write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+# ---------------------------------------------------------------
+# 프로파일링 모드 — 메뉴 실행 한 번마다 cProfile 기록 파일 하나
+# ---------------------------------------------------------------
+PROFILE_COUNT = 0  # 이번 실행에서 저장한 프로파일 수 (파일 이름 순번)
+
+def _profiled_menu(func, prefix: str):
+    """메뉴 디스패치 함수 func를 감싸, 메뉴 실행 한 번을 PROFILE_DIR의 .prof 파일 하나로 저장한다."""
+    @functools.wraps(func)
+    def wrapper(choice: str) -> None:
+        global PROFILE_COUNT
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            func(choice)
+        finally:
+            # 종료 메뉴(0)는 SystemExit로 빠져나오므로 finally에서 저장한다
+            profiler.disable()
+            PROFILE_COUNT += 1
+            out_dir = Path(PROFILE_DIR)
+            out_dir.mkdir(parents=True, exist_ok=True)
+            profiler.dump_stats(out_dir / f"{os.getpid()}-{PROFILE_COUNT:04d}-{prefix}{choice}.prof")
+    return wrapper
+
+def install_profiling() -> None:
+    """메뉴 디스패치 함수를 프로파일링하는 함수로 바꾼다."""
+    global dispatch_menu, dispatch_admin_menu
+    dispatch_menu = _profiled_menu(dispatch_menu, "menu")
+    dispatch_admin_menu = _profiled_menu(dispatch_admin_menu, "admin_menu")
+
+
+# ---------------------------------------------------------------
+# 메모리 프로파일링 모드 — 단계별 최대/잔여 할당량 (tracemalloc)
+#   tracemalloc의 최대값(peak)은 하나뿐이므로, 단계에 들어갈 때 지금까지의 최대값을 바깥 단계들에
+#   넘겨 두고 초기화한다. 단계가 끝나면 그 단계의 최대값을 다시 바깥 단계들에 넘긴다.
+# ---------------------------------------------------------------
+class PhaseMemory:
+    """메모리 프로파일링 모드에서 단계 하나의 누적 통계 (바이트, 단계 시작 시 할당량 기준)"""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.peak = 0           # 호출 중 가장 큰 최대 추가 할당량
+        self.retained = 0       # 마지막 호출이 끝난 뒤 남은 할당량
+        self.retained_max = 0   # 호출이 끝난 뒤 남은 할당량의 최댓값
+
+MEMORY_STATS: Dict[str, PhaseMemory] = defaultdict(PhaseMemory)
+MEMORY_STACK: List[list] = []  # 실행 중인 단계의 [시작 시 할당량, 지금까지의 최대 할당량] (바깥 → 안쪽)
+
+def _memory_phase(func, phase_name):
+    """func 호출 한 번을 phase_name(인자) 단계로 측정하는 함수를 만든다."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        current, peak = tracemalloc.get_traced_memory()
+        for frame in MEMORY_STACK:
+            frame[1] = max(frame[1], peak)
+        tracemalloc.reset_peak()
+        frame = [current, current]
+        MEMORY_STACK.append(frame)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            current, peak = tracemalloc.get_traced_memory()
+            MEMORY_STACK.pop()
+            frame[1] = max(frame[1], peak)
+            for outer in MEMORY_STACK:
+                outer[1] = max(outer[1], frame[1])
+            stats = MEMORY_STATS[phase_name(*args, **kwargs)]
+            stats.calls += 1
+            stats.peak = max(stats.peak, frame[1] - frame[0])
+            stats.retained = current - frame[0]
+            stats.retained_max = max(stats.retained_max, stats.retained)
+    return wrapper
+
+# 이름이 고정된 단계 (함수 이름 = 단계 이름)
+MEMORY_PHASES = (
+    "check_file", "read_data_text", "replay_journal",
+    "scan_movie_file", "scan_schedule_file", "set_schedule_end_times",
+    "check_sorted_schedule_id", "check_movie_id_reference", "check_daily_schedule_limit",
+    "check_schedule_time_conflict", "check_schedule_end_time_before_midnight",
+    "scan_student_file", "scan_booking_file",
+    "check_duplicate_seats", "check_seat_consistency", "check_schedule_id_reference", "check_student_id_reference",
+    "remove_zero_seat_bookings", "verify_integrity_full", "verify_integrity_incremental",
+    "load_store", "load_snapshot_store", "open_data",
+)
+
+def install_memory_profiling() -> None:
+    """측정할 단계 함수들을 감싸고 tracemalloc을 시작하며, 종료할 때 보고서를 쓰도록 등록한다."""
+    g = globals()
+    for name in MEMORY_PHASES:
+        g[name] = _memory_phase(g[name], lambda *args, _name=name, **kwargs: _name)
+    g["dispatch_menu"] = _memory_phase(dispatch_menu, lambda choice: f"menu{choice}")
+    g["dispatch_admin_menu"] = _memory_phase(dispatch_admin_menu, lambda choice: f"admin_menu{choice}")
+    DataStore.load = _memory_phase(DataStore.load, lambda self, texts=None: "DataStore.load")
+    tracemalloc.start()
+    atexit.register(write_memory_report)
+
+def write_memory_report() -> None:
+    """단계별 통계를 MEMORY_REPORT 파일에 쓴다. (처음 실행된 순서)"""
+    kb = lambda n: f"{n / 1024:.1f}"
+    lines = [f"{'단계':<42} {'호출':>6} {'최대KB':>12} {'잔여KB':>12} {'잔여최대KB':>12}"]
+    for name, stats in MEMORY_STATS.items():
+        lines.append(
+            f"{name:<42} {stats.calls:>6} {kb(stats.peak):>12} {kb(stats.retained):>12} {kb(stats.retained_max):>12}"
+        )
+    current, peak = tracemalloc.get_traced_memory()
+    lines.append(f"전체: 현재 {kb(current)}KB, 마지막 단계 이후 최대 {kb(peak)}KB")
+    Path(MEMORY_REPORT).write_text("\n".join(lines) + "\n", encoding="utf-8")
+
 
+# ---------------------------------------------------------------
+# 엔트리포인트: 전체 플로우 결합
+# ---------------------------------------------------------------
+def open_data() -> None:
+    """
+    데이터 파일 확인, 트랜잭션 로그 반영, 무결성 검사(또는 스냅샷 적재) 후 전역 저장소(STORE)를 준비한다.
+    (대화형 main과 예매 서버 등 헤드리스 실행이 함께 사용)
+    """
     check_file(Path(MOVIE_FILE))
     check_file(Path(STUDENT_FILE))
     check_file(Path(BOOKING_FILE))
     check_file(Path(SCHEDULE_FILE))
 
-    verify_integrity()
+    # 이전 실행이 트랜잭션 로그를 데이터 파일에 반영하지 못하고 끝났다면 먼저 반영
+    replay_journal(home_path())
+
+    # 스냅샷 모드: 데이터 파일이 마지막 검사 때와 같으면 전체 검사/파싱 없이 스냅샷 적재
+    if SNAPSHOT_MODE != "on" or load_snapshot_store() is None:
+        texts = verify_integrity(full=True)
+        load_store(texts)
+        if SNAPSHOT_MODE == "on":
+            save_snapshot(STORE)
+
+def main() -> None:
+
+    open_data()
 
     global CURRENT_DATE_STR, LATEST_DATE_STR, LOGGED_IN_SID
-    students = {}
-    student_path = home_path() / STUDENT_FILE
-    for line in student_path.read_text(encoding="utf-8").splitlines():
-        if not line.strip():
-            continue
-        parts = line.split("/")
-        if len(parts) != 3:
-            continue
-        sid, pw, _ = parts
-        students[sid] = pw
+    students = {sid: student.password for sid, student in STORE.students.items()}
     # 1) 6.1 — 날짜 입력
     CURRENT_DATE_STR = prompt_input_date()  # 내부 현재 날짜 확정
 
@@ -4082,6 +4860,8 @@ def main() -> None:
         sid = prompt_student_id()  # 6.2.1
         if not prompt_login_intent(sid):  # 6.2.2 (부정이면 학번 입력 재시작)
             continue
+        if STORE.sync():  # 공유 모드: 다른 단말기에서 가입한 학생 반영
+            students = {sid: student.password for sid, student in STORE.students.items()}
 
         if sid in students or sid == "admin":  # 기존 회원 → 6.2.3
             if sid == "admin":
@@ -4100,7 +4880,8 @@ def main() -> None:
             break
         else:
             # 신규 회원 → 6.2.4
-            prompt_password_new(home_path()/STUDENT_FILE, sid, students)
+            if not prompt_password_new(sid, students):
+                continue
             LOGGED_IN_SID = sid
             info(f"회원가입되었습니다. {LOGGED_IN_SID} 님 환영합니다.")
             break
@@ -4111,6 +4892,13 @@ def main() -> None:
     else:
         main_prompt_loop()
 
+if INSTRUMENT_MODE == "on":
+    install_instrumentation()
+if PROFILE_MODE == "on":
+    install_profiling()
+if MEMORY_PROFILE_MODE == "on":
+    install_memory_profiling()
+
 if __name__ == "__main__":
     try:
         main()
@@ -0,0 +1,248 @@
+"""
+시작/무결성 검사/메뉴 경로 벤치마크
+
+gen_dataset.py로 크기를 늘려 가며 데이터를 만들고, 각 데이터에서 프로그램 시작(open_data),
+전체 무결성 검사와 사용자/관리자 메뉴 경로를 프롬프트 없이(입력을 미리 정해 둔 값으로 대신해) 차례로 실행한다.
+동작마다 걸린 시간, 파일 읽기/쓰기 바이트 수, 최대 메모리 사용량을 재서 표로 출력하고 JSON으로 저장한다.
+  - 읽기/쓰기 바이트: /proc/self/io의 rchar/wchar 차이 (리눅스 전용, 다른 OS에서는 null)
+                      mmap으로 읽은 바이트(iter_record_lines)는 포함되지 않는다.
+  - 최대 메모리: tracemalloc으로 잰 동작 중 최대 할당량 - 동작 시작 시 할당량
+                 tracemalloc은 실행을 느리게 하므로 같은 데이터의 새 복사본으로 한 번 더 실행해 잰다.
+
+사용법:
+    python bench_menus.py [--schedules 1000,10000,100000] [--bookings-per-schedule 5]
+                          [--out bench-menus.json] [--baseline 이전 결과.json] [--no-memory]
+
+저장 모드 등은 환경 변수(KUCINEMA_STORAGE_MODE, KUCINEMA_VERIFY_MODE, KUCINEMA_SNAPSHOT)를 그대로 따른다.
+--baseline을 주면 이전 결과와 같은 크기·동작의 시간 비(이번/이전)를 함께 출력한다.
+"""
+from __future__ import annotations
+
+import argparse
+import builtins
+import contextlib
+import io
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date, timedelta
+from pathlib import Path
+
+import KUCinema as K
+import gen_dataset
+
+HERE = Path(__file__).resolve().parent
+CURRENT_DATE = "2026-01-01"
+STUDENT_ID = "00"
+BENCH_TITLE = "벤치마크 영화"
+
+
+class ScriptedInput:
+    """input()을 대신해 미리 정한 답을 차례로 돌려준다. (답이 모자라면 메뉴가 입력을 거부한 것이므로 오류)"""
+
+    def __init__(self):
+        self.answers: list[str] = []
+
+    def __call__(self, prompt: str = "") -> str:
+        if not self.answers:
+            raise RuntimeError(f"준비한 입력이 모자랍니다: {prompt!r}")
+        return self.answers.pop(0)
+
+
+INPUT = ScriptedInput()
+
+
+def io_counters() -> tuple[int, int] | None:
+    """지금까지 이 프로세스가 read/write로 읽고 쓴 바이트 수 (리눅스가 아니면 None)"""
+    try:
+        with open("/proc/self/io") as f:
+            fields = dict(line.split(": ") for line in f.read().splitlines())
+    except OSError:
+        return None
+    return int(fields["rchar"]), int(fields["wchar"])
+
+
+def operations(state: dict):
+    """
+    (동작 이름, 입력 목록을 돌려주는 함수, 실행할 함수) 목록
+    입력은 직전 동작 결과(state)에 따라 달라지므로 실행 직전에 만든다.
+    """
+    def startup():
+        K.STORE = None
+        K.open_data()
+        K.LATEST_DATE_STR = K.init_latest_date()
+
+    def select_date():
+        state["date"] = K.select_date()
+
+    def select_movie_answers():
+        # 빈 좌석이 있는 첫 상영을 고른다
+        movies = K.showtimes_on(state["date"])
+        full = (1 << K.SEAT_COUNT) - 1
+        return [str(next(i for i, m in enumerate(movies, start=1) if m["seats"] != full))]
+
+    def select_movie():
+        state["movie"] = K.select_movie(state["date"])
+
+    def finalize_booking():
+        movie = state["movie"]
+        free = K.vector_to_seats(~movie["seats"] & ((1 << K.SEAT_COUNT) - 1))
+        if not K.finalize_booking(movie, free[:2], STUDENT_ID):
+            raise RuntimeError("예매에 실패했습니다.")
+        K.verify_integrity()
+
+    def select_cancelation():
+        state["booking"] = K.select_cancelation(STUDENT_ID)
+
+    def confirm_cancelation():
+        K.confirm_cancelation(state["booking"])
+
+    def new_movie_id():
+        return [state.setdefault("movie_id", max(K.STORE.movies))]
+
+    def new_schedule_date():
+        # 데이터의 마지막 상영 날짜 다음 날 (일일 상영 수/시간 충돌에 걸리지 않음)
+        last = max(sch.movie_date for sch in K.STORE.schedules.values())
+        state["scd_date"] = (date.fromisoformat(last) + timedelta(days=1)).isoformat()
+        return ["0000", state["scd_date"], "10:00"]
+
+    def new_schedule_id():
+        return [state["scd_date"].replace("-", "") + "1000"]
+
+    return [
+        ("startup", lambda: [], startup),
+        ("verify_integrity", lambda: [], lambda: K.verify_integrity(full=True)),
+        ("select_date", lambda: ["1"], select_date),
+        ("select_movie", select_movie_answers, select_movie),
+        ("finalize_booking", lambda: [], finalize_booking),
+        ("menu2", lambda: [], K.menu2),
+        ("select_cancelation", lambda: ["1"], select_cancelation),
+        ("confirm_cancelation", lambda: ["Y", "0"], confirm_cancelation),  # 취소 후 다시 뜨는 목록에서 뒤로 가기
+        ("menu4", lambda: [], K.menu4),
+        ("admin_add_movie", lambda: [BENCH_TITLE, "100"], K.admin_menu1),
+        ("admin_modify_movie", lambda: new_movie_id() + ["2", "110"], K.admin_menu2),
+        ("admin_delete_movie", new_movie_id, K.admin_menu3),
+        ("admin_add_schedule", new_schedule_date, K.admin_menu4),
+        ("admin_modify_schedule", lambda: new_schedule_id() + ["2", "12:00"], K.admin_menu5),
+        ("admin_delete_schedule", lambda: [state["scd_date"].replace("-", "") + "1200"], K.admin_menu6),
+    ]
+
+
+def run_operations(data: Path, measure_memory: bool) -> dict[str, dict]:
+    """data의 복사본에서 동작들을 차례로 실행하고 동작별 측정값을 반환한다."""
+    work = Path(tempfile.mkdtemp(prefix="kucinema-bench-"))
+    for file_name in (K.MOVIE_FILE, K.SCHEDULE_FILE, K.STUDENT_FILE, K.BOOKING_FILE):
+        shutil.copy(data / file_name, work / file_name)
+    cwd = os.getcwd()
+    os.chdir(work)
+    K.CURRENT_DATE_STR = CURRENT_DATE
+    K.LOGGED_IN_SID = STUDENT_ID
+
+    results: dict[str, dict] = {}
+    state: dict = {}
+    if measure_memory:
+        tracemalloc.start()
+    try:
+        for name, answers, func in operations(state):
+            INPUT.answers = answers()
+            before_io = io_counters()
+            if measure_memory:
+                tracemalloc.reset_peak()
+                before_mem = tracemalloc.get_traced_memory()[0]
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                func()
+            elapsed = time.perf_counter() - start
+            after_io = io_counters()
+
+            result = {"seconds": elapsed}
+            if measure_memory:
+                result = {"peak_bytes": tracemalloc.get_traced_memory()[1] - before_mem}
+            elif before_io is not None:
+                result["read_bytes"] = after_io[0] - before_io[0]
+                result["write_bytes"] = after_io[1] - before_io[1]
+            if INPUT.answers:
+                raise RuntimeError(f"{name}: 쓰이지 않은 입력이 남았습니다: {INPUT.answers}")
+            results[name] = result
+    finally:
+        if measure_memory:
+            tracemalloc.stop()
+        K.STORE = None
+        os.chdir(cwd)
+        shutil.rmtree(work)
+    return results
+
+
+def git_revision() -> str | None:
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=HERE, capture_output=True, text=True)
+    except OSError:
+        return None
+    return out.stdout.strip() or None
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="KUCinema 메뉴 경로 벤치마크")
+    parser.add_argument("--schedules", default="1000,10000,100000", help="데이터 크기(상영 수) 목록")
+    parser.add_argument("--bookings-per-schedule", type=int, default=5)
+    parser.add_argument("--out", default="bench-menus.json", help="결과 JSON 파일")
+    parser.add_argument("--baseline", help="비교할 이전 결과 JSON 파일")
+    parser.add_argument("--no-memory", action="store_true", help="최대 메모리 측정(두 번째 실행)을 생략")
+    args = parser.parse_args()
+
+    baseline: dict[tuple[int, str], float] = {}
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            for dataset in json.load(f)["datasets"]:
+                for name, result in dataset["operations"].items():
+                    baseline[(dataset["schedules"], name)] = result["seconds"]
+
+    builtins.input = INPUT
+    report = {
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "modes": {"storage": K.STORAGE_MODE, "verify": K.VERIFY_MODE, "snapshot": K.SNAPSHOT_MODE},
+        "datasets": [],
+    }
+    for schedules in (int(n) for n in args.schedules.split(",")):
+        data = Path(tempfile.mkdtemp(prefix="kucinema-bench-data-"))
+        counts = gen_dataset.generate(
+            data, movies=min(max(schedules // 100, 20), gen_dataset.MAX_MOVIES), schedules=schedules,
+            students=gen_dataset.MAX_STUDENTS, bookings=schedules * args.bookings_per_schedule,
+            start_date=date.fromisoformat(CURRENT_DATE), seed=2025, cancel_ratio=0.1,
+        )
+        data_bytes = sum((data / file_name).stat().st_size for file_name in counts)
+        results = run_operations(data, measure_memory=False)
+        if not args.no_memory:
+            for name, result in run_operations(data, measure_memory=True).items():
+                results[name].update(result)
+        shutil.rmtree(data)
+        report["datasets"].append({"schedules": schedules, "records": counts, "data_bytes": data_bytes,
+                                   "operations": results})
+
+        print(f"\n상영 {schedules}개, 데이터 {data_bytes / 1e6:.1f}MB")
+        print(f"{'동작':<22} {'시간(ms)':>10} {'읽기(KB)':>10} {'쓰기(KB)':>10} {'최대 메모리(KB)':>15}"
+              + (f" {'이전 대비':>8}" if baseline else ""))
+        for name, r in results.items():
+            line = f"{name:<22} {r['seconds'] * 1000:>10.1f}"
+            for key, width in (("read_bytes", 10), ("write_bytes", 10), ("peak_bytes", 15)):
+                line += f" {r[key] / 1024:>{width}.0f}" if key in r else f" {'-':>{width}}"
+            if (schedules, name) in baseline:
+                line += f" {r['seconds'] / baseline[(schedules, name)]:>7.2f}x"
+            print(line)
+
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\n결과를 {args.out}에 저장했습니다.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,72 @@
+"""
+좌석 벡터 코덱 마이크로 벤치마크
+
+예전 방식(ast.literal_eval로 리스트를 만든 뒤 비트마스크로 변환 / 리스트를 join)과
+KUCinema.py의 seats_from_str / seats_to_str을 같은 입력으로 비교한다.
+
+사용법:
+    python bench_seat_codec.py [레코드 수 (기본 100000)]
+
+새 코덱이 예전 방식보다 느리거나 결과가 다르면 종료 코드 1로 끝난다.
+"""
+from __future__ import annotations
+
+import ast
+import random
+import sys
+import time
+
+from KUCinema import SEAT_COUNT, seats_from_list, seats_from_str, seats_to_list, seats_to_str
+
+
+def legacy_from_str(vector_str: str) -> int:
+    """예전 경로: ast.literal_eval로 리스트를 만든 뒤 비트마스크로 변환"""
+    return seats_from_list(ast.literal_eval(vector_str))
+
+
+def legacy_to_str(mask: int) -> str:
+    """예전 경로: 0/1 리스트를 만든 뒤 join"""
+    return "[" + ",".join(map(str, seats_to_list(mask))) + "]"
+
+
+def best_of(func, items, repeat: int = 3) -> float:
+    """items 전체에 func를 적용하는 시간을 repeat번 재서 가장 짧은 값(초)을 반환"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for item in items:
+            func(item)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> int:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    rng = random.Random(2025)
+    masks = [rng.getrandbits(SEAT_COUNT) for _ in range(n)]
+    strings = [legacy_to_str(m) for m in masks]
+
+    # 두 경로의 결과가 같은지 먼저 확인
+    for m, s in zip(masks, strings):
+        if seats_from_str(s) != m or legacy_from_str(s) != m or seats_to_str(m) != s:
+            print(f"불일치: {s} / {m}")
+            return 1
+
+    ok = True
+    print(f"레코드 {n}개, 3회 중 최솟값")
+    for label, legacy, fast, items in (
+        ("decode", legacy_from_str, seats_from_str, strings),
+        ("encode", legacy_to_str, seats_to_str, masks),
+    ):
+        t_legacy = best_of(legacy, items)
+        t_fast = best_of(fast, items)
+        print(
+            f"{label}: 예전 {t_legacy * 1e9 / n:8.0f} ns/건 | "
+            f"새 코덱 {t_fast * 1e9 / n:8.0f} ns/건 | {t_legacy / t_fast:5.1f}배"
+        )
+        ok = ok and t_fast < t_legacy
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
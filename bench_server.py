@@ -0,0 +1,138 @@
+"""
+예매 서버 동시 처리량 벤치마크
+
+kucinema_server.py를 유닉스 소켓으로 띄우고, 동시 클라이언트 수를 늘려 가며
+좌석 한 개짜리 예매 요청을 보내 초당 처리한 예매 수를 잰다.
+묶음 저장(기본)과 --no-group-commit(예매마다 저장)을 같은 입력으로 비교한다.
+
+사용법:
+    python bench_server.py [총 예매 수 (기본 600)] [동시 클라이언트 수 목록 (기본 1,2,4,8,16,32)]
+
+데이터는 저장소의 데이터 파일을 임시 디렉터리에 복사한 뒤 예매용 상영을 추가해 만든다.
+저장 모드 등은 환경 변수(KUCINEMA_STORAGE_MODE 등)를 그대로 서버에 넘긴다.
+모든 요청이 성공하지 않거나 결과 데이터가 무결성 검사를 통과하지 않으면 종료 코드 1로 끝난다.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import KUCinema as K
+
+HERE = Path(__file__).resolve().parent
+CURRENT_DATE = "2026-02-27"
+SHOW_TIMES = ("08:00", "13:00", "18:00")  # 러닝 타임 최댓값(240분)이어도 겹치지 않고 자정 전에 끝남
+
+
+def prepare_data(target: Path, total: int) -> list[tuple[str, str]]:
+    """
+    target에 데이터 파일을 만들고 예매할 (상영 고유 번호, 좌석) 목록을 반환한다.
+    상영은 CURRENT_DATE 다음 날부터 하루 세 편씩, 필요한 좌석 수만큼 추가한다.
+    """
+    for file_name in (K.MOVIE_FILE, K.SCHEDULE_FILE, K.STUDENT_FILE, K.BOOKING_FILE):
+        shutil.copy(HERE / file_name, target / file_name)
+    os.chdir(target)
+    K.CURRENT_DATE_STR = CURRENT_DATE
+    K.open_data()
+    movie_id = next(iter(K.STORE.movies))
+
+    seats: list[tuple[str, str]] = []
+    day = 1
+    while len(seats) < total:
+        scd_date = f"2026-03-{day:02d}" if day <= 31 else f"2026-04-{day - 31:02d}"
+        for scd_time in SHOW_TIMES:
+            scd_id = K.STORE.add_schedule(movie_id, scd_date, scd_time)
+            seats += [(scd_id, name) for name in K.vector_to_seats((1 << K.SEAT_COUNT) - 1)]
+        day += 1
+    K.verify_integrity(full=True)
+    return seats[:total]
+
+
+async def run_client(sock: str, requests: list[dict]) -> int:
+    """연결 하나로 요청을 차례로 보내고 성공한 요청 수를 반환한다."""
+    reader, writer = await asyncio.open_unix_connection(sock)
+    ok = 0
+    for request in requests:
+        writer.write(json.dumps(request).encode() + b"\n")
+        await writer.drain()
+        ok += json.loads(await reader.readline())["ok"]
+    writer.close()
+    await writer.wait_closed()
+    return ok
+
+
+async def run_clients(sock: str, per_client: list[list[dict]]) -> int:
+    return sum(await asyncio.gather(*(run_client(sock, requests) for requests in per_client)))
+
+
+def measure(base: Path, seats: list[tuple[str, str]], students: list[tuple[str, str]],
+            clients: int, group_commit: bool) -> tuple[float, bool]:
+    """준비한 데이터의 복사본으로 서버를 띄워 예매 처리량(건/초)과 무결성 검사 통과 여부를 반환한다."""
+    work = Path(tempfile.mkdtemp(prefix="kucinema-bench-"))
+    for file_name in (K.MOVIE_FILE, K.SCHEDULE_FILE, K.STUDENT_FILE, K.BOOKING_FILE):
+        shutil.copy(base / file_name, work / file_name)
+    sock = str(work / "server.sock")
+    command = [sys.executable, str(HERE / "kucinema_server.py"), "--date", CURRENT_DATE,
+               "--home", str(work), "--unix", sock]
+    if not group_commit:
+        command.append("--no-group-commit")
+    server = subprocess.Popen(command, stdout=subprocess.DEVNULL)
+    try:
+        while not os.path.exists(sock):
+            time.sleep(0.01)
+
+        # 클라이언트마다 서로 다른 좌석을 번갈아 배정 (같은 상영에 여러 클라이언트가 섞이도록)
+        per_client: list[list[dict]] = [[] for _ in range(clients)]
+        for i, (scd_id, seat) in enumerate(seats):
+            student_id, password = students[i % len(students)]
+            per_client[i % clients].append({"op": "book", "student_id": student_id, "password": password,
+                                            "schedule_id": scd_id, "seats": [seat]})
+        start = time.perf_counter()
+        ok = asyncio.run(run_clients(sock, per_client))
+        elapsed = time.perf_counter() - start
+    finally:
+        server.terminate()
+        server.wait()
+
+    check = subprocess.run(
+        [sys.executable, "-c", "import KUCinema as K; K.verify_integrity(full=True)"],
+        cwd=work, env=dict(os.environ, PYTHONPATH=str(HERE)), capture_output=True,
+    )
+    shutil.rmtree(work)
+    return ok / elapsed, ok == len(seats) and check.returncode == 0
+
+
+def main() -> int:
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 600
+    client_counts = [int(n) for n in sys.argv[2].split(",")] if len(sys.argv) > 2 else [1, 2, 4, 8, 16, 32]
+
+    base = Path(tempfile.mkdtemp(prefix="kucinema-bench-base-"))
+    seats = prepare_data(base, total)
+    random.Random(2025).shuffle(seats)
+    students = [(sid, student.password) for sid, student in K.STORE.students.items()]
+
+    mode = os.environ.get("KUCINEMA_STORAGE_MODE", "direct")
+    print(f"예매 {total}건, 저장 모드 {mode}, 초당 예매 수")
+    print(f"{'클라이언트':>10} | {'묶음 저장':>10} | {'예매마다 저장':>12}")
+    ok = True
+    for clients in client_counts:
+        grouped, ok_grouped = measure(base, seats, students, clients, group_commit=True)
+        single, ok_single = measure(base, seats, students, clients, group_commit=False)
+        print(f"{clients:>10} | {grouped:>10.0f} | {single:>12.0f}")
+        ok = ok and ok_grouped and ok_single
+    shutil.rmtree(base)
+    if not ok:
+        print("실패한 예매가 있거나 결과 데이터가 무결성 검사를 통과하지 않았습니다.")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
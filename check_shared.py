@@ -0,0 +1,136 @@
+"""
+공유 모드 회귀 검사
+
+KUCINEMA_SHARED=on으로 같은 데이터 디렉터리를 두 단말기(저장소 A, B)가 함께 쓰는 상황을
+한 프로세스 안에서 재현해, 잠금 안에서 다시 적재(sync)한 뒤의 쓰기가 올바른지 확인한다.
+  - 보관 후 취소: B가 지난 상영을 보관(archive_inactive)해 예매 줄 번호가 모두 바뀐 뒤
+                  A가 보관 전에 조회한 줄 번호로 취소해도 그 예매만 취소된다.
+  - 취소 후 취소: B가 먼저 취소한 예매를 A가 다시 취소하면 아무것도 쓰지 않는다. (False)
+  - 예매 충돌  : B가 먼저 예매한 좌석을 A가 예매하면 아무것도 쓰지 않는다. (None)
+각 시나리오 뒤에 새 저장소로 다시 적재해 결과를 확인하고 전체 무결성 검사를 한다.
+
+사용법:
+    python check_shared.py
+
+데이터는 gen_dataset.py로 임시 디렉터리에 만든다. 하나라도 실패하면 종료 코드 1로 끝난다.
+"""
+from __future__ import annotations
+
+import os
+import shutil
+import sys
+import tempfile
+from datetime import date
+from pathlib import Path
+
+import KUCinema as K
+import gen_dataset
+
+START_DATE = "2026-01-01"
+CURRENT_DATE = "2026-01-03"  # 이 날짜 전의 상영을 보관한다
+
+
+def fresh_data() -> Path:
+    """지난 상영(보관 대상)과 앞으로의 상영이 섞인 작은 데이터 디렉터리"""
+    home = Path(tempfile.mkdtemp(prefix="kucinema-shared-"))
+    gen_dataset.generate(home, movies=20, schedules=60, students=20, bookings=200,
+                         start_date=date.fromisoformat(START_DATE), seed=2025, cancel_ratio=0.1)
+    return home
+
+
+def open_stores(home: Path) -> tuple[K.DataStore, K.DataStore]:
+    stores = K.DataStore(home), K.DataStore(home)
+    for store in stores:
+        store.load()
+    return stores
+
+
+def reloaded(home: Path) -> K.DataStore:
+    """디스크의 데이터를 전체 검사한 뒤 새 저장소로 적재한다. (규칙 위반이면 검사가 종료 코드 1로 끝냄)"""
+    K.STORE = None
+    os.chdir(home)
+    K.verify_integrity(full=True)
+    store = K.DataStore(home)
+    store.load()
+    return store
+
+
+def booking_key(booking: K.Booking) -> tuple[str, str, int]:
+    return booking.student_id, booking.schedule_id, booking.seats
+
+
+def live_bookings(store: K.DataStore) -> set[tuple[str, str, int]]:
+    return {booking_key(booking) for booking in store.bookings.values()}
+
+
+def check_cancel_after_archive(home: Path) -> None:
+    a, b = open_stores(home)
+    before = live_bookings(a)
+    moved = b.archive_inactive(CURRENT_DATE)
+    assert moved.get(K.BOOKING_FILE), "보관된 예매가 없어 줄 번호가 바뀌지 않았습니다."
+
+    # A가 보관 전에 조회한 (보관되지 않는) 예매 중, 보관 후 그 줄 번호에 다른 예매가 온 것
+    # (예전 줄 번호로만 취소하면 그 다른 예매가 취소된다)
+    stale = [(row, booking_key(booking)) for row, booking in a.bookings.items()
+             if booking.schedule_id in b.schedules
+             and row in b.bookings and booking_key(b.bookings[row]) != booking_key(booking)]
+    assert stale, "보관 후 줄 번호가 바뀐 예매가 없습니다."
+    row, key = stale[-1]
+
+    assert a.cancel(*key, row), "보관 후 취소가 실패했습니다."
+    after = live_bookings(reloaded(home))
+    expected = {k for k in before if k[1] in b.schedules} - {key}
+    assert after == expected, f"다른 예매가 바뀌었습니다: 사라짐 {expected - after}, 남음 {after - expected}"
+
+
+def check_cancel_after_cancel(home: Path) -> None:
+    a, b = open_stores(home)
+    row, target = next(iter(a.bookings.items()))
+    key = booking_key(target)
+    assert b.cancel(*key, row), "B의 취소가 실패했습니다."
+    assert not a.cancel(*key, row), "이미 취소된 예매를 다시 취소했습니다."
+    assert key not in live_bookings(reloaded(home))
+
+
+def check_book_conflict(home: Path) -> None:
+    a, b = open_stores(home)
+    scd_id, sch = next((scd_id, sch) for scd_id, sch in a.schedules.items()
+                       if sch.seats_vector != (1 << K.SEAT_COUNT) - 1)
+    seat = next(1 << i for i in range(K.SEAT_COUNT) if not sch.seats_vector >> i & 1)
+    student_id = next(iter(a.students))
+    assert b.book(student_id, scd_id, seat) is not None, "B의 예매가 실패했습니다."
+    assert a.book(student_id, scd_id, seat) is None, "이미 예매된 좌석을 다시 예매했습니다."
+    store = reloaded(home)
+    assert len(store.bookings_of_schedule(scd_id)) == len(b.bookings_of_schedule(scd_id))
+
+
+CHECKS = [
+    ("보관 후 취소", check_cancel_after_archive),
+    ("취소 후 취소", check_cancel_after_cancel),
+    ("예매 충돌", check_book_conflict),
+]
+
+
+def main() -> int:
+    K.SHARED_MODE = "on"
+    K.CURRENT_DATE_STR = CURRENT_DATE
+    cwd = os.getcwd()
+    failed = 0
+    for name, check in CHECKS:
+        home = fresh_data()
+        try:
+            check(home)
+        except AssertionError as e:
+            failed += 1
+            print(f"실패 {name}: {e}")
+        else:
+            print(f"통과 {name}")
+        finally:
+            K.STORE = None
+            os.chdir(cwd)
+            shutil.rmtree(home)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
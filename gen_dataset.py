@@ -0,0 +1,198 @@
+"""
+규칙을 만족하는 대용량 합성 데이터 생성기
+
+영화/상영/학생/예매 데이터 파일 네 개를 원하는 크기로 만든다.
+만든 파일은 KUCinema.py의 모든 형식 검사(is_valid_*_line)와 의미 규칙 검사(check_*)를 통과한다.
+  - 영화: 고유 번호 0000부터 차례로, 제목 중복 없음, 러닝 타임 MIN_RUNNING_TIME~MAX_RUNNING_TIME
+  - 상영: 시작 날짜부터 하루에 최대 9편(10편 미만), 앞 상영이 끝난 뒤에 시작, 자정 전에 끝남,
+          고유 번호 오름차순, 좌석 벡터 = 그 상영 유효 예매 좌석의 OR
+  - 학생: 학번 00~99 (2자리라 최대 100명)
+  - 예매: 한 번에 1~4석, 같은 상영 안에서 좌석이 겹치지 않음, 타임 스탬프 순서로 기록
+          --cancel-ratio 비율만큼 취소(F)된 예매 레코드도 섞는다.
+같은 인자와 시드로는 항상 같은 파일이 만들어지므로 시작/메뉴 지연 시간 측정의 고정 입력으로 쓸 수 있다.
+레코드의 타임 스탬프는 모두 시작 날짜 이전(최근 TIMESTAMP_SPAN_DAYS일)이므로 시작 날짜를 현재 날짜로 입력하면 된다.
+
+사용법:
+    python gen_dataset.py 출력 디렉터리 [--movies 1000] [--schedules 100000] [--students 100]
+                          [--bookings 1000000] [--start-date 2026-01-01] [--seed 2025]
+                          [--cancel-ratio 0.1] [--check]
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+import KUCinema as K
+
+MAX_DAILY_SCHEDULES = 9     # check_daily_schedule_limit: 하루 상영 10개 미만
+MIN_RUNNING_TIME = 60
+MAX_RUNNING_TIME = 150      # 9편 x (150분 + 쉬는 시간)이 하루(1440분)에 들어가도록
+BREAK_MINUTES = 10          # 앞 상영 종료 후 다음 상영 시작까지 (10분 단위로 올림)
+MAX_STUDENTS = 100          # 학번은 2자리
+MAX_MOVIES = 10000          # 영화 고유 번호는 4자리
+TIMESTAMP_SPAN_DAYS = 30    # 타임 스탬프는 시작 날짜 이전 이 기간 안에서 고른다
+
+TITLE_WORDS = (
+    "겨울", "여름", "바다", "우주", "도시", "사막", "숲", "별", "달", "바람",
+    "Blue", "Red", "Night", "Dream", "Storm", "Shadow", "Light", "River", "Stone", "Echo",
+)
+TITLE_NOUNS = (
+    "왕국", "전쟁", "여행", "비밀", "기억", "모험", "약속", "노래", "탐정", "정원",
+    "Hero", "Quest", "Legacy", "Empire", "Runner", "Garden", "Signal", "Voyage", "Island", "Code",
+)
+
+
+def movie_titles(count: int) -> list[str]:
+    """서로 다른 영화 제목 count개 (단어 조합이 모자라면 뒤에 번호를 붙임)"""
+    base = [f"{w} {n}" for w in TITLE_WORDS for n in TITLE_NOUNS]
+    return [base[i % len(base)] + (f" {i // len(base) + 1}" if i >= len(base) else "") for i in range(count)]
+
+
+def generate(out: Path, movies: int, schedules: int, students: int, bookings: int,
+             start_date: date, seed: int, cancel_ratio: float) -> dict[str, int]:
+    """
+    out 디렉터리에 데이터 파일 네 개를 만든다.
+
+    반환값:
+        파일 이름 → 기록한 레코드 수
+    """
+    if not 1 <= movies <= MAX_MOVIES:
+        raise ValueError(f"영화 수는 1~{MAX_MOVIES}이어야 합니다.")
+    if not 1 <= students <= MAX_STUDENTS:
+        raise ValueError(f"학생 수는 1~{MAX_STUDENTS}이어야 합니다.")
+    if schedules < 1:
+        raise ValueError("상영 수는 1 이상이어야 합니다.")
+    if bookings > schedules * K.SEAT_COUNT:
+        raise ValueError(f"예매 수는 상영 수 x {K.SEAT_COUNT}(좌석 수)를 넘을 수 없습니다.")
+
+    rng = random.Random(seed)
+
+    def timestamp(latest: date) -> str:
+        """시작 날짜 이전 TIMESTAMP_SPAN_DAYS일 안에서 latest보다 늦지 않은 날짜"""
+        first = start_date - timedelta(days=TIMESTAMP_SPAN_DAYS)
+        span = (min(latest, start_date) - first).days
+        return (first + timedelta(days=rng.randint(0, max(span, 0)))).isoformat()
+
+    # 1. 영화
+    running_times = [rng.randint(MIN_RUNNING_TIME, MAX_RUNNING_TIME) for _ in range(movies)]
+    movie_stamps = [timestamp(start_date) for _ in range(movies)]
+    movie_lines = [
+        f"{i:04d}/{title}/{running_times[i]}/T/{movie_stamps[i]}"
+        for i, title in enumerate(movie_titles(movies))
+    ]
+
+    # 2. 상영 (날짜순, 하루 안에서는 시간순 → 고유 번호 오름차순)
+    #    (고유 번호, 영화 고유 번호, 날짜, 시작 시간, 타임 스탬프)
+    screenings: list[tuple[str, str, str, str, str]] = []
+    day = start_date
+    while len(screenings) < schedules:
+        start = rng.randrange(0, 6 * 60, 10)  # 첫 상영은 0시~6시 사이
+        for _ in range(MAX_DAILY_SCHEDULES):
+            movie_idx = rng.randrange(movies)
+            end = start + running_times[movie_idx]
+            if end >= 24 * 60 or len(screenings) == schedules:
+                break
+            movie_date, movie_time = day.isoformat(), f"{start // 60:02d}:{start % 60:02d}"
+            screenings.append((
+                day.strftime("%Y%m%d") + movie_time.replace(":", ""), f"{movie_idx:04d}",
+                movie_date, movie_time, max(movie_stamps[movie_idx], timestamp(day)),
+            ))
+            start = -(-(end + BREAK_MINUTES) // 10) * 10  # 10분 단위로 올림 (종료 시각 < 다음 시작)
+        day += timedelta(days=1)
+
+    # 3. 학생
+    student_ids = [f"{i:02d}" for i in range(students)]
+    student_lines = [f"{sid}/{rng.randint(0, 9999):04d}/{timestamp(start_date)}" for sid in student_ids]
+
+    # 4. 예매: 상영마다 정해진 수의 예매에 빈 좌석을 1~4석씩 나눠 준다
+    per_schedule, extra = divmod(bookings, schedules)
+    booking_records: list[tuple[str, str]] = []  # (타임 스탬프, 레코드)
+    seat_vectors: list[int] = []
+    for idx, (scd_id, _, _, _, scd_stamp) in enumerate(screenings):
+        count = per_schedule + (idx < extra)
+        free = list(range(K.SEAT_COUNT))
+        rng.shuffle(free)
+        vector = 0
+        for remaining in range(count, 0, -1):
+            # 남은 예매가 한 좌석씩은 받을 수 있도록 남겨 둔다
+            size = rng.randint(1, min(4, len(free) - (remaining - 1)))
+            seats = 0
+            for _ in range(size):
+                seats |= 1 << free.pop()
+            vector |= seats
+            stamp = max(scd_stamp, timestamp(start_date))
+            booking_records.append((stamp, f"{rng.choice(student_ids)}/{scd_id}/{K.seats_to_str(seats)}/T/{stamp}"))
+        seat_vectors.append(vector)
+
+    # 취소된 예매: 좌석 벡터에 반영되지 않는 F 레코드
+    for _ in range(int(bookings * cancel_ratio)):
+        scd_id, *_, scd_stamp = screenings[rng.randrange(len(screenings))]
+        seats = 0
+        for seat in rng.sample(range(K.SEAT_COUNT), rng.randint(1, 4)):
+            seats |= 1 << seat
+        stamp = max(scd_stamp, timestamp(start_date))
+        booking_records.append((stamp, f"{rng.choice(student_ids)}/{scd_id}/{K.seats_to_str(seats)}/F/{stamp}"))
+
+    # 예매 파일은 예매한 순서(타임 스탬프순)로 기록되므로 섞은 뒤 타임 스탬프로 안정 정렬한다
+    rng.shuffle(booking_records)
+    booking_records.sort(key=lambda record: record[0])
+
+    schedule_lines = [
+        f"{scd_id}/{movie_id}/{movie_date}/{movie_time}/{K.seats_to_str(vector)}/T/{stamp}"
+        for (scd_id, movie_id, movie_date, movie_time, stamp), vector in zip(screenings, seat_vectors)
+    ]
+
+    out.mkdir(parents=True, exist_ok=True)
+    contents = {
+        K.MOVIE_FILE: movie_lines,
+        K.SCHEDULE_FILE: schedule_lines,
+        K.STUDENT_FILE: student_lines,
+        K.BOOKING_FILE: [line for _, line in booking_records],
+    }
+    for file_name, lines in contents.items():
+        with open(out / file_name, "w", encoding="utf-8", newline="\n") as f:
+            f.writelines(line + "\n" for line in lines)
+    return {file_name: len(lines) for file_name, lines in contents.items()}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="KUCinema 합성 데이터 생성기")
+    parser.add_argument("out", help="데이터 파일을 만들 디렉터리 (같은 이름의 파일은 덮어씀)")
+    parser.add_argument("--movies", type=int, default=1000)
+    parser.add_argument("--schedules", type=int, default=100000)
+    parser.add_argument("--students", type=int, default=MAX_STUDENTS)
+    parser.add_argument("--bookings", type=int, default=1000000, help="유효(T) 예매 수")
+    parser.add_argument("--start-date", default="2026-01-01", help="첫 상영 날짜 (YYYY-MM-DD)")
+    parser.add_argument("--seed", type=int, default=2025)
+    parser.add_argument("--cancel-ratio", type=float, default=0.1, help="유효 예매 수 대비 취소(F) 예매 비율")
+    parser.add_argument("--check", action="store_true", help="만든 뒤 전체 무결성 검사를 수행")
+    args = parser.parse_args()
+
+    out = Path(args.out)
+    start = time.perf_counter()
+    try:
+        counts = generate(out, args.movies, args.schedules, args.students, args.bookings,
+                          date.fromisoformat(args.start_date), args.seed, args.cancel_ratio)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 2
+    for file_name, count in counts.items():
+        print(f"{file_name}: {count}줄, {(out / file_name).stat().st_size}바이트")
+    print(f"생성 {time.perf_counter() - start:.1f}초")
+
+    if args.check:
+        os.chdir(out)
+        K.CURRENT_DATE_STR = args.start_date
+        start = time.perf_counter()
+        K.verify_integrity(full=True)  # 규칙 위반이면 오류 메시지를 출력하고 종료 코드 1로 끝난다
+        print(f"전체 무결성 검사 통과 {time.perf_counter() - start:.1f}초")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,220 @@
+"""
+KUCinema 스크립트 모드 (비대화형)
+
+거래 스크립트를 파일이나 표준 입력에서 읽어 프롬프트 없이 차례로 실행한다.
+하루치 예매/취소를 한꺼번에 재현하는 부하 시험이나 야간 일괄 반영에 쓴다.
+대화형 KUCinema.py와 같은 데이터 파일, 같은 규칙(날짜, 로그인, 인원 수, 좌석)을 쓰고,
+데이터를 고칠 때마다 같은 증분 무결성 검사를 한다.
+
+사용법:
+    python kucinema_script.py [스크립트 파일 | - (표준 입력, 기본값)] [--home 데이터 디렉터리] [--stop-on-error]
+
+스크립트 형식: 한 줄에 명령 하나, '#' 뒤는 주석, 빈 줄은 무시
+    date YYYY-MM-DD                 내부 현재 날짜 설정 (첫 명령, 이후 다시 쓰면 이전보다 같거나 뒤여야 함)
+    login <학번> <비밀번호>          로그인 (없는 학번이면 그 비밀번호로 가입)
+    logout
+    dates                           예매 가능한 날짜
+    showtimes <날짜>                그 날짜의 상영 시간표
+    seats <상영 고유 번호>           예매된 좌석
+    book <상영 고유 번호> <좌석>...   예매 (menu1과 같은 인원 수/좌석 규칙, 최대 4명)
+    cancel <상영 고유 번호>          로그인한 학생의 그 상영 예매를 모두 취소
+    history                         로그인한 학생의 예매 내역
+    schedule                        현재 날짜 이후의 전체 상영 시간표
+
+출력: 명령마다 한 줄 "OK <줄 번호> <명령> <결과>" 또는 "ERR <줄 번호> <명령> <사유>"
+      끝나면 표준 오류에 실행/실패 명령 수와 걸린 시간을 출력한다. (실패가 있으면 종료 코드 1)
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+
+import KUCinema as K
+
+
+class ScriptError(Exception):
+    """ERR 줄로 출력할 명령 오류"""
+
+
+def _args(args: list[str], count: int, usage: str) -> list[str]:
+    if len(args) != count:
+        raise ScriptError(f"사용법: {usage}")
+    return args
+
+
+def _logged_in() -> str:
+    if K.LOGGED_IN_SID is None:
+        raise ScriptError("로그인 정보가 없습니다.")
+    return K.LOGGED_IN_SID
+
+
+def cmd_date(args: list[str]) -> str:
+    (current_date,) = _args(args, 1, "date YYYY-MM-DD")
+    reason = K.validate_current_date(current_date)
+    if reason is None and K.CURRENT_DATE_STR is not None and current_date < K.CURRENT_DATE_STR:
+        reason = "현재 날짜보다 이전 날짜입니다."
+    if reason is not None:
+        raise ScriptError(reason)
+    K.CURRENT_DATE_STR = current_date
+    return current_date
+
+
+def cmd_login(args: list[str]) -> str:
+    student_id, password = _args(args, 2, "login <학번> <비밀번호>")
+    if not K.RE_STUDENT_ID.fullmatch(student_id) or not K.RE_PASSWORD.fullmatch(password):
+        raise ScriptError("학번 또는 비밀번호의 형식이 올바르지 않습니다.")
+    student = K.STORE.students.get(student_id)
+    if student is None:
+        if not K.STORE.add_student(student_id, password):
+            raise ScriptError("이미 가입된 학번입니다.")
+        K.verify_integrity()
+        K.LOGGED_IN_SID = student_id
+        return f"{student_id} 가입"
+    if student.password != password:
+        raise ScriptError("비밀번호가 올바르지 않습니다.")
+    K.LOGGED_IN_SID = student_id
+    return student_id
+
+
+def cmd_logout(args: list[str]) -> str:
+    _args(args, 0, "logout")
+    K.LOGGED_IN_SID = None
+    return ""
+
+
+def cmd_dates(args: list[str]) -> str:
+    _args(args, 0, "dates")
+    return " ".join(K.bookable_dates())
+
+
+def cmd_showtimes(args: list[str]) -> str:
+    (selected_date,) = _args(args, 1, "showtimes <날짜>")
+    return " ; ".join(f"{m['id']} {m['time']} {m['title']}" for m in K.showtimes_on(selected_date))
+
+
+def cmd_seats(args: list[str]) -> str:
+    (scd_id,) = _args(args, 1, "seats <상영 고유 번호>")
+    sch = K.STORE.schedules.get(scd_id)
+    if sch is None:
+        raise ScriptError("존재하지 않는 상영입니다.")
+    return " ".join(K.vector_to_seats(sch.seats_vector))
+
+
+def cmd_book(args: list[str]) -> str:
+    if len(args) < 2:
+        raise ScriptError("사용법: book <상영 고유 번호> <좌석>...")
+    student_id = _logged_in()
+    scd_id, seats = args[0], [seat.upper() for seat in args[1:]]
+    if not K.is_bookable_schedule(K.STORE.schedules.get(scd_id)):
+        raise ScriptError("예매할 수 없는 상영입니다.")
+    reason = K.validate_seat_names(seats)
+    if reason is not None:
+        raise ScriptError(reason)
+    if K.STORE.book(student_id, scd_id, K.seats_to_vector(seats)) is None:
+        raise ScriptError("이미 예매된 좌석입니다.")
+    K.verify_integrity()
+    return f"{scd_id} {' '.join(seats)}"
+
+
+def cmd_cancel(args: list[str]) -> str:
+    (scd_id,) = _args(args, 1, "cancel <상영 고유 번호>")
+    student_id = _logged_in()
+    if not K.is_bookable_schedule(K.STORE.schedules.get(scd_id)):
+        raise ScriptError("취소할 수 없는 상영입니다.")
+    bookings = [(row, booking.seats) for row, booking in K.STORE.bookings_of_student(student_id)
+                if booking.schedule_id == scd_id]
+    if not bookings:
+        raise ScriptError("예매 내역이 존재하지 않습니다.")
+    # 취소할 때마다 잠금 안에서 다시 적재하므로 줄 번호가 아니라 (학번, 상영, 좌석)으로 확인한다
+    cancelled = sum(K.STORE.cancel(student_id, scd_id, seats, row) for row, seats in bookings)
+    K.verify_integrity()
+    return f"{scd_id} {cancelled}건"
+
+
+def cmd_history(args: list[str]) -> str:
+    _args(args, 0, "history")
+    history = sorted(K.booking_history(_logged_in()), key=lambda b: (b["date"], b["time"]))
+    return " ; ".join(f"{b['scd_id']} {' '.join(b['seats'])}" for b in history)
+
+
+def cmd_schedule(args: list[str]) -> str:
+    _args(args, 0, "schedule")
+    schedules = sorted(
+        (sch for sch in K.STORE.schedules.values() if sch.movie_date >= K.CURRENT_DATE_STR),
+        key=lambda sch: sch.schedule_id,
+    )
+    return " ; ".join(f"{sch.schedule_id} {K.STORE.movies[sch.movie_id].movie_name}" for sch in schedules)
+
+
+COMMANDS = {
+    "date": cmd_date,
+    "login": cmd_login,
+    "logout": cmd_logout,
+    "dates": cmd_dates,
+    "showtimes": cmd_showtimes,
+    "seats": cmd_seats,
+    "book": cmd_book,
+    "cancel": cmd_cancel,
+    "history": cmd_history,
+    "schedule": cmd_schedule,
+}
+
+
+def run_script(lines, out=sys.stdout, stop_on_error: bool = False) -> tuple[int, int]:
+    """
+    스크립트 줄들을 실행하고 (실행한 명령 수, 실패한 명령 수)를 반환한다.
+    데이터(K.STORE)는 미리 적재되어 있어야 한다. (open_data)
+    """
+    executed = failed = 0
+    for lineno, raw in enumerate(lines, start=1):
+        words = raw.split("#", 1)[0].split()
+        if not words:
+            continue
+        name, args = words[0], words[1:]
+        executed += 1
+        try:
+            command = COMMANDS.get(name)
+            if command is None:
+                raise ScriptError("알 수 없는 명령입니다.")
+            if name != "date" and K.CURRENT_DATE_STR is None:
+                raise ScriptError("먼저 date 명령으로 현재 날짜를 설정해야 합니다.")
+            K.STORE.sync()
+            result = command(args)
+        except ScriptError as e:
+            failed += 1
+            out.write(f"ERR {lineno} {name} {e}\n")
+            if stop_on_error:
+                break
+        else:
+            out.write(f"OK {lineno} {name} {result}".rstrip() + "\n")
+    return executed, failed
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="KUCinema 스크립트 모드")
+    parser.add_argument("script", nargs="?", default="-", help="거래 스크립트 파일 (- 이면 표준 입력)")
+    parser.add_argument("--home", help="데이터 파일 디렉터리 (기본값: 현재 디렉터리)")
+    parser.add_argument("--stop-on-error", action="store_true", help="명령이 실패하면 그 자리에서 멈춤")
+    args = parser.parse_args(argv)
+
+    if args.script == "-":
+        source = sys.stdin
+    else:
+        source = open(os.path.abspath(args.script), encoding="utf-8")
+    if args.home:
+        os.chdir(args.home)
+
+    start = time.perf_counter()
+    K.open_data()
+    K.LATEST_DATE_STR = K.init_latest_date()
+    with source:
+        executed, failed = run_script(source, stop_on_error=args.stop_on_error)
+    elapsed = time.perf_counter() - start
+    print(f"명령 {executed}개 실행, {failed}개 실패, {elapsed:.3f}초", file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,400 @@
+"""
+KUCinema 예매 서버 (헤드리스)
+
+데이터 파일을 한 번만 검사/적재한 프로세스 하나가 메모리의 저장소(KUCinema.STORE)로
+여러 클라이언트의 요청을 처리한다. 대화형 KUCinema.py와 같은 데이터 파일, 같은 예매 규칙을 쓴다.
+
+사용법:
+    python kucinema_server.py --date YYYY-MM-DD [--home 데이터 디렉터리]
+                              [--host 127.0.0.1] [--port 8765 | --unix 소켓 경로]
+
+프로토콜: 요청 한 줄(JSON) → 응답 한 줄(JSON), UTF-8
+    {"op": "list-dates"}
+    {"op": "list-showtimes", "date": "2025-12-12"}
+    {"op": "seat-map", "schedule_id": "202512120900"}
+    {"op": "book", "student_id": "00", "password": "1234", "schedule_id": "202512120900", "seats": ["A1", "A2"]}
+    {"op": "cancel", "student_id": "00", "password": "1234", "schedule_id": "202512120900", "seats": ["A1", "A2"],
+     "booking_id": 12}
+    {"op": "history", "student_id": "00", "password": "1234"}
+    {"op": "book-batch", "student_id": "admin", "password": "admin",
+     "bookings": [{"student_id": "00", "schedule_id": "202512120900", "seats": ["A1", "A2", ...]}, ...]}
+응답: {"ok": true, ...} 또는 {"ok": false, "error": "<사유>"} (book-batch는 "errors"에 항목별 사유)
+취소할 예매는 history 응답의 schedule_id/seats로 정한다. booking_id(예매 레코드 줄 번호)는
+다른 프로세스가 보관(archive)하면 다른 예매를 가리킬 수 있으므로 찾는 데만 쓰고 생략해도 된다.
+
+동시 예매: 예매는 해당 상영의 잠금(SCHEDULE_LOCKS)만 잡는다. 좌석 확인과 메모리 반영은
+이벤트 루프 안에서 한 번에 일어나므로 같은 상영의 좌석 충돌은 생기지 않고, 저장은 같은
+루프 차례에 들어온 다른 상영의 예매와 묶어 한 번에 한다. (group_commit, 저널 모드면 fsync 1회)
+응답은 저장이 끝난 뒤에 보낸다. --no-group-commit이면 예매마다 바로 저장한다.
+
+저장 실패: 데이터 파일에 쓰지 못하면(OSError) 메모리의 저장소를 디스크 내용으로 다시 적재하고
+그 저장을 기다리던 요청 모두에 오류로 응답한다. 다시 적재하지 못하거나 무결성 검사에 실패하면
+대화형 프로그램처럼 더 진행하지 않고 서버를 종료한다. (종료 코드 1)
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import signal
+import sys
+from collections import defaultdict
+from contextlib import contextmanager
+
+import KUCinema as K
+
+CLIENTS: set = set()  # 연결된 클라이언트의 (StreamWriter, 처리 태스크) — 종료 시 정리
+BUSY: set = set()     # 요청을 처리 중인 클라이언트의 StreamWriter — 종료 시 응답을 보낸 뒤 닫음
+SCHEDULE_LOCKS: dict = defaultdict(asyncio.Lock)  # 상영 고유 번호 → 그 상영의 예매를 순서대로 처리하는 잠금
+GROUP_COMMIT = True                   # False이면 예매마다 바로 저장 (--no-group-commit)
+PENDING_FLUSH: asyncio.Future | None = None  # 다음 묶음 저장을 기다리는 Future
+STOP: asyncio.Event | None = None     # 서버 종료 이벤트 (run_server에서 생성)
+EXIT_STATUS = 0                       # 저장/무결성 검사 실패로 종료하면 1
+
+
+class RequestError(Exception):
+    """클라이언트에 {"ok": false, "error": ...}로 돌려줄 요청 오류 (errors: 항목별 사유 목록)"""
+
+    def __init__(self, message: str, errors: list[str] | None = None) -> None:
+        super().__init__(message)
+        self.errors = errors
+
+
+def _require(request: dict, key: str) -> str:
+    value = request.get(key)
+    if not isinstance(value, str):
+        raise RequestError(f"{key} 값이 필요합니다.")
+    return value
+
+
+def _login(request: dict) -> str:
+    """student_id/password를 확인하고 학번을 반환한다."""
+    student_id = _require(request, "student_id")
+    student = K.STORE.students.get(student_id)
+    if student is None or student.password != _require(request, "password"):
+        raise RequestError("학번 또는 비밀번호가 올바르지 않습니다.")
+    return student_id
+
+
+def _seat_names(value, max_count: int | None = K.MAX_PEOPLE) -> list[str]:
+    """
+    좌석 이름 목록을 검사해 대문자로 바꿔 반환한다. (menu1/스크립트 모드처럼 "a1"도 받음)
+    규칙은 K.validate_seat_names, max_count가 None이면 단체 예매
+    """
+    if not isinstance(value, list):
+        raise RequestError("seats 목록이 필요합니다.")
+    seats = [seat.strip().upper() if isinstance(seat, str) else seat for seat in value]
+    reason = K.validate_seat_names(seats, max_count)
+    if reason is not None:
+        raise RequestError(reason)
+    return seats
+
+
+def _bookable_schedule(schedule_id: str) -> K.Schedule:
+    """예매 가능한(현재 날짜 이후의) 유효 상영을 반환한다."""
+    sch = K.STORE.schedules.get(schedule_id)
+    if not K.is_bookable_schedule(sch):
+        raise RequestError("예매할 수 없는 상영입니다.")
+    return sch
+
+
+def op_list_dates(request: dict) -> dict:
+    return {"dates": K.bookable_dates()}
+
+
+def op_list_showtimes(request: dict) -> dict:
+    selected_date = _require(request, "date")
+    if selected_date <= K.CURRENT_DATE_STR:
+        raise RequestError("예매할 수 없는 날짜입니다.")
+    return {"showtimes": [
+        {"schedule_id": m["id"], "title": m["title"], "date": m["date"], "time": m["time"],
+         "booked": K.vector_to_seats(m["seats"])}
+        for m in K.showtimes_on(selected_date)
+    ]}
+
+
+def op_seat_map(request: dict) -> dict:
+    sch = _bookable_schedule(_require(request, "schedule_id"))
+    return {"schedule_id": sch.schedule_id, "booked": K.vector_to_seats(sch.seats_vector)}
+
+
+def stop_server() -> None:
+    """더 진행할 수 없는 오류가 나면 서버를 종료 코드 1로 끝낸다. (처리 중인 요청에는 응답한 뒤)"""
+    global EXIT_STATUS
+    EXIT_STATUS = 1
+    if STOP is not None:
+        STOP.set()
+
+
+def _reload_store() -> None:
+    """저장에 실패한 뒤 메모리의 저장소를 디스크에 남은 내용으로 되돌린다. (실패하면 서버 종료)"""
+    try:
+        K.STORE.load()
+        K.verify_integrity(full=True)
+    except (OSError, SystemExit):
+        stop_server()
+
+
+@contextmanager
+def storing():
+    """
+    저장소를 고치고 무결성을 검사하는 구간. 오류는 클라이언트에 돌려줄 RequestError로 바꾼다.
+      - OSError(저장 실패): 디스크 내용으로 다시 적재한다. 같은 트랜잭션에 섞여 있던
+        미뤄 둔 예매도 함께 사라지므로 그 묶음 저장을 기다리던 예매들도 실패로 알린다.
+      - SystemExit(무결성 검사 실패, 오류 메시지는 이미 출력됨): 서버를 종료한다.
+    """
+    global PENDING_FLUSH
+    try:
+        yield
+    except OSError as e:
+        _reload_store()
+        error = RequestError(f"데이터 파일에 저장하지 못했습니다. ({e.strerror or e})")
+        if PENDING_FLUSH is not None:
+            PENDING_FLUSH.set_exception(error)
+            PENDING_FLUSH = None
+        raise error from e
+    except SystemExit:
+        stop_server()
+        raise RequestError("데이터 무결성 검사에 실패했습니다. 서버를 종료합니다.") from None
+
+
+def _flush() -> None:
+    """지금까지 미뤄 둔 예매를 한 번에 저장하고 검사한 뒤, 기다리던 예매들에 알린다."""
+    global PENDING_FLUSH
+    future, PENDING_FLUSH = PENDING_FLUSH, None
+    if future is None:  # 다른 저장이 실패하면서 이미 실패로 알린 묶음
+        return
+    try:
+        with storing():
+            K.STORE.flush()
+            K.verify_integrity()
+    except Exception as e:
+        future.set_exception(e)
+    else:
+        future.set_result(None)
+
+
+async def group_commit() -> None:
+    """
+    이번 이벤트 루프 차례에 쌓인 예매를 모아 한 번에 저장하고, 저장이 끝날 때까지 기다린다.
+    (이미 준비된 다른 요청들이 먼저 처리된 뒤 _flush가 실행되도록 call_soon으로 예약)
+    """
+    global PENDING_FLUSH
+    if PENDING_FLUSH is None:
+        loop = asyncio.get_running_loop()
+        PENDING_FLUSH = loop.create_future()
+        loop.call_soon(_flush)
+    await PENDING_FLUSH
+
+
+async def op_book(request: dict) -> dict:
+    student_id = _login(request)
+    sch = _bookable_schedule(_require(request, "schedule_id"))
+    seats = _seat_names(request.get("seats"))
+
+    async with SCHEDULE_LOCKS[sch.schedule_id]:
+        with storing():
+            booking = K.STORE.book(student_id, sch.schedule_id, K.seats_to_vector(seats), defer=GROUP_COMMIT)
+            if booking is not None and not GROUP_COMMIT:
+                K.verify_integrity()
+        if booking is None:
+            raise RequestError("이미 예매된 좌석입니다.")
+        if GROUP_COMMIT:
+            await group_commit()
+    return {"schedule_id": sch.schedule_id, "seats": seats}
+
+
+def op_book_batch(request: dict) -> dict:
+    """
+    단체/대량 예매 (관리자 전용). 모든 항목을 함께 검사하고 한 번에 저장한 뒤 무결성 검사도 한 번만 한다.
+    하나라도 문제가 있으면 아무것도 예매하지 않는다.
+    """
+    if request.get("student_id") != "admin" or request.get("password") != "admin":
+        raise RequestError("관리자 계정만 일괄 예매를 할 수 있습니다.")
+    items = request.get("bookings")
+    if not isinstance(items, list) or not items:
+        raise RequestError("bookings 목록이 필요합니다.")
+
+    entries: list[tuple[str, str, int]] = []
+    errors: list[str] = []
+    for i, item in enumerate(items, start=1):
+        try:
+            if not isinstance(item, dict):
+                raise RequestError("예매 항목은 JSON 객체여야 합니다.")
+            seats = _seat_names(item.get("seats"), max_count=None)
+            entries.append((_require(item, "student_id"), _require(item, "schedule_id"), K.seats_to_vector(seats)))
+        except RequestError as e:
+            errors.append(f"{i}: {e}")
+    if not errors:
+        with storing():
+            errors = K.STORE.book_batch(entries)
+            if not errors:
+                K.verify_integrity()
+    if errors:
+        raise RequestError("일괄 예매에 실패했습니다. 아무것도 예매하지 않았습니다.", errors)
+    return {"booked": len(entries)}
+
+
+def op_cancel(request: dict) -> dict:
+    student_id = _login(request)
+    scd_id = _require(request, "schedule_id")
+    seat_names = _seat_names(request.get("seats"), max_count=None)
+    seats = K.seats_to_vector(seat_names)
+    row = request.get("booking_id")
+    # JSON true/false도 파이썬에서는 int(bool)이므로 정수만 받는다
+    if type(row) is not int:
+        row = None
+    if K.STORE.find_booking(student_id, scd_id, seats) is None:
+        raise RequestError("예매 내역이 존재하지 않습니다.")
+    if not K.is_bookable_schedule(K.STORE.schedules.get(scd_id)):
+        raise RequestError("취소할 수 없는 예매입니다.")
+    # 잠금 안에서 다시 적재한 예매가 이 학생의 그 예매인지 확인하고 취소한다 (다른 프로세스의 보관/취소 대비)
+    with storing():
+        cancelled = K.STORE.cancel(student_id, scd_id, seats, row)
+        if cancelled:
+            K.verify_integrity()
+    if not cancelled:
+        raise RequestError("이미 취소된 예매입니다.")
+    return {"schedule_id": scd_id, "seats": seat_names}
+
+
+def op_history(request: dict) -> dict:
+    student_id = _login(request)
+    history = sorted(K.booking_history(student_id), key=lambda b: (b["date"], b["time"]))
+    return {"bookings": [
+        {"booking_id": b["row"], "schedule_id": b["scd_id"], "title": b["title"],
+         "date": b["date"], "time": b["time"], "seats": b["seats"]}
+        for b in history
+    ]}
+
+
+OPERATIONS = {
+    "list-dates": op_list_dates,
+    "list-showtimes": op_list_showtimes,
+    "seat-map": op_seat_map,
+    "book": op_book,
+    "cancel": op_cancel,
+    "history": op_history,
+    "book-batch": op_book_batch,
+}
+
+
+async def handle_request(line: bytes) -> dict:
+    """요청 한 줄을 처리해 응답 객체를 반환한다."""
+    try:
+        request = json.loads(line)
+        if not isinstance(request, dict):
+            raise RequestError("요청은 JSON 객체여야 합니다.")
+        operation = OPERATIONS.get(request.get("op"))
+        if operation is None:
+            raise RequestError("알 수 없는 op입니다.")
+        with storing():
+            K.STORE.sync()  # 공유 모드: 다른 단말기의 변경 반영
+        result = operation(request)
+        if asyncio.iscoroutine(result):
+            result = await result
+        return {"ok": True, **result}
+    except RequestError as e:
+        response = {"ok": False, "error": str(e)}
+        if e.errors is not None:
+            response["errors"] = e.errors
+        return response
+    except ValueError as e:
+        return {"ok": False, "error": str(e)}
+    except Exception as e:  # 예상하지 못한 오류로 연결 처리 태스크가 응답 없이 끝나지 않도록
+        return {"ok": False, "error": f"요청을 처리하지 못했습니다. ({type(e).__name__}: {e})"}
+
+
+async def serve_client(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    """연결 하나: 요청 한 줄마다 응답 한 줄 (연결이 끊길 때까지)"""
+    client = (writer, asyncio.current_task())
+    CLIENTS.add(client)
+    try:
+        while line := await reader.readline():
+            if not line.strip():
+                continue
+            BUSY.add(writer)
+            try:
+                response = await handle_request(line)
+                writer.write(json.dumps(response, ensure_ascii=False).encode("utf-8") + b"\n")
+                await writer.drain()
+            finally:
+                BUSY.discard(writer)
+            if STOP is not None and STOP.is_set():
+                break
+    except ConnectionError:
+        pass
+    finally:
+        CLIENTS.discard(client)
+        writer.close()
+
+
+async def run_server(args: argparse.Namespace) -> None:
+    global STOP
+    if args.unix:
+        server = await asyncio.start_unix_server(serve_client, path=args.unix)
+        where = args.unix
+    else:
+        server = await asyncio.start_server(serve_client, host=args.host, port=args.port)
+        where = f"{args.host}:{args.port}"
+    K.info(f"예매 서버를 시작합니다. ({where}, 현재 날짜 {K.CURRENT_DATE_STR})")
+
+    # SIGINT/SIGTERM을 받거나 stop_server가 불리면 종료 (atexit의 compact_store로 로그에만 있는 변경을 반영)
+    STOP = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, STOP.set)
+        except NotImplementedError:  # Windows
+            pass
+    async with server:
+        await STOP.wait()
+        # 요청을 기다리는 연결을 닫으면 그 처리 태스크는 EOF를 받고 스스로 끝난다
+        # (요청을 처리 중인 연결은 응답을 보낸 뒤 끝난다)
+        tasks = [task for _, task in CLIENTS]
+        for writer, _ in list(CLIENTS):
+            if writer not in BUSY:
+                writer.close()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="KUCinema 예매 서버")
+    parser.add_argument("--date", required=True, help="내부 현재 날짜 (YYYY-MM-DD, 최종 작업 날짜 이후)")
+    parser.add_argument("--home", help="데이터 파일 디렉터리 (기본값: 현재 디렉터리)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", help="TCP 대신 사용할 유닉스 소켓 경로")
+    parser.add_argument("--no-group-commit", action="store_true", help="예매를 묶지 않고 하나씩 저장")
+    return parser.parse_args(argv)
+
+
+def open_server_data(current_date: str) -> None:
+    """데이터를 적재하고 내부 현재 날짜를 설정한다. (날짜 규칙은 prompt_input_date와 동일)"""
+    K.open_data()
+    K.LATEST_DATE_STR = K.init_latest_date()
+    reason = K.validate_current_date(current_date)
+    if reason is not None:
+        K.error(reason)
+        sys.exit(1)
+    K.CURRENT_DATE_STR = current_date
+
+
+def main(argv: list[str] | None = None) -> None:
+    global GROUP_COMMIT
+    args = parse_args(argv)
+    GROUP_COMMIT = not args.no_group_commit
+    if args.home:
+        os.chdir(args.home)
+    open_server_data(args.date)
+    try:
+        asyncio.run(run_server(args))
+    except KeyboardInterrupt:
+        pass
+    K.info("예매 서버를 종료합니다.")
+    sys.exit(EXIT_STATUS)
+
+
+if __name__ == "__main__":
+    main()